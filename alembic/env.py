@@ -8,7 +8,7 @@ import sys
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from app.database import Base
-from app.models import user, client, ticket
+from app.models import tenant, user, client, ticket, report, idempotency, job, import_run, attachment
 from app.config import settings
 
 config = context.config
@@ -1,16 +1,42 @@
 from typing import Annotated
-from fastapi import Depends, HTTPException, status
+import uuid
+from fastapi import Depends, Header, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
 
+from app.config import settings
 from app.database import get_db
 from app.core.security import decode_access_token
+from app.core.tenancy import set_tenant
+from app.models.tenant import Tenant
 from app.models.user import User
+from app.core.queries import TENANT_BY_SLUG, USER_BY_EMAIL
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
 
 
+async def get_request_tenant(
+    db: Annotated[AsyncSession, Depends(get_db)],
+    x_tenant: Annotated[str | None, Header(max_length=63)] = None
+) -> Tenant:
+    """Tenant of an unauthenticated request, from the X-Tenant header.
+
+    Requests without the header belong to the DEFAULT_TENANT.
+    """
+    result = await db.execute(TENANT_BY_SLUG, {"slug": x_tenant or settings.DEFAULT_TENANT})
+    tenant = result.scalar_one_or_none()
+    
+    if tenant is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Unknown tenant"
+        )
+    
+    set_tenant(db, tenant.id)
+    
+    return tenant
+
+
 async def get_current_user(
     token: Annotated[str, Depends(oauth2_scheme)],
     db: Annotated[AsyncSession, Depends(get_db)]
@@ -29,7 +55,14 @@ async def get_current_user(
     if email is None:
         raise credentials_exception
     
-    result = await db.execute(select(User).where(User.email == email))
+    try:
+        tenant_id = uuid.UUID(payload.get("tenant"))
+    except (TypeError, ValueError):
+        raise credentials_exception
+    
+    set_tenant(db, tenant_id)
+    
+    result = await db.execute(USER_BY_EMAIL, {"tenant_id": tenant_id, "email": email})
     user = result.scalar_one_or_none()
     
     if user is None:
@@ -45,3 +78,4 @@ async def get_current_user(
 
 
 CurrentUser = Annotated[User, Depends(get_current_user)]
+RequestTenant = Annotated[Tenant, Depends(get_request_tenant)]
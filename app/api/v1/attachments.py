@@ -0,0 +1,129 @@
+from fastapi import APIRouter, Depends, Header, HTTPException, Request, Response, status, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select
+from typing import Annotated
+import uuid
+
+from app.database import get_db
+from app.models.attachment import Attachment
+from app.models.ticket import Ticket
+from app.models.user import User, UserRole
+from app.schemas.attachment import AttachmentResponse
+from app.api.deps import CurrentUser
+from app.core.attachments import store_attachment
+from app.core.deadlines import Deadline, DeadlineRoute
+from app.core.storage import storage
+
+router = APIRouter(route_class=DeadlineRoute)
+
+
+async def _get_ticket(db: AsyncSession, ticket_id: uuid.UUID, current_user: User) -> Ticket:
+    ticket = await db.get(Ticket, ticket_id)
+    
+    if not ticket:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Ticket not found"
+        )
+    
+    if current_user.role == UserRole.WORKER and ticket.assigned_to != current_user.id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Access denied"
+        )
+    
+    return ticket
+
+
+async def _get_attachment(
+    db: AsyncSession,
+    ticket_id: uuid.UUID,
+    attachment_id: uuid.UUID,
+    current_user: User
+) -> Attachment:
+    await _get_ticket(db, ticket_id, current_user)
+    attachment = await db.get(Attachment, attachment_id)
+    
+    if not attachment or attachment.ticket_id != ticket_id:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Attachment not found"
+        )
+    
+    return attachment
+
+
+@router.post(
+    "/{ticket_id}/attachments",
+    response_model=AttachmentResponse,
+    status_code=status.HTTP_201_CREATED,
+    dependencies=[Depends(Deadline(None))]
+)
+async def upload_attachment(
+    ticket_id: uuid.UUID,
+    request: Request,
+    current_user: CurrentUser,
+    db: Annotated[AsyncSession, Depends(get_db)],
+    filename: str = Query(..., min_length=1, max_length=255)
+):
+    ticket = await _get_ticket(db, ticket_id, current_user)
+    
+    return await store_attachment(db, ticket, request, filename, current_user.id)
+
+
+@router.get("/{ticket_id}/attachments", response_model=list[AttachmentResponse])
+async def list_attachments(
+    ticket_id: uuid.UUID,
+    current_user: CurrentUser,
+    db: Annotated[AsyncSession, Depends(get_db)]
+):
+    await _get_ticket(db, ticket_id, current_user)
+    
+    result = await db.execute(
+        select(Attachment)
+        .where(Attachment.ticket_id == ticket_id)
+        .order_by(Attachment.created_at)
+    )
+    
+    return result.scalars().all()
+
+
+# HEAD lets download managers learn the size and ETag before resuming.
+@router.api_route("/{ticket_id}/attachments/{attachment_id}", methods=["GET", "HEAD"])
+async def download_attachment(
+    ticket_id: uuid.UUID,
+    attachment_id: uuid.UUID,
+    current_user: CurrentUser,
+    db: Annotated[AsyncSession, Depends(get_db)],
+    range_header: Annotated[str | None, Header(alias="Range")] = None
+) -> Response:
+    attachment = await _get_attachment(db, ticket_id, attachment_id, current_user)
+    
+    return await storage.download(
+        attachment.storage_key,
+        attachment.filename,
+        attachment.content_type,
+        range_header
+    )
+
+
+@router.get("/{ticket_id}/attachments/{attachment_id}/thumbnail")
+async def download_thumbnail(
+    ticket_id: uuid.UUID,
+    attachment_id: uuid.UUID,
+    current_user: CurrentUser,
+    db: Annotated[AsyncSession, Depends(get_db)]
+) -> Response:
+    attachment = await _get_attachment(db, ticket_id, attachment_id, current_user)
+    
+    if not attachment.has_thumbnail:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Thumbnail not available"
+        )
+    
+    return await storage.download(
+        attachment.thumbnail_key,
+        f"{attachment.filename}.jpg",
+        "image/jpeg"
+    )
@@ -8,15 +8,18 @@ from typing import Annotated
 from app.database import get_db
 from app.models.user import User
 from app.schemas.auth import Token
+from app.api.deps import RequestTenant
+from app.core.deadlines import DeadlineRoute
 from app.core.security import verify_password, create_access_token
 from app.config import settings
 
-router = APIRouter()
+router = APIRouter(route_class=DeadlineRoute)
 
 
 @router.post("/login", response_model=Token)
 async def login(
     form_data: Annotated[OAuth2PasswordRequestForm, Depends()],
+    tenant: RequestTenant,
     db: Annotated[AsyncSession, Depends(get_db)]
 ):
     result = await db.execute(
@@ -39,7 +42,7 @@ async def login(
     
     access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     access_token = create_access_token(
-        data={"sub": user.email, "role": user.role.value},
+        data={"sub": user.email, "role": user.role.value, "tenant": str(tenant.id)},
         expires_delta=access_token_expires
     )
     
@@ -0,0 +1,148 @@
+from fastapi import APIRouter, Depends, HTTPException, status, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, func, or_
+from typing import Annotated
+import uuid
+
+from app.config import settings
+from app.database import get_db
+from app.models.client import Client
+from app.schemas.client import ClientResponse, ClientSummary
+from app.api.deps import CurrentUser
+from app.core.deadlines import DeadlineRoute
+from app.core.permissions import check_admin_permission
+from app.utils.pagination import paginate, PaginatedResponse
+from app.utils.prefix_cache import PrefixCache
+
+router = APIRouter(route_class=DeadlineRoute)
+
+autocomplete_cache: PrefixCache[ClientSummary] = PrefixCache(
+    settings.CLIENT_AUTOCOMPLETE_CACHE_SIZE,
+    settings.CLIENT_AUTOCOMPLETE_CACHE_TTL
+)
+
+
+def _like_prefix(value: str) -> str:
+    escaped = value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"{escaped}%"
+
+
+def _matches_prefix(client: ClientSummary, prefix: str) -> bool:
+    return (
+        client.full_name.lower().startswith(prefix)
+        or client.email.lower().startswith(prefix)
+        or client.phone.startswith(prefix)
+    )
+
+
+@router.get("/", response_model=PaginatedResponse[ClientResponse])
+async def list_clients(
+    current_user: CurrentUser,
+    db: Annotated[AsyncSession, Depends(get_db)],
+    page: int = Query(1, ge=1),
+    page_size: int = Query(10, ge=1, le=100)
+):
+    check_admin_permission(current_user)
+    
+    query = select(Client).order_by(Client.created_at.desc())
+    items, total, total_pages = await paginate(db, query, page, page_size)
+    
+    return PaginatedResponse(
+        items=items,
+        total=total,
+        page=page,
+        page_size=page_size,
+        total_pages=total_pages
+    )
+
+
+@router.get("/lookup", response_model=ClientResponse)
+async def lookup_client(
+    current_user: CurrentUser,
+    db: Annotated[AsyncSession, Depends(get_db)],
+    email: str | None = Query(None),
+    phone: str | None = Query(None)
+):
+    check_admin_permission(current_user)
+    
+    if email:
+        query = select(Client).where(Client.email == email)
+    elif phone:
+        query = select(Client).where(Client.phone == phone)
+    else:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Either email or phone is required"
+        )
+    
+    result = await db.execute(query.order_by(Client.created_at).limit(1))
+    client = result.scalar_one_or_none()
+    
+    if not client:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Client not found"
+        )
+    
+    return client
+
+
+@router.get("/autocomplete", response_model=list[ClientSummary])
+async def autocomplete_clients(
+    current_user: CurrentUser,
+    db: Annotated[AsyncSession, Depends(get_db)],
+    q: str = Query(..., min_length=2, max_length=100),
+    limit: int = Query(10, ge=1, le=50)
+):
+    check_admin_permission(current_user)
+    
+    # Checked after stripping: a blank prefix would match every client.
+    prefix = q.strip().lower()
+    if len(prefix) < 2:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="Search text must have at least 2 characters"
+        )
+    
+    cached = autocomplete_cache.get(prefix, limit, _matches_prefix, current_user.tenant_id)
+    if cached is not None:
+        return cached
+    
+    pattern = _like_prefix(prefix)
+    result = await db.execute(
+        select(Client.id, Client.full_name, Client.email, Client.phone)
+        .where(
+            or_(
+                func.lower(Client.full_name).like(pattern, escape="\\"),
+                func.lower(Client.email).like(pattern, escape="\\"),
+                Client.phone.like(pattern, escape="\\")
+            )
+        )
+        .order_by(func.lower(Client.full_name))
+        .limit(limit)
+    )
+    items = [ClientSummary.model_validate(row, from_attributes=True) for row in result]
+    
+    autocomplete_cache.put(prefix, limit, items, current_user.tenant_id)
+    
+    return items
+
+
+@router.get("/{client_id}", response_model=ClientResponse)
+async def get_client(
+    client_id: uuid.UUID,
+    current_user: CurrentUser,
+    db: Annotated[AsyncSession, Depends(get_db)]
+):
+    check_admin_permission(current_user)
+    
+    result = await db.execute(select(Client).where(Client.id == client_id))
+    client = result.scalar_one_or_none()
+    
+    if not client:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Client not found"
+        )
+    
+    return client
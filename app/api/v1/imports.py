@@ -0,0 +1,96 @@
+from fastapi import APIRouter, Depends, HTTPException, Request, status, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Annotated, Literal
+import uuid
+
+from app.database import get_db
+from app.models.import_run import ImportRun, ImportStatus
+from app.schemas.import_run import ImportRunResponse
+from app.api.deps import CurrentUser
+from app.core.deadlines import Deadline, DeadlineRoute
+from app.core.permissions import check_admin_permission
+from app.core.importer import IMPORT_TICKETS, upload_key, error_key
+from app.core.jobs import enqueue
+from app.core.storage import storage
+
+router = APIRouter(route_class=DeadlineRoute)
+
+
+async def _get_import(db: AsyncSession, import_id: uuid.UUID) -> ImportRun:
+    run = await db.get(ImportRun, import_id)
+    
+    if not run:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Import not found"
+        )
+    
+    return run
+
+
+@router.post(
+    "/",
+    response_model=ImportRunResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    dependencies=[Depends(Deadline(None))]
+)
+async def create_import(
+    request: Request,
+    current_user: CurrentUser,
+    db: Annotated[AsyncSession, Depends(get_db)],
+    format: Literal["csv", "jsonl"] = Query("csv")
+):
+    check_admin_permission(current_user)
+    
+    run = ImportRun(id=uuid.uuid4(), format=format, created_by=current_user.id)
+    
+    # Stream the body to the shared storage without holding a pooled
+    # connection; the import itself runs as a background job.
+    await db.commit()
+    await storage.save(
+        upload_key(current_user.tenant_id, run.id),
+        request.stream(),
+        "application/octet-stream"
+    )
+    
+    db.add(run)
+    await enqueue(db, IMPORT_TICKETS, {"import_id": str(run.id)})
+    await db.commit()
+    await db.refresh(run)
+    
+    return run
+
+
+@router.get("/{import_id}", response_model=ImportRunResponse)
+async def get_import(
+    import_id: uuid.UUID,
+    current_user: CurrentUser,
+    db: Annotated[AsyncSession, Depends(get_db)]
+):
+    check_admin_permission(current_user)
+    
+    return await _get_import(db, import_id)
+
+
+@router.get("/{import_id}/errors")
+async def get_import_errors(
+    import_id: uuid.UUID,
+    current_user: CurrentUser,
+    db: Annotated[AsyncSession, Depends(get_db)]
+):
+    check_admin_permission(current_user)
+    
+    run = await _get_import(db, import_id)
+    
+    # Rejected rows are counted as they are written to the error file.
+    if run.status not in (ImportStatus.DONE, ImportStatus.FAILED) or not run.rows_failed:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="No error file for this import"
+        )
+    
+    return await storage.download(
+        error_key(run.tenant_id, run.id),
+        f"import-{run.id}-errors.csv",
+        "text/csv"
+    )
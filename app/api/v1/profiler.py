@@ -0,0 +1,55 @@
+from fastapi import APIRouter, Depends, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Annotated
+
+from app.database import get_db
+from app.schemas.profiler import ProfilerConfigUpdate, ProfilerStatus
+from app.api.deps import CurrentUser
+from app.core.deadlines import DeadlineRoute
+from app.core.permissions import check_admin_permission, check_operator_permission
+from app.core.profiler import CHANNEL, sql_profiler
+from app.core.pubsub import publish
+from app.models.user import User
+
+router = APIRouter(route_class=DeadlineRoute)
+
+
+# Slow queries are recorded per tenant; admins only see their own.
+def _status(current_user: User) -> dict:
+    return {**sql_profiler.config(), "slow_queries": sql_profiler.entries(current_user.tenant_id)}
+
+
+@router.get("/", response_model=ProfilerStatus)
+async def get_profiler(current_user: CurrentUser):
+    check_admin_permission(current_user)
+    
+    return _status(current_user)
+
+
+@router.put("/", response_model=ProfilerStatus)
+async def update_profiler(
+    config: ProfilerConfigUpdate,
+    current_user: CurrentUser,
+    db: Annotated[AsyncSession, Depends(get_db)]
+):
+    # The settings apply to every tenant's queries, so only the operator
+    # may change them.
+    await check_operator_permission(db, current_user)
+    
+    payload = config.model_dump_json(exclude_none=True)
+    
+    # Apply to every worker process, this one included.
+    await publish(db, CHANNEL, payload)
+    await db.commit()
+    sql_profiler.apply_config(payload)
+    
+    return _status(current_user)
+
+
+@router.delete("/slow-queries", status_code=status.HTTP_204_NO_CONTENT)
+async def clear_slow_queries(current_user: CurrentUser):
+    check_admin_permission(current_user)
+    
+    sql_profiler.clear(current_user.tenant_id)
+    
+    return None
@@ -1,27 +1,80 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from typing import Annotated
+from datetime import datetime, timedelta
+import uuid
 
+from app.config import settings
 from app.database import get_db
 from app.models.client import Client
-from app.models.ticket import Ticket
+from app.models.ticket import Ticket, TicketStatus
+from app.schemas.attachment import AttachmentResponse
 from app.schemas.ticket import TicketCreate, TicketResponse
+from app.api.deps import RequestTenant
+from app.core.attachments import store_attachment
+from app.core.deadlines import Deadline, DeadlineRoute
+from app.core.cache import (
+    notify_invalidation,
+    ticket_scopes,
+    tickets_scope
+)
+from app.core.idempotency import run_idempotent
+from app.core.tenancy import current_tenant
+from app.core.queries import OPEN_CLIENT_TICKETS
+from app.utils.fingerprint import same_phone, similarity, ticket_fingerprint, ticket_trigrams
 
-router = APIRouter()
+router = APIRouter(route_class=DeadlineRoute)
+
+# Open tickets of the client compared with a new request.
+DUPLICATE_CANDIDATES = 20
 
 
 @router.post("/repair-requests", response_model=TicketResponse, status_code=status.HTTP_201_CREATED)
 async def create_repair_request(
     ticket_data: TicketCreate,
-    db: Annotated[AsyncSession, Depends(get_db)]
+    tenant: RequestTenant,
+    response: Response,
+    db: Annotated[AsyncSession, Depends(get_db)],
+    idempotency_key: Annotated[str | None, Header(max_length=255)] = None
 ):
+    return await run_idempotent(
+        db,
+        idempotency_key,
+        f"public:{tenant.id}:repair-requests",
+        ticket_data.model_dump(mode="json"),
+        response,
+        lambda: _create_repair_request(ticket_data, response, db),
+        lambda ticket: TicketResponse.model_validate(ticket).model_dump(mode="json"),
+        default_status=status.HTTP_201_CREATED
+    )
+
+
+def _most_similar(ticket_data: TicketCreate, fingerprint: str, candidates: list[Ticket]) -> Ticket | None:
+    trigrams = ticket_trigrams(ticket_data.title, ticket_data.description)
+    best, best_score = None, settings.DUPLICATE_SIMILARITY
+    for candidate in candidates:
+        if candidate.fingerprint == fingerprint:
+            return candidate
+        score = similarity(trigrams, ticket_trigrams(candidate.title, candidate.description))
+        if score >= best_score:
+            best, best_score = candidate, score
+    return best
+
+
+async def _create_repair_request(
+    ticket_data: TicketCreate,
+    response: Response,
+    db: AsyncSession
+) -> Ticket:
     result = await db.execute(
         select(Client).where(Client.email == ticket_data.client_email)
     )
     client = result.scalar_one_or_none()
     
-    if not client:
+    fingerprint = ticket_fingerprint(ticket_data.title, ticket_data.description)
+    
+    if client is None:
         client = Client(
             full_name=ticket_data.client_full_name,
             email=ticket_data.client_email,
@@ -30,15 +83,76 @@ async def create_repair_request(
         )
         db.add(client)
         await db.flush()
+    # Only a caller who also knows the client's phone number is shown their
+    # existing ticket; anyone else just files a new one.
+    elif same_phone(client.phone, ticket_data.client_phone):
+        result = await db.execute(
+            OPEN_CLIENT_TICKETS,
+            {
+                "client_id": client.id,
+                "since": datetime.utcnow() - timedelta(hours=settings.DUPLICATE_WINDOW_HOURS),
+                "limit": DUPLICATE_CANDIDATES
+            }
+        )
+        duplicate = _most_similar(ticket_data, fingerprint, result.scalars().all())
+        
+        if duplicate:
+            duplicate.duplicate_count += 1
+            duplicate.last_duplicate_at = datetime.utcnow()
+            
+            scopes = ticket_scopes(duplicate.tenant_id, duplicate.id, duplicate.assigned_to)
+            await notify_invalidation(db, scopes)
+            await db.flush()
+            await db.refresh(duplicate)
+            
+            response.status_code = status.HTTP_200_OK
+            return duplicate
     
     ticket = Ticket(
         title=ticket_data.title,
         description=ticket_data.description,
-        client_id=client.id
+        client_id=client.id,
+        fingerprint=fingerprint
     )
     
     db.add(ticket)
-    await db.commit()
+    
+    scope = tickets_scope(current_tenant(db))
+    await notify_invalidation(db, [scope])
+    await db.flush()
     await db.refresh(ticket)
     
     return ticket
+
+
+@router.post(
+    "/repair-requests/{ticket_id}/attachments",
+    response_model=AttachmentResponse,
+    status_code=status.HTTP_201_CREATED,
+    dependencies=[Depends(Deadline(settings.PUBLIC_UPLOAD_TIMEOUT))]
+)
+async def upload_repair_request_attachment(
+    ticket_id: uuid.UUID,
+    request: Request,
+    tenant: RequestTenant,
+    db: Annotated[AsyncSession, Depends(get_db)],
+    filename: str = Query(..., min_length=1, max_length=255)
+):
+    ticket = await db.get(Ticket, ticket_id)
+    
+    # Customers may add photos until the request has been picked up.
+    if not ticket or ticket.status != TicketStatus.NEW:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Repair request not found"
+        )
+    
+    # Anyone can upload here, so uploads are smaller and must finish in time.
+    return await store_attachment(
+        db,
+        ticket,
+        request,
+        filename,
+        None,
+        max_bytes=settings.PUBLIC_ATTACHMENT_MAX_BYTES
+    )
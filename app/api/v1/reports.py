@@ -0,0 +1,108 @@
+import csv
+import io
+from datetime import date, datetime, timedelta
+from fastapi import APIRouter, Depends, HTTPException, Response, status, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Annotated, Literal
+
+from app.database import get_db
+from app.schemas.report import TicketSeriesPoint, WorkerSummary
+from app.api.deps import CurrentUser
+from app.core.deadlines import Deadline, DeadlineRoute
+from app.core.permissions import check_admin_permission
+from app.core.reports import refresh_rollup, ticket_series, worker_summary
+
+router = APIRouter(route_class=DeadlineRoute)
+
+
+def _date_range(start: date | None, end: date | None) -> tuple[date, date]:
+    end = end or datetime.utcnow().date()
+    start = start or end - timedelta(days=29)
+    
+    if start > end:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="start must not be after end"
+        )
+    
+    return start, end
+
+
+def _csv_response(rows: list[dict], fields: list[str], filename: str) -> Response:
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=fields, extrasaction="ignore")
+    writer.writeheader()
+    writer.writerows(rows)
+    
+    return Response(
+        content=buffer.getvalue(),
+        media_type="text/csv",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
+
+
+@router.get("/tickets", response_model=list[TicketSeriesPoint])
+async def ticket_report(
+    current_user: CurrentUser,
+    db: Annotated[AsyncSession, Depends(get_db)],
+    start: date | None = Query(None),
+    end: date | None = Query(None),
+    interval: Literal["day", "week"] = Query("day"),
+    format: Literal["json", "csv"] = Query("json")
+):
+    check_admin_permission(current_user)
+    
+    start, end = _date_range(start, end)
+    rows = await ticket_series(db, start, end, interval)
+    
+    if format == "csv":
+        return _csv_response(
+            rows,
+            list(TicketSeriesPoint.model_fields),
+            f"tickets_{interval}_{start}_{end}.csv"
+        )
+    
+    return rows
+
+
+@router.get("/workers", response_model=list[WorkerSummary])
+async def worker_report(
+    current_user: CurrentUser,
+    db: Annotated[AsyncSession, Depends(get_db)],
+    start: date | None = Query(None),
+    end: date | None = Query(None),
+    format: Literal["json", "csv"] = Query("json")
+):
+    check_admin_permission(current_user)
+    
+    start, end = _date_range(start, end)
+    rows = await worker_summary(db, start, end)
+    
+    if format == "csv":
+        return _csv_response(
+            rows,
+            list(WorkerSummary.model_fields),
+            f"workers_{start}_{end}.csv"
+        )
+    
+    return rows
+
+
+@router.post("/refresh", dependencies=[Depends(Deadline(300, statement_timeout_ms=0))])
+async def refresh_report(
+    current_user: CurrentUser,
+    db: Annotated[AsyncSession, Depends(get_db)],
+    full: bool = Query(False)
+):
+    check_admin_permission(current_user)
+    
+    # Admins manage their own tenant; the periodic refresh covers all.
+    refreshed_from = await refresh_rollup(db, full=full, tenant_id=current_user.tenant_id)
+    
+    if refreshed_from is None:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="A refresh is already running"
+        )
+    
+    return {"refreshed_from": refreshed_from}
@@ -1,9 +1,9 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, Header, HTTPException, Response, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, or_
-from sqlalchemy.orm import selectinload
+from sqlalchemy import select
 from typing import Annotated
 from datetime import datetime
+import time
 import uuid
 
 from app.database import get_db
@@ -13,13 +13,72 @@ from app.schemas.ticket import (
     TicketResponse,
     TicketDetailResponse,
     TicketAssign,
-    TicketUpdateStatus
+    TicketUpdateStatus,
+    TicketUpdatePriority,
+    TicketSyncResponse
 )
+from app.schemas.batch import BatchGetRequest, BatchGetResponse, BatchItem
 from app.api.deps import CurrentUser
+from app.core.deadlines import DeadlineRoute
 from app.core.permissions import check_admin_permission
-from app.utils.pagination import paginate, PaginatedResponse
+from app.core.cache import (
+    response_cache,
+    notify_invalidation,
+    ticket_scope,
+    ticket_scopes,
+    tickets_scope,
+    worker_scope
+)
+from app.core.idempotency import run_idempotent
+from app.core.notifications import notify_client
+from app.core.sync import (
+    NO_REMOVALS,
+    START,
+    ExpiredSyncToken,
+    InvalidSyncToken,
+    decode_token,
+    encode_token
+)
+from app.core.queries import (
+    TICKET_BY_ID,
+    TICKETS_BY_IDS,
+    NEXT_CLAIMABLE_TICKET,
+    WORKER_CHANGES,
+    ticket_count_query,
+    ticket_page_query,
+    ticket_list_params
+)
+from app.utils.pagination import paginate_prepared, PaginatedResponse
+
+router = APIRouter(route_class=DeadlineRoute)
+
 
-router = APIRouter()
+def _ticket_detail(ticket: Ticket) -> dict:
+    return {
+        "id": ticket.id,
+        "title": ticket.title,
+        "description": ticket.description,
+        "status": ticket.status,
+        "priority": ticket.priority,
+        "due_at": ticket.due_at,
+        "client_id": ticket.client_id,
+        "assigned_to": ticket.assigned_to,
+        "created_at": ticket.created_at,
+        "updated_at": ticket.updated_at,
+        "completed_at": ticket.completed_at,
+        "duplicate_count": ticket.duplicate_count,
+        "client": {
+            "id": ticket.client.id,
+            "full_name": ticket.client.full_name,
+            "email": ticket.client.email,
+            "phone": ticket.client.phone,
+        },
+        "assigned_user": {
+            "id": ticket.assigned_user.id,
+            "full_name": ticket.assigned_user.full_name,
+            "email": ticket.assigned_user.email,
+        } if ticket.assigned_user else None
+    }
 
 
 @router.get("/", response_model=PaginatedResponse[TicketDetailResponse])
@@ -31,57 +90,175 @@ async def list_tickets(
     status: TicketStatus | None = Query(None),
     search: str | None = Query(None)
 ):
-    query = select(Ticket).options(
-        selectinload(Ticket.client),
-        selectinload(Ticket.assigned_user)
+    worker_id = current_user.id if current_user.role == UserRole.WORKER else None
+    tenant_id = current_user.tenant_id
+    scope = worker_scope(tenant_id, worker_id) if worker_id else tickets_scope(tenant_id)
+    cache_key = ("list", page, page_size, status, search)
+    
+    cached = response_cache.get(scope, cache_key)
+    if cached is not None:
+        return cached
+    
+    generation = response_cache.generation()
+    key, params = ticket_list_params(worker_id, status, search)
+    
+    items, total, total_pages = await paginate_prepared(
+        db,
+        ticket_count_query(*key),
+        ticket_page_query(*key),
+        params,
+        page,
+        page_size
     )
     
-    if current_user.role == UserRole.WORKER:
-        query = query.where(Ticket.assigned_to == current_user.id)
-    
-    if status:
-        query = query.where(Ticket.status == status)
-    
-    if search:
-        query = query.where(Ticket.title.ilike(f"%{search}%"))
-    
-    query = query.order_by(Ticket.created_at.desc())
-    
-    items, total, total_pages = await paginate(db, query, page, page_size)
-    
-    formatted_items = []
-    for ticket in items:
-        ticket_dict = {
-            "id": ticket.id,
-            "title": ticket.title,
-            "description": ticket.description,
-            "status": ticket.status,
-            "client_id": ticket.client_id,
-            "assigned_to": ticket.assigned_to,
-            "created_at": ticket.created_at,
-            "updated_at": ticket.updated_at,
-            "completed_at": ticket.completed_at,
-            "client": {
-                "id": ticket.client.id,
-                "full_name": ticket.client.full_name,
-                "email": ticket.client.email,
-                "phone": ticket.client.phone,
-            },
-            "assigned_user": {
-                "id": ticket.assigned_user.id,
-                "full_name": ticket.assigned_user.full_name,
-                "email": ticket.assigned_user.email,
-            } if ticket.assigned_user else None
-        }
-        formatted_items.append(ticket_dict)
+    formatted_items = [_ticket_detail(ticket) for ticket in items]
     
-    return PaginatedResponse(
+    response = PaginatedResponse(
         items=formatted_items,
         total=total,
         page=page,
         page_size=page_size,
         total_pages=total_pages
     )
+    response_cache.set(scope, cache_key, response, generation)
+    
+    return response
+
+
+@router.get("/sync", response_model=TicketSyncResponse)
+async def sync_tickets(
+    current_user: CurrentUser,
+    db: Annotated[AsyncSession, Depends(get_db)],
+    sync_token: str | None = Query(None, max_length=100),
+    limit: int = Query(200, ge=1, le=500)
+):
+    if current_user.role != UserRole.WORKER:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Only workers can sync tickets"
+        )
+    
+    try:
+        token = decode_token(sync_token) if sync_token else None
+    except ExpiredSyncToken:
+        raise HTTPException(
+            status_code=status.HTTP_410_GONE,
+            detail="Sync token expired, sync again without a token"
+        )
+    except InvalidSyncToken:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid sync token"
+        )
+    
+    if token is None:
+        # A device without tickets has nothing to remove.
+        resume_from, cursor, removed_since = None, START, NO_REMOVALS
+        issued_at = int(time.time())
+    else:
+        resume_from, cursor, removed_since, issued_at = token
+        if resume_from is None:
+            issued_at = int(time.time())
+    
+    result = await db.execute(
+        WORKER_CHANGES,
+        {
+            "tenant_id": current_user.tenant_id,
+            "worker_id": current_user.id,
+            "after_version": cursor[0],
+            "after_id": cursor[1],
+            "removed_since": removed_since,
+            "limit": limit + 1
+        }
+    )
+    rows = result.all()
+    changes = [row for row in rows if row.ticket_id is not None]
+    has_more = len(changes) > limit
+    changes = changes[:limit]
+    
+    if resume_from is None:
+        resume_from = rows[0].xmin
+        if token is None:
+            removed_since = resume_from
+    
+    if has_more:
+        last = changes[-1]
+        next_token = encode_token(
+            resume_from,
+            issued_at,
+            (last.sync_version, last.ticket_id),
+            removed_since
+        )
+    else:
+        next_token = encode_token(resume_from, issued_at)
+    
+    changed_ids = [row.ticket_id for row in changes if not row.removed]
+    tickets = {}
+    if changed_ids:
+        result = await db.execute(TICKETS_BY_IDS, {"ticket_ids": changed_ids})
+        tickets = {ticket.id: ticket for ticket in result.scalars()}
+    
+    # A ticket reassigned since the first query is removed by the next sync.
+    return {
+        "changed": [
+            _ticket_detail(tickets[ticket_id])
+            for ticket_id in changed_ids
+            if ticket_id in tickets and tickets[ticket_id].assigned_to == current_user.id
+        ],
+        "removed": [row.ticket_id for row in changes if row.removed],
+        "sync_token": next_token,
+        "has_more": has_more
+    }
+
+
+@router.post("/batch", response_model=BatchGetResponse[TicketDetailResponse])
+async def batch_get_tickets(
+    batch: BatchGetRequest,
+    current_user: CurrentUser,
+    db: Annotated[AsyncSession, Depends(get_db)]
+):
+    ticket_ids = list(dict.fromkeys(batch.ids))
+    tenant_id = current_user.tenant_id
+    
+    # Cached details are reused; the rest are loaded together, so a batch
+    # costs at most three queries however many ids it has.
+    details = {}
+    uncached = []
+    for ticket_id in ticket_ids:
+        ticket_dict = response_cache.get(ticket_scope(tenant_id, ticket_id), "detail")
+        if ticket_dict is None:
+            uncached.append(ticket_id)
+        else:
+            details[ticket_id] = ticket_dict
+    
+    if uncached:
+        generation = response_cache.generation()
+        result = await db.execute(TICKETS_BY_IDS, {"ticket_ids": uncached})
+        for ticket in result.scalars():
+            ticket_dict = _ticket_detail(ticket)
+            response_cache.set(ticket_scope(tenant_id, ticket.id), "detail", ticket_dict, generation)
+            details[ticket.id] = ticket_dict
+    
+    items = []
+    for ticket_id in ticket_ids:
+        ticket_dict = details.get(ticket_id)
+        if ticket_dict is None:
+            item = BatchItem(
+                id=ticket_id,
+                status=status.HTTP_404_NOT_FOUND,
+                detail="Ticket not found"
+            )
+        elif current_user.role == UserRole.WORKER and ticket_dict["assigned_to"] != current_user.id:
+            item = BatchItem(
+                id=ticket_id,
+                status=status.HTTP_403_FORBIDDEN,
+                detail="Access denied"
+            )
+        else:
+            item = BatchItem(id=ticket_id, status=status.HTTP_200_OK, data=ticket_dict)
+        items.append(item)
+    
+    return BatchGetResponse(items=items)
 
 
 @router.get("/{ticket_id}", response_model=TicketDetailResponse)
@@ -90,47 +267,30 @@ async def get_ticket(
     current_user: CurrentUser,
     db: Annotated[AsyncSession, Depends(get_db)]
 ):
-    result = await db.execute(
-        select(Ticket)
-        .options(selectinload(Ticket.client), selectinload(Ticket.assigned_user))
-        .where(Ticket.id == ticket_id)
-    )
-    ticket = result.scalar_one_or_none()
+    scope = ticket_scope(current_user.tenant_id, ticket_id)
     
-    if not ticket:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Ticket not found"
-        )
+    ticket_dict = response_cache.get(scope, "detail")
+    if ticket_dict is None:
+        generation = response_cache.generation()
+        result = await db.execute(TICKET_BY_ID, {"ticket_id": ticket_id})
+        ticket = result.scalar_one_or_none()
+        
+        if not ticket:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Ticket not found"
+            )
+        
+        ticket_dict = _ticket_detail(ticket)
+        response_cache.set(scope, "detail", ticket_dict, generation)
     
-    if current_user.role == UserRole.WORKER and ticket.assigned_to != current_user.id:
+    if current_user.role == UserRole.WORKER and ticket_dict["assigned_to"] != current_user.id:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Access denied"
         )
     
-    return {
-        "id": ticket.id,
-        "title": ticket.title,
-        "description": ticket.description,
-        "status": ticket.status,
-        "client_id": ticket.client_id,
-        "assigned_to": ticket.assigned_to,
-        "created_at": ticket.created_at,
-        "updated_at": ticket.updated_at,
-        "completed_at": ticket.completed_at,
-        "client": {
-            "id": ticket.client.id,
-            "full_name": ticket.client.full_name,
-            "email": ticket.client.email,
-            "phone": ticket.client.phone,
-        },
-        "assigned_user": {
-            "id": ticket.assigned_user.id,
-            "full_name": ticket.assigned_user.full_name,
-            "email": ticket.assigned_user.email,
-        } if ticket.assigned_user else None
-    }
+    return ticket_dict
 
 
 @router.post("/{ticket_id}/assign", response_model=TicketResponse)
@@ -138,10 +298,28 @@ async def assign_ticket(
     ticket_id: uuid.UUID,
     assign_data: TicketAssign,
     current_user: CurrentUser,
-    db: Annotated[AsyncSession, Depends(get_db)]
+    response: Response,
+    db: Annotated[AsyncSession, Depends(get_db)],
+    idempotency_key: Annotated[str | None, Header(max_length=255)] = None
 ):
     check_admin_permission(current_user)
     
+    return await run_idempotent(
+        db,
+        idempotency_key,
+        f"tickets:{ticket_id}:assign:{current_user.id}",
+        assign_data.model_dump(mode="json"),
+        response,
+        lambda: _assign_ticket(ticket_id, assign_data, db),
+        lambda ticket: TicketResponse.model_validate(ticket).model_dump(mode="json")
+    )
+
+
+async def _assign_ticket(
+    ticket_id: uuid.UUID,
+    assign_data: TicketAssign,
+    db: AsyncSession
+) -> Ticket:
     worker_result = await db.execute(
         select(User).where(User.id == assign_data.assigned_to)
     )
@@ -153,8 +331,10 @@ async def assign_ticket(
             detail="Worker not found"
         )
     
+    # Locked so a concurrent claim or reassignment commits first and the
+    # previous assignee seen here (and given a removal) is the current one.
     ticket_result = await db.execute(
-        select(Ticket).where(Ticket.id == ticket_id)
+        select(Ticket).where(Ticket.id == ticket_id).with_for_update()
     )
     ticket = ticket_result.scalar_one_or_none()
     
@@ -164,9 +344,77 @@ async def assign_ticket(
             detail="Ticket not found"
         )
     
-    ticket.assigned_to = assign_data.assigned_to
+    return await _assign(db, ticket, assign_data.assigned_to)
+
+
+async def _assign(db: AsyncSession, ticket: Ticket, worker_id: uuid.UUID) -> Ticket:
+    scopes = ticket_scopes(
+        ticket.tenant_id,
+        ticket.id,
+        ticket.assigned_to,
+        worker_id
+    )
+    
+    ticket.assigned_to = worker_id
+    ticket.assigned_at = datetime.utcnow()
     ticket.status = TicketStatus.ASSIGNED
     
+    await notify_client(db, ticket, "assigned")
+    await notify_invalidation(db, scopes)
+    await db.flush()
+    await db.refresh(ticket)
+    
+    return ticket
+
+
+@router.post("/claim", response_model=TicketResponse)
+async def claim_ticket(
+    current_user: CurrentUser,
+    db: Annotated[AsyncSession, Depends(get_db)]
+):
+    if current_user.role != UserRole.WORKER:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Only workers can claim tickets"
+        )
+    
+    result = await db.execute(NEXT_CLAIMABLE_TICKET)
+    ticket = result.scalar_one_or_none()
+    
+    if not ticket:
+        return Response(status_code=status.HTTP_204_NO_CONTENT)
+    
+    ticket = await _assign(db, ticket, current_user.id)
+    await db.commit()
+    
+    return ticket
+
+
+@router.patch("/{ticket_id}/priority", response_model=TicketResponse)
+async def update_ticket_priority(
+    ticket_id: uuid.UUID,
+    priority_data: TicketUpdatePriority,
+    current_user: CurrentUser,
+    db: Annotated[AsyncSession, Depends(get_db)]
+):
+    check_admin_permission(current_user)
+    
+    result = await db.execute(
+        select(Ticket).where(Ticket.id == ticket_id).with_for_update()
+    )
+    ticket = result.scalar_one_or_none()
+    
+    if not ticket:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Ticket not found"
+        )
+    
+    ticket.priority = priority_data.priority
+    ticket.due_at = priority_data.due_at
+    
+    scopes = ticket_scopes(ticket.tenant_id, ticket.id, ticket.assigned_to)
+    await notify_invalidation(db, scopes)
     await db.commit()
     await db.refresh(ticket)
     
@@ -181,7 +429,7 @@ async def update_ticket_status(
     db: Annotated[AsyncSession, Depends(get_db)]
 ):
     result = await db.execute(
-        select(Ticket).where(Ticket.id == ticket_id)
+        select(Ticket).where(Ticket.id == ticket_id).with_for_update()
     )
     ticket = result.scalar_one_or_none()
     
@@ -203,6 +451,9 @@ async def update_ticket_status(
     if status_data.status == TicketStatus.DONE:
         ticket.completed_at = datetime.utcnow()
     
+    scopes = ticket_scopes(ticket.tenant_id, ticket.id, ticket.assigned_to)
+    await notify_client(db, ticket, status_data.status.value)
+    await notify_invalidation(db, scopes)
     await db.commit()
     await db.refresh(ticket)
     
@@ -7,12 +7,16 @@ import uuid
 from app.database import get_db
 from app.models.user import User
 from app.schemas.user import UserCreate, UserUpdate, UserResponse
+from app.schemas.batch import BatchGetRequest, BatchGetResponse, BatchItem
 from app.api.deps import CurrentUser
+from app.core.deadlines import DeadlineRoute
 from app.core.security import get_password_hash
 from app.core.permissions import check_admin_permission
+from app.core.cache import notify_invalidation, tenant_scope
+from app.core.queries import USERS_BY_IDS
 from app.utils.pagination import paginate, PaginatedResponse
 
-router = APIRouter()
+router = APIRouter(route_class=DeadlineRoute)
 
 
 @router.get("/", response_model=PaginatedResponse[UserResponse])
@@ -65,6 +69,38 @@ async def create_user(
     return user
 
 
+@router.post("/batch", response_model=BatchGetResponse[UserResponse])
+async def batch_get_users(
+    batch: BatchGetRequest,
+    current_user: CurrentUser,
+    db: Annotated[AsyncSession, Depends(get_db)]
+):
+    check_admin_permission(current_user)
+    
+    user_ids = list(dict.fromkeys(batch.ids))
+    result = await db.execute(USERS_BY_IDS, {"user_ids": user_ids})
+    users = {user.id: user for user in result.scalars()}
+    
+    items = []
+    for user_id in user_ids:
+        user = users.get(user_id)
+        if user is None:
+            item = BatchItem(
+                id=user_id,
+                status=status.HTTP_404_NOT_FOUND,
+                detail="User not found"
+            )
+        else:
+            item = BatchItem(
+                id=user_id,
+                status=status.HTTP_200_OK,
+                data=UserResponse.model_validate(user)
+            )
+        items.append(item)
+    
+    return BatchGetResponse(items=items)
+
+
 @router.get("/{user_id}", response_model=UserResponse)
 async def get_user(
     user_id: uuid.UUID,
@@ -111,6 +147,10 @@ async def update_user(
     for field, value in update_data.items():
         setattr(user, field, value)
     
+    # Ticket responses embed assignee names, so every cached response of
+    # the tenant may be stale.
+    scope = tenant_scope(user.tenant_id)
+    await notify_invalidation(db, [scope])
     await db.commit()
     await db.refresh(user)
     
@@ -135,6 +175,10 @@ async def delete_user(
         )
     
     await db.delete(user)
+    # Ticket responses embed assignee names, so every cached response of
+    # the tenant may be stale.
+    scope = tenant_scope(user.tenant_id)
+    await notify_invalidation(db, [scope])
     await db.commit()
     
     return None
@@ -10,6 +10,73 @@ class Settings(BaseSettings):
     PROJECT_NAME: str = "Mini-CRM Repair Requests"
     DEBUG: bool = False
 
+    DEFAULT_TENANT: str = "default"
+    # Admins of this tenant manage settings shared by every tenant, such as
+    # the SQL profiler. Defaults to DEFAULT_TENANT.
+    OPERATOR_TENANT: str | None = None
+
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: int = 5
+    DB_MAX_CONNECTIONS: int = 100
+    DB_RESERVED_CONNECTIONS: int = 10
+    DB_STATEMENT_TIMEOUT_MS: int = 5000
+    DB_LOCK_TIMEOUT_MS: int = 2000
+
+    REQUEST_TIMEOUT: float = 15
+
+    DUPLICATE_WINDOW_HOURS: int = 72
+    DUPLICATE_SIMILARITY: float = 0.6
+
+    CLIENT_AUTOCOMPLETE_CACHE_SIZE: int = 1000
+    CLIENT_AUTOCOMPLETE_CACHE_TTL: int = 30
+
+    RESPONSE_CACHE_SIZE: int = 1000
+    RESPONSE_CACHE_TTL: int = 30
+
+    REPORT_REFRESH_INTERVAL: int = 300
+
+    IDEMPOTENCY_TTL_HOURS: int = 24
+    IDEMPOTENCY_WAIT_SECONDS: int = 10
+    IDEMPOTENCY_LEASE_SECONDS: int = 30
+
+    # Devices that have not synced for longer start over without a token.
+    SYNC_TOKEN_TTL_DAYS: int = 30
+
+    JOB_CONCURRENCY: int = 0
+    JOB_POLL_INTERVAL: float = 1.0
+    JOB_MAX_ATTEMPTS: int = 5
+    JOB_TIMEOUT: int = 60
+
+    SMTP_HOST: str = "localhost"
+    SMTP_PORT: int = 1025
+    SMTP_USERNAME: str | None = None
+    SMTP_PASSWORD: str | None = None
+    SMTP_USE_TLS: bool = False
+    SMTP_FROM: str = "noreply@example.com"
+    SMS_WEBHOOK_URL: str | None = None
+
+    SQL_PROFILER_ENABLED: bool = False
+    SQL_SLOW_QUERY_MS: float = 200
+    SQL_EXPLAIN_SAMPLE_RATE: float = 0.0
+
+    ATTACHMENT_STORAGE: str = "local"
+    ATTACHMENT_DIR: str = "attachments"
+    ATTACHMENT_MAX_BYTES: int = 200 * 1024 * 1024
+    PUBLIC_ATTACHMENT_MAX_BYTES: int = 20 * 1024 * 1024
+    PUBLIC_UPLOAD_TIMEOUT: float = 120
+    S3_ENDPOINT_URL: str = "http://localhost:9000"
+    S3_PUBLIC_URL: str | None = None
+    S3_BUCKET: str = "attachments"
+    S3_REGION: str = "us-east-1"
+    S3_ACCESS_KEY: str = ""
+    S3_SECRET_KEY: str = ""
+
+    HOST: str = "0.0.0.0"
+    PORT: int = 8000
+    WEB_CONCURRENCY: int = 0
+    GRACEFUL_TIMEOUT: int = 30
+
     model_config = SettingsConfigDict(
         env_file=".env",
         case_sensitive=True
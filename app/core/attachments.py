@@ -0,0 +1,142 @@
+import asyncio
+import io
+import logging
+import uuid
+from typing import AsyncIterator
+
+from fastapi import HTTPException, Request, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.core.jobs import enqueue, job_handler
+from app.core.storage import storage
+from app.models.attachment import Attachment
+from app.models.ticket import Ticket
+
+logger = logging.getLogger(__name__)
+
+GENERATE_THUMBNAIL = "generate_thumbnail"
+ALLOWED_TYPES = ("image/", "video/")
+THUMBNAIL_SIZE = (320, 320)
+# Larger images are not decoded in the worker; they get no thumbnail.
+THUMBNAIL_MAX_SOURCE_BYTES = 50 * 1024 * 1024
+
+
+def storage_key(attachment: Attachment) -> str:
+    return f"{attachment.tenant_id}/{attachment.ticket_id}/{attachment.id}"
+
+
+def _too_large(limit: int) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+        detail=f"Attachments are limited to {limit} bytes"
+    )
+
+
+async def _limited(chunks: AsyncIterator[bytes], limit: int) -> AsyncIterator[bytes]:
+    size = 0
+    async for chunk in chunks:
+        size += len(chunk)
+        if size > limit:
+            raise _too_large(limit)
+        yield chunk
+
+
+async def store_attachment(
+    db: AsyncSession,
+    ticket: Ticket,
+    request: Request,
+    filename: str,
+    uploaded_by: uuid.UUID | None,
+    max_bytes: int = settings.ATTACHMENT_MAX_BYTES
+) -> Attachment:
+    """Stream the request body into storage and record it on ``ticket``.
+
+    The body is never held in memory, and the session's connection is
+    released while the file is transferred. Bodies over ``max_bytes`` are
+    rejected with 413.
+    """
+    content_type = request.headers.get("content-type", "").split(";")[0].strip().lower()
+    if not content_type.startswith(ALLOWED_TYPES):
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail="Only image and video attachments are accepted"
+        )
+
+    content_length = request.headers.get("content-length")
+    if content_length and content_length.isdigit() and int(content_length) > max_bytes:
+        raise _too_large(max_bytes)
+
+    attachment = Attachment(
+        id=uuid.uuid4(),
+        tenant_id=ticket.tenant_id,
+        ticket_id=ticket.id,
+        filename=filename,
+        content_type=content_type,
+        uploaded_by=uploaded_by
+    )
+    attachment.storage_key = storage_key(attachment)
+
+    await db.commit()
+    attachment.size = await storage.save(
+        attachment.storage_key,
+        _limited(request.stream(), max_bytes),
+        content_type
+    )
+
+    try:
+        if attachment.size == 0:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Attachment is empty"
+            )
+
+        db.add(attachment)
+        if content_type.startswith("image/"):
+            await enqueue(db, GENERATE_THUMBNAIL, {"attachment_id": str(attachment.id)})
+        await db.commit()
+    except BaseException:
+        await storage.delete(attachment.storage_key)
+        raise
+
+    await db.refresh(attachment)
+
+    return attachment
+
+
+def render_thumbnail(data: bytes) -> bytes | None:
+    """JPEG thumbnail of an image, or None if it cannot be decoded."""
+    # Pillow is only needed by the job runner, not on the request path.
+    from PIL import Image, UnidentifiedImageError
+
+    try:
+        with Image.open(io.BytesIO(data)) as image:
+            image.thumbnail(THUMBNAIL_SIZE)
+            output = io.BytesIO()
+            image.convert("RGB").save(output, "JPEG", quality=80)
+    except (UnidentifiedImageError, OSError, Image.DecompressionBombError):
+        return None
+
+    return output.getvalue()
+
+
+@job_handler(GENERATE_THUMBNAIL)
+async def handle_generate_thumbnail(payload: dict, db: AsyncSession) -> None:
+    attachment = await db.get(Attachment, uuid.UUID(payload["attachment_id"]))
+    if attachment is None or attachment.has_thumbnail:
+        return
+    if attachment.size > THUMBNAIL_MAX_SOURCE_BYTES:
+        return
+
+    thumbnail = await asyncio.to_thread(render_thumbnail, await storage.read(attachment.storage_key))
+    if thumbnail is None:
+        logger.info("Attachment %s is not a readable image, skipping thumbnail", attachment.id)
+        return
+
+    key = f"{attachment.storage_key}.thumbnail"
+    await storage.save(key, _single(thumbnail), "image/jpeg")
+    attachment.thumbnail_key = key
+
+
+async def _single(data: bytes) -> AsyncIterator[bytes]:
+    yield data
@@ -0,0 +1,167 @@
+import time
+from collections import OrderedDict
+from typing import Any, Hashable
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.core.pubsub import publish
+
+CHANNEL = "response_cache"
+PENDING_KEY = "response_cache_invalidations"
+
+# Scopes are "<tenant_id>:<name>"; "<tenant_id>:*" stands for all of them.
+TENANT_WILDCARD = "*"
+
+
+def _tenant_wildcard(scope: str) -> str:
+    return f"{scope.split(':', 1)[0]}:{TENANT_WILDCARD}"
+
+
+class ResponseCache:
+    """Bounded LRU cache with TTL whose entries are grouped into scopes.
+
+    Writes invalidate whole scopes (e.g. every cached page of one worker's
+    ticket list), so an entry never has to be matched by its filters.
+
+    A read that started before an invalidation must not store what it read
+    afterwards: callers take ``generation()`` before querying and pass it to
+    ``set``, which drops the value if one of its scopes was invalidated since.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[tuple, tuple[float, Any]] = OrderedDict()
+        self._scopes: dict[str, set[tuple]] = {}
+        self._generation = 0
+        # Generation of the latest invalidation of recently invalidated
+        # scopes. Older ones are forgotten; _forgotten is the newest of those.
+        self._invalidations: OrderedDict[str, int] = OrderedDict()
+        self._forgotten = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0
+
+    def generation(self) -> int:
+        return self._generation
+
+    def get(self, scope: str, key: Hashable) -> Any | None:
+        entry = self._entries.get((scope, key))
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            self._remove((scope, key))
+            return None
+        self._entries.move_to_end((scope, key))
+        return entry[1]
+
+    def set(self, scope: str, key: Hashable, value: Any, generation: int) -> None:
+        if not self.enabled or self._invalidated_since(scope, generation):
+            return
+        self._entries[(scope, key)] = (time.monotonic() + self.ttl_seconds, value)
+        self._entries.move_to_end((scope, key))
+        self._scopes.setdefault(scope, set()).add((scope, key))
+        while len(self._entries) > self.max_entries:
+            self._remove(next(iter(self._entries)))
+
+    def invalidate(self, *scopes: str) -> None:
+        for scope in scopes:
+            self._record_invalidation(scope)
+            if scope.endswith(f":{TENANT_WILDCARD}"):
+                prefix = scope[:-len(TENANT_WILDCARD)]
+                matching = [name for name in self._scopes if name.startswith(prefix)]
+            else:
+                matching = [scope]
+            for name in matching:
+                for entry_key in self._scopes.pop(name, ()):
+                    self._entries.pop(entry_key, None)
+
+    def clear(self) -> None:
+        self._generation += 1
+        self._forgotten = self._generation
+        self._invalidations.clear()
+        self._entries.clear()
+        self._scopes.clear()
+
+    def _record_invalidation(self, scope: str) -> None:
+        self._generation += 1
+        self._invalidations[scope] = self._generation
+        self._invalidations.move_to_end(scope)
+        while len(self._invalidations) > max(self.max_entries, 1024):
+            _, self._forgotten = self._invalidations.popitem(last=False)
+
+    def _invalidated_since(self, scope: str, generation: int) -> bool:
+        latest = max(
+            self._invalidations.get(scope, self._forgotten),
+            self._invalidations.get(_tenant_wildcard(scope), self._forgotten)
+        )
+        return latest > generation
+
+    def _remove(self, entry_key: tuple) -> None:
+        self._entries.pop(entry_key, None)
+        keys = self._scopes.get(entry_key[0])
+        if keys is not None:
+            keys.discard(entry_key)
+            if not keys:
+                del self._scopes[entry_key[0]]
+
+
+response_cache = ResponseCache(settings.RESPONSE_CACHE_SIZE, settings.RESPONSE_CACHE_TTL)
+
+
+def tenant_scope(tenant_id) -> str:
+    """Every scope of one tenant, for writes that affect all its responses."""
+    return f"{tenant_id}:{TENANT_WILDCARD}"
+
+
+def tickets_scope(tenant_id) -> str:
+    """Scope of a tenant's unfiltered (admin) ticket lists."""
+    return f"{tenant_id}:tickets"
+
+
+def worker_scope(tenant_id, worker_id) -> str:
+    return f"{tenant_id}:worker:{worker_id}"
+
+
+def ticket_scope(tenant_id, ticket_id) -> str:
+    return f"{tenant_id}:ticket:{ticket_id}"
+
+
+def ticket_scopes(tenant_id, ticket_id, *worker_ids) -> list[str]:
+    """Scopes touched by a write to one ticket and its (old and new) assignees."""
+    scopes = [tickets_scope(tenant_id), ticket_scope(tenant_id, ticket_id)]
+    scopes.extend(worker_scope(tenant_id, w) for w in worker_ids if w is not None)
+    return scopes
+
+
+async def notify_invalidation(db: AsyncSession, scopes: list[str]) -> None:
+    """Queue a cache invalidation for every worker process.
+
+    Must be called inside the writing transaction: Postgres only delivers
+    the notification once the transaction commits, and this process drops
+    the scopes when the session commits.
+    """
+    if not response_cache.enabled:
+        return
+    await publish(db, CHANNEL, ",".join(scopes))
+    db.info.setdefault(PENDING_KEY, []).extend(scopes)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed(session: Session) -> None:
+    scopes = session.info.pop(PENDING_KEY, None)
+    if scopes:
+        response_cache.invalidate(*scopes)
+
+
+@event.listens_for(Session, "after_rollback")
+def _drop_rolled_back(session: Session) -> None:
+    session.info.pop(PENDING_KEY, None)
+
+
+def apply_invalidation(payload: str) -> None:
+    response_cache.invalidate(*payload.split(","))
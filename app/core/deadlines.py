@@ -0,0 +1,301 @@
+import asyncio
+import logging
+import math
+import time
+from contextvars import ContextVar
+
+from fastapi import Request, status
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute
+from sqlalchemy import event, text
+from sqlalchemy.exc import DBAPIError, TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Postgres error codes
+QUERY_CANCELED = "57014"
+LOCK_NOT_AVAILABLE = "55P03"
+
+RETRY_AFTER_SECONDS = 1
+
+# Every pooled connection starts with these (see app.database), so a
+# transaction only pays for SET_TIMEOUTS when it needs different values.
+DEFAULT_TIMEOUTS = (settings.DB_STATEMENT_TIMEOUT_MS, settings.DB_LOCK_TIMEOUT_MS)
+
+SET_TIMEOUTS = text(
+    "SELECT set_config('statement_timeout', :statement_timeout, true), "
+    "set_config('lock_timeout', :lock_timeout, true)"
+)
+
+
+def _cap(timeout_ms: int, limit_ms: int) -> int:
+    """The smaller of two Postgres timeouts, where 0 means no timeout."""
+    if timeout_ms == 0:
+        return limit_ms
+    if limit_ms == 0:
+        return timeout_ms
+    return min(timeout_ms, limit_ms)
+
+
+class RequestDeadline:
+    """Time budget of one HTTP request.
+
+    Created by ``DeadlineMiddleware``; a route's ``Deadline`` dependency
+    replaces the defaults. Database timeouts are derived from it at the start
+    of every transaction, so a query never outlives the request.
+    """
+
+    def __init__(self, started_at: float, seconds: float | None):
+        self.started_at = started_at
+        self.expires_at: float | None = None
+        self.statement_timeout_ms, self.lock_timeout_ms = DEFAULT_TIMEOUTS
+        self.sessions: list[AsyncSession] = []
+        self.changed = asyncio.Event()
+        self.set_budget(seconds)
+
+    def set_budget(
+        self,
+        seconds: float | None,
+        statement_timeout_ms: int | None = None,
+        lock_timeout_ms: int | None = None
+    ) -> None:
+        self.expires_at = self.started_at + seconds if seconds else None
+        if statement_timeout_ms is not None:
+            self.statement_timeout_ms = statement_timeout_ms
+        if lock_timeout_ms is not None:
+            self.lock_timeout_ms = lock_timeout_ms
+        self.changed.set()
+
+    def remaining(self) -> float | None:
+        if self.expires_at is None:
+            return None
+        return self.expires_at - time.monotonic()
+
+    def db_timeouts(self) -> tuple[int, int]:
+        statement_timeout = self.statement_timeout_ms
+        remaining = self.remaining()
+        if remaining is not None:
+            statement_timeout = _cap(statement_timeout, max(1, math.ceil(remaining * 1000)))
+        return statement_timeout, _cap(self.lock_timeout_ms, statement_timeout)
+
+
+_request_deadline: ContextVar[RequestDeadline | None] = ContextVar("request_deadline", default=None)
+
+
+class Deadline:
+    """Per-route time budget: ``dependencies=[Depends(Deadline(60))]``.
+
+    ``seconds`` counts from the start of the request; ``None`` removes the
+    deadline. Timeouts left out keep DB_STATEMENT_TIMEOUT_MS and
+    DB_LOCK_TIMEOUT_MS.
+    """
+
+    def __init__(
+        self,
+        seconds: float | None,
+        statement_timeout_ms: int | None = None,
+        lock_timeout_ms: int | None = None
+    ):
+        self.seconds = seconds
+        self.statement_timeout_ms = statement_timeout_ms
+        self.lock_timeout_ms = lock_timeout_ms
+
+    async def __call__(self) -> None:
+        deadline = _request_deadline.get()
+        if deadline is not None:
+            deadline.set_budget(self.seconds, self.statement_timeout_ms, self.lock_timeout_ms)
+
+
+def track_session(session: AsyncSession) -> None:
+    """Release ``session`` as soon as the current request's endpoint returns."""
+    deadline = _request_deadline.get()
+    if deadline is not None:
+        deadline.sessions.append(session)
+
+
+@event.listens_for(Session, "after_begin")
+def _apply_timeouts(session: Session, transaction, connection) -> None:
+    if connection.dialect.name != "postgresql":
+        return
+
+    deadline = _request_deadline.get()
+    if deadline is None:
+        # Background jobs, report refreshes and scripts are not time-boxed.
+        statement_timeout, lock_timeout = 0, 0
+    else:
+        statement_timeout, lock_timeout = deadline.db_timeouts()
+
+    if (statement_timeout, lock_timeout) != DEFAULT_TIMEOUTS:
+        connection.execute(
+            SET_TIMEOUTS,
+            {"statement_timeout": str(statement_timeout), "lock_timeout": str(lock_timeout)}
+        )
+
+
+class DeadlineRoute(APIRoute):
+    """Route that returns the request's sessions to the pool when the endpoint
+    returns, instead of after FastAPI has serialized the response.
+
+    Closing detaches the returned ORM objects; their loaded attributes are
+    still readable by the response model.
+    """
+
+    def get_route_handler(self):
+        endpoint = self.dependant.call
+        if asyncio.iscoroutinefunction(endpoint):
+            async def call_and_release(**values):
+                try:
+                    return await endpoint(**values)
+                finally:
+                    deadline = _request_deadline.get()
+                    if deadline is not None:
+                        for session in deadline.sessions:
+                            await session.close()
+
+            self.dependant.call = call_and_release
+        return super().get_route_handler()
+
+
+async def _read_messages(receive, messages: asyncio.Queue, disconnected: asyncio.Event) -> None:
+    # The queue holds one message, so a large upload is still read only as
+    # fast as the endpoint consumes it.
+    while True:
+        message = await receive()
+        if message["type"] == "http.disconnect":
+            disconnected.set()
+            try:
+                messages.put_nowait(message)
+            except asyncio.QueueFull:
+                pass
+            return
+        await messages.put(message)
+
+
+class DeadlineMiddleware:
+    """Runs each request under its deadline.
+
+    The request is cancelled, together with its running query, when the
+    client disconnects or the deadline passes before the response has
+    started; the latter is answered with 504. REQUEST_TIMEOUT is the default
+    budget, 0 disables it.
+    """
+
+    def __init__(self, app, timeout: float = settings.REQUEST_TIMEOUT):
+        self.app = app
+        self.timeout = timeout
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        deadline = RequestDeadline(time.monotonic(), self.timeout)
+        messages: asyncio.Queue = asyncio.Queue(maxsize=1)
+        disconnected = asyncio.Event()
+        response_started = False
+        response_complete = False
+
+        async def receive_message():
+            if disconnected.is_set() and messages.empty():
+                return {"type": "http.disconnect"}
+            return await messages.get()
+
+        async def send_message(message):
+            nonlocal response_started, response_complete
+            if message["type"] == "http.response.start":
+                response_started = True
+            elif message["type"] == "http.response.body" and not message.get("more_body", False):
+                response_complete = True
+            await send(message)
+
+        token = _request_deadline.set(deadline)
+        try:
+            app_task = asyncio.create_task(self.app(scope, receive_message, send_message))
+        finally:
+            _request_deadline.reset(token)
+        reader = asyncio.create_task(_read_messages(receive, messages, disconnected))
+        waiters = {
+            "disconnect": asyncio.create_task(disconnected.wait()),
+            "changed": asyncio.create_task(deadline.changed.wait()),
+        }
+
+        try:
+            while True:
+                timeout = None if response_started else deadline.remaining()
+                done, _ = await asyncio.wait(
+                    {app_task, *waiters.values()},
+                    timeout=None if timeout is None else max(timeout, 0),
+                    return_when=asyncio.FIRST_COMPLETED
+                )
+
+                if app_task in done:
+                    return app_task.result()
+
+                if waiters["disconnect"] in done:
+                    # uvicorn also reports a disconnect once the response is sent.
+                    if response_complete:
+                        waiters.pop("disconnect")
+                        continue
+                    logger.info("Client disconnected, cancelling %s %s", scope["method"], scope["path"])
+                    await self._cancel(app_task)
+                    return
+
+                if waiters["changed"] in done:
+                    deadline.changed.clear()
+                    waiters["changed"] = asyncio.create_task(deadline.changed.wait())
+                    continue
+
+                remaining = deadline.remaining()
+                if not response_started and remaining is not None and remaining <= 0:
+                    logger.warning("Deadline exceeded, cancelling %s %s", scope["method"], scope["path"])
+                    await self._cancel(app_task)
+                    if not response_started:
+                        response = JSONResponse(
+                            {"detail": "Request deadline exceeded"},
+                            status_code=status.HTTP_504_GATEWAY_TIMEOUT
+                        )
+                        await response(scope, receive_message, send)
+                    return
+        finally:
+            for task in (reader, *waiters.values()):
+                task.cancel()
+            if not app_task.done():
+                await self._cancel(app_task)
+
+    @staticmethod
+    async def _cancel(task: asyncio.Task) -> None:
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+        except Exception:
+            logger.exception("Error while cancelling request")
+
+
+def _unavailable(detail: str) -> JSONResponse:
+    return JSONResponse(
+        {"detail": detail},
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        headers={"Retry-After": str(RETRY_AFTER_SECONDS)}
+    )
+
+
+async def database_error_handler(request: Request, exc: DBAPIError):
+    sqlstate = getattr(exc.orig, "sqlstate", None)
+    if sqlstate == QUERY_CANCELED:
+        return JSONResponse(
+            {"detail": "Database query timed out"},
+            status_code=status.HTTP_504_GATEWAY_TIMEOUT
+        )
+    if sqlstate == LOCK_NOT_AVAILABLE:
+        return _unavailable("The record is locked by another request, try again")
+    raise exc
+
+
+async def pool_timeout_handler(request: Request, exc: PoolTimeoutError):
+    return _unavailable("Database is busy, try again")
@@ -0,0 +1,271 @@
+import asyncio
+import hashlib
+import json
+import logging
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable
+
+from fastapi import HTTPException, Response, status
+from sqlalchemy import select, delete, update, and_, or_
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.database import async_session_maker
+from app.models.idempotency import IdempotencyKey
+
+logger = logging.getLogger(__name__)
+
+REPLAY_HEADER = "Idempotent-Replayed"
+POLL_INTERVAL = 0.1
+
+# Requests with the same key that are in flight in this process share one
+# execution instead of polling the database.
+_in_flight: dict[tuple[str, str], tuple[str, asyncio.Future]] = {}
+
+
+def request_hash(payload: Any) -> str:
+    data = json.dumps(payload, sort_keys=True, default=str)
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+
+def _conflict(detail: str) -> HTTPException:
+    return HTTPException(status_code=status.HTTP_409_CONFLICT, detail=detail)
+
+
+def _mismatch() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+        detail="Idempotency-Key was already used with a different request"
+    )
+
+
+def _replay(response: Response, status_code: int, body: dict) -> dict:
+    response.headers[REPLAY_HEADER] = "true"
+    if status_code >= 400:
+        raise HTTPException(
+            status_code=status_code,
+            detail=body.get("detail"),
+            headers={REPLAY_HEADER: "true"}
+        )
+    response.status_code = status_code
+    return body
+
+
+async def run_idempotent(
+    db: AsyncSession,
+    key: str | None,
+    scope: str,
+    payload: Any,
+    response: Response,
+    handler: Callable[[], Awaitable[Any]],
+    serialize: Callable[[Any], dict],
+    default_status: int = status.HTTP_200_OK
+):
+    """Run ``handler`` at most once per (scope, key) and commit its writes.
+
+    ``handler`` must not commit: its writes and the stored response are
+    committed together, so a crash either loses both or keeps both. The
+    first request stores its status code and JSON body; retries with the
+    same key and payload within IDEMPOTENCY_TTL_HOURS get the stored response
+    back. Concurrent duplicates wait for the first execution to finish, or
+    take the key over once its owner's lease has run out. Server errors are
+    not stored, so a retry after a 5xx runs again.
+    """
+    if key is None:
+        result = await handler()
+        await db.commit()
+        return result
+
+    ident = (scope, key)
+    digest = request_hash(payload)
+
+    in_flight = _in_flight.get(ident)
+    if in_flight is not None:
+        if in_flight[0] != digest:
+            raise _mismatch()
+        status_code, body = await asyncio.shield(in_flight[1])
+        return _replay(response, status_code, body)
+
+    future = asyncio.get_running_loop().create_future()
+    _in_flight[ident] = (digest, future)
+    try:
+        status_code, body, replayed = await _execute(
+            db, scope, key, digest, response, handler, serialize, default_status
+        )
+        future.set_result((status_code, body))
+    except BaseException as exc:
+        future.set_exception(exc)
+        # Nobody may be waiting; retrieve the exception to avoid a warning.
+        future.exception()
+        raise
+    finally:
+        _in_flight.pop(ident, None)
+
+    if replayed:
+        return _replay(response, status_code, body)
+    if status_code >= 400:
+        raise HTTPException(status_code=status_code, detail=body.get("detail"))
+    return body
+
+
+async def _claim(db: AsyncSession, scope: str, key: str, digest: str) -> datetime | None:
+    """Insert the key, or take over one whose owner's lease ran out.
+
+    Returns the lease's expiry, which identifies this claim: a request that
+    took the key over afterwards has written a different one.
+    """
+    now = datetime.utcnow()
+    expired_before = now - timedelta(hours=settings.IDEMPOTENCY_TTL_HOURS)
+    locked_until = now + timedelta(seconds=settings.IDEMPOTENCY_LEASE_SECONDS)
+    stmt = insert(IdempotencyKey).values(
+        scope=scope,
+        key=key,
+        request_hash=digest,
+        created_at=now,
+        locked_until=locked_until
+    )
+    result = await db.execute(
+        stmt.on_conflict_do_update(
+            index_elements=[IdempotencyKey.scope, IdempotencyKey.key],
+            set_={
+                "request_hash": stmt.excluded.request_hash,
+                "created_at": stmt.excluded.created_at,
+                "locked_until": stmt.excluded.locked_until,
+                "status_code": None,
+                "response_body": None,
+            },
+            where=or_(
+                and_(IdempotencyKey.status_code.is_(None), IdempotencyKey.locked_until < now),
+                IdempotencyKey.created_at < expired_before
+            )
+        )
+        .returning(IdempotencyKey.key)
+    )
+    claimed = result.scalar_one_or_none() is not None
+    await db.commit()
+    return locked_until if claimed else None
+
+
+async def _wait_for_result(db: AsyncSession, scope: str, key: str) -> IdempotencyKey | None:
+    """Poll until the key's response is stored.
+
+    Returns None when the key is free to claim: gone, expired, or held by
+    an owner whose lease ran out.
+    """
+    deadline = asyncio.get_running_loop().time() + settings.IDEMPOTENCY_WAIT_SECONDS
+
+    while True:
+        result = await db.execute(
+            select(IdempotencyKey)
+            .where(IdempotencyKey.scope == scope, IdempotencyKey.key == key)
+            .execution_options(populate_existing=True)
+        )
+        record = result.scalar_one_or_none()
+        await db.commit()
+
+        now = datetime.utcnow()
+        if record is None:
+            return None
+        if record.created_at < now - timedelta(hours=settings.IDEMPOTENCY_TTL_HOURS):
+            return None
+        if record.status_code is not None:
+            return record
+        if record.locked_until is None or record.locked_until < now:
+            return None
+        if asyncio.get_running_loop().time() >= deadline:
+            raise _conflict("A request with this Idempotency-Key is still in progress")
+
+        await asyncio.sleep(POLL_INTERVAL)
+
+
+async def _execute(db, scope, key, digest, response, handler, serialize, default_status):
+    claimed_until = await _claim(db, scope, key, digest)
+    if claimed_until is None:
+        record = await _wait_for_result(db, scope, key)
+        if record is None:
+            claimed_until = await _claim(db, scope, key, digest)
+            if claimed_until is None:
+                raise _conflict("A request with this Idempotency-Key is still in progress")
+        else:
+            if record.request_hash != digest:
+                raise _mismatch()
+            return record.status_code, record.response_body, True
+
+    try:
+        result = await handler()
+        status_code = response.status_code or default_status
+        body = serialize(result)
+    except HTTPException as exc:
+        if exc.status_code >= 500:
+            await _release(db, scope, key, claimed_until)
+            raise
+        await db.rollback()
+        status_code, body = exc.status_code, {"detail": exc.detail}
+    except BaseException:
+        await _release(db, scope, key, claimed_until)
+        raise
+
+    # Stored in the handler's transaction: the response exists exactly when
+    # its writes do. If the lease ran out and another request took the key
+    # over, that request owns the outcome and these writes are discarded.
+    try:
+        result = await db.execute(
+            update(IdempotencyKey)
+            .where(
+                IdempotencyKey.scope == scope,
+                IdempotencyKey.key == key,
+                IdempotencyKey.locked_until == claimed_until
+            )
+            .values(status_code=status_code, response_body=body, locked_until=None)
+        )
+        if result.rowcount == 0:
+            await db.rollback()
+            raise _conflict("A request with this Idempotency-Key is still in progress")
+        await db.commit()
+    except HTTPException:
+        raise
+    except BaseException:
+        await _release(db, scope, key, claimed_until)
+        raise
+
+    return status_code, body, False
+
+
+async def _release(db: AsyncSession, scope: str, key: str, claimed_until: datetime) -> None:
+    """Free the key for a retry unless its response was committed.
+
+    Runs while unwinding, possibly cancelled: if the commit went through
+    despite the error the stored response stays and retries replay it. A
+    claim taken over by another request is left to that request.
+    """
+    await db.rollback()
+    await db.execute(
+        delete(IdempotencyKey)
+        .where(
+            IdempotencyKey.scope == scope,
+            IdempotencyKey.key == key,
+            IdempotencyKey.status_code.is_(None),
+            IdempotencyKey.locked_until == claimed_until
+        )
+    )
+    await db.commit()
+
+
+async def purge_expired(db: AsyncSession) -> int:
+    expired_before = datetime.utcnow() - timedelta(hours=settings.IDEMPOTENCY_TTL_HOURS)
+    result = await db.execute(
+        delete(IdempotencyKey).where(IdempotencyKey.created_at < expired_before)
+    )
+    await db.commit()
+    return result.rowcount
+
+
+async def purge_periodically(interval: int) -> None:
+    while True:
+        try:
+            async with async_session_maker() as session:
+                await purge_expired(session)
+        except Exception:
+            logger.exception("Idempotency key cleanup failed")
+        await asyncio.sleep(interval)
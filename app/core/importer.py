@@ -0,0 +1,480 @@
+import asyncio
+import csv
+import json
+import logging
+import tempfile
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import AsyncIterator, Awaitable, Callable, Iterator
+
+from sqlalchemy import select, update, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import async_session_maker
+from app.core.cache import notify_invalidation, tenant_scope
+from app.core.jobs import job_handler
+from app.core.reports import refresh_rollup
+from app.core.storage import CHUNK_SIZE, storage
+from app.models.import_run import ImportRun, ImportStatus
+from app.models.ticket import TicketStatus
+from app.utils.fingerprint import ticket_fingerprint
+
+logger = logging.getLogger(__name__)
+
+IMPORT_TICKETS = "import_tickets"
+FORMATS = ("csv", "jsonl")
+BATCH_SIZE = 10_000
+
+ProgressCallback = Callable[[dict], Awaitable[None]]
+
+STAGING_COLUMNS = (
+    "line",
+    "title",
+    "description",
+    "status",
+    "created_at",
+    "assigned_at",
+    "completed_at",
+    "fingerprint",
+    "client_full_name",
+    "client_email",
+    "client_phone",
+    "client_address",
+    "worker_email",
+)
+
+# Temporary tables live on the import's connection and vanish with its
+# transaction, so a failed import leaves nothing behind.
+CREATE_STAGING = text("""
+    CREATE TEMP TABLE import_staging (
+        line integer NOT NULL,
+        title text NOT NULL,
+        description text NOT NULL,
+        status text NOT NULL,
+        created_at timestamp NOT NULL,
+        assigned_at timestamp,
+        completed_at timestamp,
+        fingerprint text NOT NULL,
+        client_full_name text NOT NULL,
+        client_email text NOT NULL,
+        client_phone text NOT NULL,
+        client_address text,
+        worker_email text
+    ) ON COMMIT DROP
+""")
+
+DROP_UNKNOWN_WORKERS = text("""
+    DELETE FROM import_staging s
+    WHERE s.worker_email IS NOT NULL
+      AND NOT EXISTS (
+          SELECT 1 FROM users u
+          WHERE u.tenant_id = :tenant_id
+            AND lower(u.email) = s.worker_email
+            AND u.role = 'WORKER'
+      )
+    RETURNING s.line, s.worker_email
+""")
+
+# One row per client email; the newest ticket's contact details win.
+COLLECT_CLIENTS = text("""
+    CREATE TEMP TABLE import_clients ON COMMIT DROP AS
+    SELECT DISTINCT ON (client_email)
+        client_email AS email,
+        client_full_name AS full_name,
+        client_phone AS phone,
+        client_address AS address,
+        min(created_at) OVER (PARTITION BY client_email) AS created_at,
+        NULL::uuid AS id
+    FROM import_staging
+    ORDER BY client_email, created_at DESC, line DESC
+""")
+
+MATCH_CLIENTS = text("""
+    UPDATE import_clients ic
+    SET id = c.id
+    FROM (
+        SELECT DISTINCT ON (lower(email)) lower(email) AS email, id
+        FROM clients
+        WHERE tenant_id = :tenant_id
+        ORDER BY lower(email), created_at
+    ) c
+    WHERE c.email = ic.email
+""")
+
+CREATE_CLIENTS = text("""
+    WITH created AS (
+        INSERT INTO clients (
+            id, tenant_id, full_name, email, phone, address, created_at, updated_at
+        )
+        SELECT
+            gen_random_uuid(), :tenant_id, full_name, email, phone, address,
+            created_at, created_at
+        FROM import_clients
+        WHERE id IS NULL
+        RETURNING id, email
+    )
+    UPDATE import_clients ic
+    SET id = created.id
+    FROM created
+    WHERE created.email = ic.email
+""")
+
+# Tickets already present with the same client, fingerprint and creation
+# time are skipped, so re-running an import does not duplicate them.
+# Repeated rows within the file are merged the same way; the first wins.
+INSERT_TICKETS = text("""
+    INSERT INTO tickets (
+        id, tenant_id, title, description, status, client_id, assigned_to,
+        created_at, updated_at, assigned_at, completed_at,
+        fingerprint, duplicate_count
+    )
+    SELECT DISTINCT ON (ic.id, s.fingerprint, s.created_at)
+        gen_random_uuid(), :tenant_id, s.title, s.description, s.status::ticketstatus,
+        ic.id, u.id, s.created_at, coalesce(s.completed_at, s.assigned_at, s.created_at),
+        s.assigned_at, s.completed_at, s.fingerprint, 0
+    FROM import_staging s
+    JOIN import_clients ic ON ic.email = s.client_email
+    LEFT JOIN users u
+        ON u.tenant_id = :tenant_id
+        AND lower(u.email) = s.worker_email
+        AND u.role = 'WORKER'
+    WHERE NOT EXISTS (
+        SELECT 1 FROM tickets t
+        WHERE t.client_id = ic.id
+          AND t.fingerprint = s.fingerprint
+          AND t.created_at = s.created_at
+    )
+    ORDER BY ic.id, s.fingerprint, s.created_at, s.line
+""")
+
+
+# Uploads and error files are kept in the attachment storage, which the API
+# and the job runners share.
+def upload_key(tenant_id: uuid.UUID, import_id: uuid.UUID) -> str:
+    return f"imports/{tenant_id}/{import_id}.upload"
+
+
+def error_key(tenant_id: uuid.UUID, import_id: uuid.UUID) -> str:
+    return f"imports/{tenant_id}/{import_id}.errors.csv"
+
+
+def _text(record: dict, field: str, max_length: int | None = None, required: bool = True):
+    value = record.get(field)
+    value = str(value).strip() if value is not None else ""
+    if not value:
+        if required:
+            raise ValueError(f"{field} is required")
+        return None
+    if max_length is not None and len(value) > max_length:
+        raise ValueError(f"{field} is longer than {max_length} characters")
+    return value
+
+
+def _timestamp(record: dict, field: str, required: bool = False) -> datetime | None:
+    value = _text(record, field, required=required)
+    if value is None:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        raise ValueError(f"{field} is not an ISO 8601 timestamp")
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+def _email(record: dict, field: str, required: bool = True) -> str | None:
+    value = _text(record, field, max_length=255, required=required)
+    if value is not None and "@" not in value:
+        raise ValueError(f"{field} is not an email address")
+    return value.lower() if value is not None else None
+
+
+def parse_record(line: int, record: dict) -> tuple:
+    """Validate one input record and return it as a staging row."""
+    title = _text(record, "title", max_length=255)
+    description = _text(record, "description")
+    created_at = _timestamp(record, "created_at", required=True)
+    assigned_at = _timestamp(record, "assigned_at")
+    completed_at = _timestamp(record, "completed_at")
+    worker_email = _email(record, "worker_email", required=False)
+
+    raw_status = _text(record, "status", required=False)
+    if raw_status is None:
+        ticket_status = TicketStatus.ASSIGNED if worker_email else TicketStatus.NEW
+    else:
+        try:
+            ticket_status = TicketStatus(raw_status.lower())
+        except ValueError:
+            raise ValueError(f"status '{raw_status}' is not one of "
+                             f"{', '.join(s.value for s in TicketStatus)}")
+
+    if worker_email and assigned_at is None:
+        assigned_at = created_at
+    if ticket_status == TicketStatus.DONE and completed_at is None:
+        completed_at = assigned_at or created_at
+
+    return (
+        line,
+        title,
+        description,
+        ticket_status.name,
+        created_at,
+        assigned_at,
+        completed_at,
+        ticket_fingerprint(title, description),
+        _text(record, "client_full_name", max_length=255),
+        _email(record, "client_email"),
+        _text(record, "client_phone", max_length=50),
+        _text(record, "client_address", required=False),
+        worker_email,
+    )
+
+
+def _read_records(file, fmt: str) -> Iterator[tuple[int, dict | None, str | None]]:
+    if fmt == "csv":
+        reader = csv.DictReader(file)
+        try:
+            for record in reader:
+                yield reader.line_num, record, None
+        except csv.Error as exc:
+            yield reader.line_num, None, f"Malformed CSV: {exc}"
+        return
+
+    for line, raw in enumerate(file, start=1):
+        if not raw.strip():
+            continue
+        try:
+            record = json.loads(raw)
+        except ValueError as exc:
+            yield line, None, f"Malformed JSON: {exc}"
+            continue
+        if not isinstance(record, dict):
+            yield line, None, "Expected a JSON object"
+            continue
+        yield line, record, None
+
+
+class _BatchReader:
+    """Reads and validates input in batches; invalid rows go to the error file.
+
+    Runs in a worker thread so parsing does not block the event loop.
+    """
+
+    def __init__(self, path: Path, fmt: str, errors_path: Path):
+        if fmt not in FORMATS:
+            raise ValueError(f"Unsupported import format '{fmt}'")
+        self._file = open(path, newline="", encoding="utf-8-sig")
+        self._records = _read_records(self._file, fmt)
+        self._errors_path = errors_path
+        self._errors_file = None
+        self._errors = None
+
+    def read_batch(self, size: int) -> tuple[list[tuple], int, bool]:
+        rows, errors = [], []
+        for line, record, error in self._records:
+            if error is None:
+                try:
+                    rows.append(parse_record(line, record))
+                except ValueError as exc:
+                    error = str(exc)
+            if error is not None:
+                errors.append((line, error))
+            if len(rows) + len(errors) >= size:
+                self.write_errors(errors)
+                return rows, len(errors), False
+        self.write_errors(errors)
+        return rows, len(errors), True
+
+    def write_errors(self, errors: list[tuple[int, str]]) -> None:
+        if not errors:
+            return
+        if self._errors is None:
+            self._errors_path.parent.mkdir(parents=True, exist_ok=True)
+            self._errors_file = open(self._errors_path, "w", newline="", encoding="utf-8")
+            self._errors = csv.writer(self._errors_file)
+            self._errors.writerow(["line", "error"])
+        self._errors.writerows(errors)
+
+    def close(self) -> None:
+        self._file.close()
+        if self._errors_file is not None:
+            self._errors_file.close()
+
+
+async def run_import(
+    db: AsyncSession,
+    path: Path,
+    fmt: str,
+    errors_path: Path,
+    tenant_id: uuid.UUID,
+    progress: ProgressCallback | None = None
+) -> dict:
+    """Load a tenant's tickets and their clients from a CSV or JSONL file.
+
+    Valid rows are streamed with COPY into a staging table, then merged with
+    a handful of set-wise statements in a single transaction: clients are
+    de-duplicated by email and matched to existing ones, assignees are
+    resolved by worker email. Rows that fail validation or name an unknown
+    worker are written to ``errors_path`` with their line number.
+    """
+    stats = {
+        "stage": "loading",
+        "rows_read": 0,
+        "rows_failed": 0,
+        "tickets_created": 0,
+        "tickets_skipped": 0,
+        "clients_created": 0,
+    }
+
+    async def report():
+        if progress is not None:
+            await progress(dict(stats))
+
+    errors_path.unlink(missing_ok=True)
+    reader = _BatchReader(path, fmt, errors_path)
+    try:
+        # Left over if the caller's transaction ran an import before.
+        await db.execute(text("DROP TABLE IF EXISTS import_staging, import_clients"))
+        await db.execute(CREATE_STAGING)
+        connection = await db.connection()
+        raw = await connection.get_raw_connection()
+
+        staged = 0
+        done = False
+        while not done:
+            rows, failed, done = await asyncio.to_thread(reader.read_batch, BATCH_SIZE)
+            if rows:
+                await raw.driver_connection.copy_records_to_table(
+                    "import_staging",
+                    records=rows,
+                    columns=STAGING_COLUMNS
+                )
+            staged += len(rows)
+            stats["rows_read"] += len(rows) + failed
+            stats["rows_failed"] += failed
+            await report()
+
+        stats["stage"] = "merging"
+        await report()
+
+        # Temporary tables are never auto-analyzed.
+        await db.execute(text("ANALYZE import_staging"))
+
+        params = {"tenant_id": tenant_id}
+        unknown = (await db.execute(DROP_UNKNOWN_WORKERS, params)).all()
+        if unknown:
+            await asyncio.to_thread(
+                reader.write_errors,
+                sorted((line, f"Unknown worker email: {email}") for line, email in unknown)
+            )
+            stats["rows_failed"] += len(unknown)
+            staged -= len(unknown)
+
+        await db.execute(COLLECT_CLIENTS)
+        await db.execute(MATCH_CLIENTS, params)
+        stats["clients_created"] = (await db.execute(CREATE_CLIENTS, params)).rowcount
+        stats["tickets_created"] = (await db.execute(INSERT_TICKETS, params)).rowcount
+        stats["tickets_skipped"] = staged - stats["tickets_created"]
+
+        await notify_invalidation(db, [tenant_scope(tenant_id)])
+        await db.commit()
+    except BaseException:
+        await db.rollback()
+        raise
+    finally:
+        reader.close()
+
+    # Historical tickets land on past days the incremental refresh skips.
+    if stats["tickets_created"]:
+        stats["stage"] = "refreshing reports"
+        await report()
+        if await refresh_rollup(db, full=True, tenant_id=tenant_id) is None:
+            logger.warning("Report rollup is being refreshed elsewhere; "
+                           "run a full refresh to include imported tickets")
+
+    stats["stage"] = "done"
+    await report()
+    return stats
+
+
+async def _update_run(import_id: uuid.UUID, **values) -> None:
+    # Progress is written outside the import's transaction so it is visible
+    # while the import runs.
+    async with async_session_maker() as session:
+        await session.execute(
+            update(ImportRun)
+            .where(ImportRun.id == import_id)
+            .values(**values)
+        )
+        await session.commit()
+
+
+async def _file_chunks(path: Path) -> AsyncIterator[bytes]:
+    with open(path, "rb") as file:
+        while chunk := await asyncio.to_thread(file.read, CHUNK_SIZE):
+            yield chunk
+
+
+async def _fetch(key: str, path: Path) -> None:
+    with open(path, "wb") as file:
+        async for chunk in storage.stream(key):
+            await asyncio.to_thread(file.write, chunk)
+
+
+async def _save_errors(key: str, path: Path) -> None:
+    if path.exists():
+        await storage.save(key, _file_chunks(path), "text/csv")
+
+
+@job_handler(IMPORT_TICKETS, timeout=None)
+async def handle_import(payload: dict, db: AsyncSession) -> None:
+    import_id = uuid.UUID(payload["import_id"])
+
+    result = await db.execute(
+        select(ImportRun.format, ImportRun.tenant_id).where(ImportRun.id == import_id)
+    )
+    run = result.one_or_none()
+    await db.commit()
+    if run is None:
+        logger.warning("Import %s no longer exists", import_id)
+        return
+
+    await _update_run(
+        import_id,
+        status=ImportStatus.RUNNING,
+        started_at=datetime.utcnow(),
+        error=None
+    )
+
+    async def progress(stats: dict) -> None:
+        await _update_run(import_id, **stats)
+
+    # The runner may be on another host than the API that took the upload,
+    # so the file is copied from the shared storage to a local scratch file.
+    with tempfile.TemporaryDirectory(prefix="import-") as workdir:
+        path = Path(workdir) / "upload"
+        errors_path = Path(workdir) / "errors.csv"
+        try:
+            await _fetch(upload_key(run.tenant_id, import_id), path)
+            stats = await run_import(db, path, run.format, errors_path, run.tenant_id, progress)
+        except Exception as exc:
+            await _save_errors(error_key(run.tenant_id, import_id), errors_path)
+            await _update_run(
+                import_id,
+                status=ImportStatus.FAILED,
+                error=f"{type(exc).__name__}: {exc}",
+                finished_at=datetime.utcnow()
+            )
+            raise
+
+        await _save_errors(error_key(run.tenant_id, import_id), errors_path)
+
+    await _update_run(
+        import_id,
+        status=ImportStatus.DONE,
+        finished_at=datetime.utcnow(),
+        **stats
+    )
+    await storage.delete(upload_key(run.tenant_id, import_id))
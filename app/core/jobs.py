@@ -0,0 +1,212 @@
+import asyncio
+import logging
+import random
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable
+
+from sqlalchemy import select, update, or_, and_
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.config import settings
+from app.database import async_session_maker
+from app.models.job import Job, JobStatus
+
+logger = logging.getLogger(__name__)
+
+JobHandler = Callable[[dict, AsyncSession], Awaitable[None]]
+
+JOB_HANDLERS: dict[str, tuple[JobHandler, float | None]] = {}
+
+BACKOFF_BASE_SECONDS = 5
+BACKOFF_MAX_SECONDS = 3600
+
+
+def job_handler(kind: str, timeout: float | None = settings.JOB_TIMEOUT):
+    """Register a handler for ``kind``.
+
+    Pass ``timeout=None`` for long-running jobs such as imports; the runner
+    then refreshes the job's lock while it runs so it is not considered stale.
+    """
+    def register(func: JobHandler) -> JobHandler:
+        JOB_HANDLERS[kind] = (func, timeout)
+        return func
+    return register
+
+
+async def enqueue(
+    db: AsyncSession,
+    kind: str,
+    payload: dict,
+    run_at: datetime | None = None
+) -> Job:
+    """Add a job to the caller's transaction.
+
+    The job only becomes visible to runners if the surrounding write commits,
+    so side effects are never triggered for rolled-back changes.
+    """
+    job = Job(
+        kind=kind,
+        payload=payload,
+        run_at=run_at or datetime.utcnow(),
+        max_attempts=settings.JOB_MAX_ATTEMPTS
+    )
+    db.add(job)
+    return job
+
+
+def backoff_delay(attempts: int) -> float:
+    delay = min(BACKOFF_BASE_SECONDS * 2 ** (attempts - 1), BACKOFF_MAX_SECONDS)
+    return delay * random.uniform(0.5, 1.0)
+
+
+async def claim_job(db: AsyncSession) -> Job | None:
+    """Lock the next runnable job; concurrent runners skip locked rows."""
+    now = datetime.utcnow()
+    stale_before = now - timedelta(seconds=settings.JOB_TIMEOUT * 2)
+
+    candidate = (
+        select(Job.id)
+        .where(
+            Job.run_at <= now,
+            or_(
+                Job.status == JobStatus.PENDING,
+                # A runner died while holding the job.
+                and_(Job.status == JobStatus.RUNNING, Job.locked_at < stale_before)
+            )
+        )
+        .order_by(Job.run_at)
+        .limit(1)
+        .with_for_update(skip_locked=True)
+        .scalar_subquery()
+    )
+
+    result = await db.execute(
+        update(Job)
+        .where(Job.id == candidate)
+        .values(
+            status=JobStatus.RUNNING,
+            locked_at=now,
+            attempts=Job.attempts + 1,
+            updated_at=now
+        )
+        .returning(Job)
+        .execution_options(synchronize_session=False, populate_existing=True)
+    )
+    job = result.scalar_one_or_none()
+    await db.commit()
+    return job
+
+
+async def _heartbeat(job_id: int, session_maker: async_sessionmaker) -> None:
+    while True:
+        await asyncio.sleep(settings.JOB_TIMEOUT / 2)
+        try:
+            async with session_maker() as session:
+                await session.execute(
+                    update(Job)
+                    .where(Job.id == job_id)
+                    .values(locked_at=datetime.utcnow())
+                    .execution_options(synchronize_session=False)
+                )
+                await session.commit()
+        except Exception:
+            logger.exception("Could not refresh lock of job %s", job_id)
+
+
+async def run_job(
+    db: AsyncSession,
+    job: Job,
+    session_maker: async_sessionmaker = async_session_maker
+) -> None:
+    # Read everything up front: a rollback below expires the instance.
+    job_id, kind, attempts = job.id, job.kind, job.attempts
+    max_attempts, payload = job.max_attempts, job.payload
+    handler, timeout = JOB_HANDLERS.get(kind, (None, None))
+
+    heartbeat = None
+    if handler is not None and (timeout is None or timeout > settings.JOB_TIMEOUT):
+        heartbeat = asyncio.create_task(_heartbeat(job_id, session_maker))
+
+    try:
+        if handler is None:
+            raise LookupError(f"No handler registered for job kind '{kind}'")
+        await asyncio.wait_for(handler(payload, db), timeout=timeout)
+    except Exception as exc:
+        await db.rollback()
+        error = f"{type(exc).__name__}: {exc}"
+
+        if attempts >= max_attempts:
+            logger.error("Job %s (%s) failed permanently: %s", job_id, kind, error)
+            values = {"status": JobStatus.FAILED}
+        else:
+            delay = backoff_delay(attempts)
+            logger.warning(
+                "Job %s (%s) failed, retrying in %.0fs: %s",
+                job_id, kind, delay, error
+            )
+            values = {
+                "status": JobStatus.PENDING,
+                "run_at": datetime.utcnow() + timedelta(seconds=delay)
+            }
+        values["last_error"] = error
+    else:
+        values = {"status": JobStatus.DONE, "last_error": None}
+    finally:
+        if heartbeat is not None:
+            heartbeat.cancel()
+
+    await db.execute(
+        update(Job)
+        .where(Job.id == job_id)
+        .values(locked_at=None, updated_at=datetime.utcnow(), **values)
+        .execution_options(synchronize_session=False)
+    )
+    await db.commit()
+
+
+class JobRunner:
+    """Pool of asyncio tasks that claim and execute jobs until stopped."""
+
+    def __init__(
+        self,
+        concurrency: int,
+        session_maker: async_sessionmaker = async_session_maker,
+        poll_interval: float = settings.JOB_POLL_INTERVAL
+    ):
+        self.concurrency = concurrency
+        self.session_maker = session_maker
+        self.poll_interval = poll_interval
+        self._tasks: list[asyncio.Task] = []
+
+    def start(self) -> None:
+        # Import handlers so they register themselves.
+        import app.core.notifications  # noqa: F401
+        import app.core.importer  # noqa: F401
+        import app.core.attachments  # noqa: F401
+
+        for _ in range(self.concurrency):
+            self._tasks.append(asyncio.create_task(self._work()))
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def run_once(self) -> bool:
+        async with self.session_maker() as session:
+            job = await claim_job(session)
+            if job is None:
+                return False
+            await run_job(session, job, self.session_maker)
+            return True
+
+    async def _work(self) -> None:
+        while True:
+            try:
+                ran = await self.run_once()
+            except Exception:
+                logger.exception("Job runner error")
+                ran = False
+            if not ran:
+                await asyncio.sleep(self.poll_interval)
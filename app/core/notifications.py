@@ -0,0 +1,97 @@
+import asyncio
+import smtplib
+import uuid
+from email.message import EmailMessage
+
+import httpx
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from app.config import settings
+from app.core.jobs import enqueue, job_handler
+from app.models.ticket import Ticket
+
+# One job per channel, so a failing channel is retried on its own and never
+# sends the other one again.
+NOTIFY_CLIENT_EMAIL = "notify_client_email"
+NOTIFY_CLIENT_SMS = "notify_client_sms"
+
+STATUS_MESSAGES = {
+    "assigned": "A technician has been assigned to your repair request.",
+    "in_progress": "Work on your repair request has started.",
+    "done": "Your repair request has been completed.",
+    "cancelled": "Your repair request has been cancelled.",
+    "new": "Your repair request has been received.",
+}
+
+
+async def notify_client(db: AsyncSession, ticket: Ticket, event: str) -> None:
+    payload = {"ticket_id": str(ticket.id), "event": event}
+    await enqueue(db, NOTIFY_CLIENT_EMAIL, payload)
+    if settings.SMS_WEBHOOK_URL:
+        await enqueue(db, NOTIFY_CLIENT_SMS, payload)
+
+
+def _send_email(to: str, subject: str, body: str) -> None:
+    message = EmailMessage()
+    message["From"] = settings.SMTP_FROM
+    message["To"] = to
+    message["Subject"] = subject
+    message.set_content(body)
+
+    with smtplib.SMTP(settings.SMTP_HOST, settings.SMTP_PORT, timeout=30) as smtp:
+        if settings.SMTP_USE_TLS:
+            smtp.starttls()
+        if settings.SMTP_USERNAME:
+            smtp.login(settings.SMTP_USERNAME, settings.SMTP_PASSWORD or "")
+        smtp.send_message(message)
+
+
+async def send_email(to: str, subject: str, body: str) -> None:
+    await asyncio.to_thread(_send_email, to, subject, body)
+
+
+async def send_sms(to: str, body: str) -> None:
+    if not settings.SMS_WEBHOOK_URL:
+        return
+    async with httpx.AsyncClient(timeout=30) as client:
+        response = await client.post(settings.SMS_WEBHOOK_URL, json={"to": to, "message": body})
+        response.raise_for_status()
+
+
+async def _load_ticket(db: AsyncSession, payload: dict) -> Ticket | None:
+    result = await db.execute(
+        select(Ticket)
+        .options(selectinload(Ticket.client), selectinload(Ticket.assigned_user))
+        .where(Ticket.id == uuid.UUID(payload["ticket_id"]))
+    )
+    return result.scalar_one_or_none()
+
+
+def _status_text(ticket: Ticket) -> str:
+    return STATUS_MESSAGES.get(ticket.status.value, f"Status: {ticket.status.value}")
+
+
+@job_handler(NOTIFY_CLIENT_EMAIL)
+async def handle_notify_client_email(payload: dict, db: AsyncSession) -> None:
+    ticket = await _load_ticket(db, payload)
+    if ticket is None:
+        return
+
+    lines = [f"Hello {ticket.client.full_name},", "", _status_text(ticket)]
+    if ticket.assigned_user and payload["event"] == "assigned":
+        lines.append(f"Your technician is {ticket.assigned_user.full_name}.")
+    lines += ["", f"Request: {ticket.title}", f"Reference: {ticket.id}"]
+    body = "\n".join(lines)
+
+    await send_email(ticket.client.email, f"Repair request update: {ticket.title}", body)
+
+
+@job_handler(NOTIFY_CLIENT_SMS)
+async def handle_notify_client_sms(payload: dict, db: AsyncSession) -> None:
+    ticket = await _load_ticket(db, payload)
+    if ticket is None:
+        return
+
+    await send_sms(ticket.client.phone, f"{_status_text(ticket)} Ref: {str(ticket.id)[:8]}")
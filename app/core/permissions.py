@@ -1,5 +1,9 @@
 from fastapi import HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
 from app.models.user import UserRole, User
+from app.core.queries import TENANT_BY_SLUG
 
 
 def check_admin_permission(current_user: User):
@@ -10,6 +14,20 @@ def check_admin_permission(current_user: User):
         )
 
 
+async def check_operator_permission(db: AsyncSession, current_user: User):
+    check_admin_permission(current_user)
+    
+    slug = settings.OPERATOR_TENANT or settings.DEFAULT_TENANT
+    result = await db.execute(TENANT_BY_SLUG, {"slug": slug})
+    operator = result.scalar_one_or_none()
+    
+    if operator is None or operator.id != current_user.tenant_id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Operator access required"
+        )
+
+
 def check_worker_or_admin_permission(current_user: User):
     if current_user.role not in [UserRole.ADMIN, UserRole.WORKER]:
         raise HTTPException(
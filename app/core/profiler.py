@@ -0,0 +1,174 @@
+import json
+import logging
+import random
+import time
+import uuid
+from collections import deque
+from contextvars import ContextVar
+from datetime import datetime
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.config import settings
+from app.core.tenancy import executing_tenant
+
+logger = logging.getLogger("app.sql.slow")
+
+CHANNEL = "sql_profiler"
+MAX_STATEMENT_LENGTH = 2000
+
+current_route: ContextVar[str | None] = ContextVar("current_route", default=None)
+
+
+def _describe_value(value):
+    # Values end up in logs and in the admin API; strings may be names,
+    # emails, phone numbers or secrets, so only their type and size are kept.
+    if value is None or isinstance(value, (bool, int, float, uuid.UUID)):
+        return value
+    if isinstance(value, (str, bytes, bytearray, memoryview)):
+        return f"<{type(value).__name__} len={len(value)}>"
+    return f"<{type(value).__name__}>"
+
+
+def sanitize_parameters(parameters):
+    """Replace parameter values by their type and length.
+
+    Numbers, booleans, None and UUIDs (ids) are kept as they are.
+    """
+    if isinstance(parameters, dict):
+        return {key: sanitize_parameters(value) for key, value in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        return [sanitize_parameters(value) for value in parameters]
+    return _describe_value(parameters)
+
+
+class SQLProfiler:
+    """Logs statements slower than a threshold, optionally with their plan.
+
+    Hooks ``before/after_cursor_execute`` on an engine. When disabled the
+    hooks return immediately, so it is cheap to leave attached.
+    """
+
+    def __init__(self, enabled: bool, threshold_ms: float, explain_sample_rate: float):
+        self.enabled = enabled
+        self.threshold_ms = threshold_ms
+        self.explain_sample_rate = explain_sample_rate
+        self.recent: deque[dict] = deque(maxlen=100)
+
+    def entries(self, tenant_id) -> list[dict]:
+        """Recorded slow queries of one tenant, newest first."""
+        return [entry for entry in reversed(self.recent) if entry["tenant_id"] == tenant_id]
+
+    def clear(self, tenant_id) -> None:
+        kept = [entry for entry in self.recent if entry["tenant_id"] != tenant_id]
+        self.recent.clear()
+        self.recent.extend(kept)
+
+    def config(self) -> dict:
+        return {
+            "enabled": self.enabled,
+            "threshold_ms": self.threshold_ms,
+            "explain_sample_rate": self.explain_sample_rate,
+        }
+
+    def configure(self, **changes) -> None:
+        for key, value in changes.items():
+            if key in ("enabled", "threshold_ms", "explain_sample_rate") and value is not None:
+                setattr(self, key, value)
+
+    def apply_config(self, payload: str) -> None:
+        self.configure(**json.loads(payload))
+
+    def attach(self, engine: Engine) -> None:
+        event.listen(engine, "before_cursor_execute", self._before)
+        event.listen(engine, "after_cursor_execute", self._after)
+
+    def _before(self, conn, cursor, statement, parameters, context, executemany):
+        if self.enabled:
+            conn.info.setdefault("profiler_start", []).append(time.perf_counter())
+
+    def _after(self, conn, cursor, statement, parameters, context, executemany):
+        starts = conn.info.get("profiler_start")
+        if not starts:
+            return
+        duration_ms = (time.perf_counter() - starts.pop()) * 1000
+
+        if not self.enabled or duration_ms < self.threshold_ms:
+            return
+
+        entry = {
+            "at": datetime.utcnow().isoformat(),
+            "duration_ms": round(duration_ms, 2),
+            "route": current_route.get(),
+            "tenant_id": executing_tenant(),
+            "statement": statement[:MAX_STATEMENT_LENGTH],
+            "parameters": sanitize_parameters(parameters),
+            "plan": None,
+        }
+
+        if (
+            not executemany
+            and statement.lstrip()[:6].upper() == "SELECT"
+            and random.random() < self.explain_sample_rate
+        ):
+            entry["plan"] = self._explain(conn, statement, parameters)
+
+        self.recent.append(entry)
+        logger.warning(
+            "Slow query %.1fms route=%s: %s params=%s",
+            entry["duration_ms"],
+            entry["route"],
+            entry["statement"],
+            entry["parameters"]
+        )
+        if entry["plan"]:
+            logger.warning("Plan:\n%s", entry["plan"])
+
+    def _explain(self, conn, statement: str, parameters) -> str | None:
+        # A raw DBAPI cursor does not fire engine events, so this cannot
+        # recurse. Plain EXPLAIN only plans the statement: ANALYZE would run
+        # it a second time, including its locks and function calls. The
+        # savepoint keeps a failing EXPLAIN from aborting the request's
+        # transaction.
+        cursor = conn.connection.dbapi_connection.cursor()
+        try:
+            cursor.execute("SAVEPOINT sql_profiler_explain")
+            try:
+                cursor.execute(f"EXPLAIN {statement}", parameters)
+                plan = "\n".join(row[0] for row in cursor.fetchall())
+                cursor.execute("RELEASE SAVEPOINT sql_profiler_explain")
+                return plan
+            except Exception:
+                cursor.execute("ROLLBACK TO SAVEPOINT sql_profiler_explain")
+                raise
+        except Exception as exc:
+            logger.info("Could not capture plan: %s", exc)
+            return None
+        finally:
+            cursor.close()
+
+
+sql_profiler = SQLProfiler(
+    settings.SQL_PROFILER_ENABLED,
+    settings.SQL_SLOW_QUERY_MS,
+    settings.SQL_EXPLAIN_SAMPLE_RATE
+)
+
+
+class RouteContextMiddleware:
+    """Records the current request's method and path for the SQL profiler."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        token = current_route.set(f"{scope['method']} {scope['path']}")
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            current_route.reset(token)
@@ -0,0 +1,88 @@
+import asyncio
+import logging
+from typing import Callable
+
+import asyncpg
+from sqlalchemy import select, func
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+async def publish(db: AsyncSession, channel: str, payload: str) -> None:
+    """Queue a notification for every worker process.
+
+    Postgres delivers it once the caller's transaction commits.
+    """
+    await db.execute(select(func.pg_notify(channel, payload)))
+
+
+class NotificationListener:
+    """Dispatches Postgres LISTEN/NOTIFY messages to per-channel callbacks.
+
+    Uses one dedicated connection per process, outside the SQLAlchemy pool.
+    ``on_reconnect`` callbacks run whenever the connection is (re)established,
+    since anything published while disconnected is lost.
+    """
+
+    def __init__(self):
+        self._callbacks: dict[str, Callable[[str], None]] = {}
+        self._on_reconnect: list[Callable[[], None]] = []
+        self._task: asyncio.Task | None = None
+
+    def subscribe(
+        self,
+        channel: str,
+        callback: Callable[[str], None],
+        on_reconnect: Callable[[], None] | None = None
+    ) -> None:
+        self._callbacks[channel] = callback
+        if on_reconnect is not None:
+            self._on_reconnect.append(on_reconnect)
+
+    def start(self) -> None:
+        if self._callbacks and self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def _dispatch(self, connection, pid, channel: str, payload: str) -> None:
+        try:
+            self._callbacks[channel](payload)
+        except Exception:
+            logger.exception("Error handling notification on %s", channel)
+
+    async def _run(self) -> None:
+        dsn = make_url(settings.DATABASE_URL).set(drivername="postgresql")
+        delay = 1
+        while True:
+            try:
+                conn = await asyncpg.connect(dsn.render_as_string(hide_password=False))
+            except (OSError, asyncpg.PostgresError) as exc:
+                logger.warning("Notification listener cannot connect: %s", exc)
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, 30)
+                continue
+
+            lost = asyncio.Event()
+            conn.add_termination_listener(lambda c: lost.set())
+            try:
+                for channel in self._callbacks:
+                    await conn.add_listener(channel, self._dispatch)
+                for callback in self._on_reconnect:
+                    callback()
+                delay = 1
+                await lost.wait()
+                logger.warning("Notification listener connection lost, reconnecting")
+            finally:
+                await conn.close()
@@ -0,0 +1,167 @@
+from functools import lru_cache
+
+from sqlalchemy import BigInteger, Text, select, func, bindparam, cast, exists, false, literal_column, true, tuple_, union_all
+from sqlalchemy.orm import selectinload
+
+from app.models.tenant import Tenant
+from app.models.ticket import Ticket, TicketRemoval, TicketStatus, OPEN_STATUSES
+from app.models.user import User
+
+# Statements for the hot request paths are built once and reused. Every
+# variable part is a named bind parameter, so the statement object (and its
+# memoized cache key) is shared between requests and SQLAlchemy's compiled
+# cache is hit without rebuilding the expression tree each time.
+
+TENANT_BY_SLUG = select(Tenant).where(Tenant.slug == bindparam("slug"))
+
+# Filters by tenant explicitly so it is also safe on unscoped sessions.
+USER_BY_EMAIL = select(User).where(
+    User.tenant_id == bindparam("tenant_id"),
+    User.email == bindparam("email")
+)
+
+USERS_BY_IDS = select(User).where(User.id.in_(bindparam("user_ids", expanding=True)))
+
+TICKET_BY_ID = (
+    select(Ticket)
+    .options(selectinload(Ticket.client), selectinload(Ticket.assigned_user))
+    .where(Ticket.id == bindparam("ticket_id"))
+)
+
+TICKETS_BY_IDS = (
+    select(Ticket)
+    .options(selectinload(Ticket.client), selectinload(Ticket.assigned_user))
+    .where(Ticket.id.in_(bindparam("ticket_ids", expanding=True)))
+)
+
+
+def _worker_changes():
+    after = tuple_(
+        bindparam("after_version", type_=BigInteger),
+        bindparam("after_id", type_=Ticket.id.type)
+    )
+    changed = select(
+        Ticket.sync_version.label("sync_version"),
+        Ticket.id.label("ticket_id"),
+        false().label("removed")
+    ).where(
+        Ticket.tenant_id == bindparam("tenant_id"),
+        Ticket.assigned_to == bindparam("worker_id"),
+        tuple_(Ticket.sync_version, Ticket.id) > after
+    )
+    # A ticket that came back to the worker is sent as a change instead.
+    removed = select(
+        TicketRemoval.sync_version,
+        TicketRemoval.ticket_id,
+        true()
+    ).where(
+        TicketRemoval.tenant_id == bindparam("tenant_id"),
+        TicketRemoval.worker_id == bindparam("worker_id"),
+        tuple_(TicketRemoval.sync_version, TicketRemoval.ticket_id) > after,
+        TicketRemoval.sync_version >= bindparam("removed_since", type_=BigInteger),
+        ~exists().where(
+            Ticket.id == TicketRemoval.ticket_id,
+            Ticket.assigned_to == bindparam("worker_id")
+        )
+    )
+    changes = union_all(changed, removed)
+    changes = (
+        changes.order_by(changes.selected_columns.sync_version, changes.selected_columns.ticket_id)
+        .limit(bindparam("limit"))
+        .subquery()
+    )
+    # Read in the same statement, so with the same snapshot, as the changes.
+    xmin = func.pg_snapshot_xmin(func.pg_current_snapshot())
+    snapshot = select(cast(cast(xmin, Text), BigInteger).label("xmin")).subquery()
+    return select(
+        snapshot.c.xmin,
+        changes.c.sync_version,
+        changes.c.ticket_id,
+        changes.c.removed
+    ).select_from(snapshot.outerjoin(changes, true()))
+
+
+# One row per changed or removed ticket after the cursor, or a single row
+# with only the xmin when the device is up to date.
+WORKER_CHANGES = _worker_changes()
+
+# A client's recent open tickets, the candidates for merging a new request.
+# Locked so concurrent resubmissions are merged one after the other.
+OPEN_CLIENT_TICKETS = (
+    select(Ticket)
+    .where(
+        Ticket.client_id == bindparam("client_id"),
+        Ticket.status.in_(OPEN_STATUSES),
+        Ticket.created_at >= bindparam("since")
+    )
+    .order_by(Ticket.created_at.desc())
+    .limit(bindparam("limit"))
+    .with_for_update()
+)
+
+
+# Next ticket for a worker to take, following ix_tickets_claim_queue.
+# Tickets locked by a concurrent claim are skipped rather than waited for,
+# so claims never queue behind each other or hand out the same ticket.
+# The status is a literal, not a parameter: a generic plan of the prepared
+# statement can only use the partial index if its predicate is in the SQL.
+NEXT_CLAIMABLE_TICKET = (
+    select(Ticket)
+    .where(
+        Ticket.status == literal_column(f"'{TicketStatus.NEW.name}'"),
+        Ticket.assigned_to.is_(None)
+    )
+    .order_by(
+        Ticket.priority.desc(),
+        Ticket.due_at.asc().nulls_last(),
+        Ticket.created_at
+    )
+    .limit(1)
+    .with_for_update(skip_locked=True)
+)
+
+
+def _ticket_filters(query, by_worker: bool, by_status: bool, by_search: bool):
+    if by_worker:
+        query = query.where(Ticket.assigned_to == bindparam("worker_id"))
+    if by_status:
+        query = query.where(Ticket.status == bindparam("status"))
+    if by_search:
+        query = query.where(Ticket.title.ilike(bindparam("search")))
+    return query
+
+
+@lru_cache(maxsize=None)
+def ticket_count_query(by_worker: bool, by_status: bool, by_search: bool):
+    query = select(func.count()).select_from(Ticket)
+    return _ticket_filters(query, by_worker, by_status, by_search)
+
+
+@lru_cache(maxsize=None)
+def ticket_page_query(by_worker: bool, by_status: bool, by_search: bool):
+    query = select(Ticket).options(
+        selectinload(Ticket.client),
+        selectinload(Ticket.assigned_user)
+    )
+    query = _ticket_filters(query, by_worker, by_status, by_search)
+    return (
+        query.order_by(Ticket.created_at.desc())
+        .limit(bindparam("limit"))
+        .offset(bindparam("offset"))
+    )
+
+
+def ticket_list_params(
+    worker_id=None,
+    status=None,
+    search: str | None = None
+) -> tuple[tuple[bool, bool, bool], dict]:
+    params = {}
+    if worker_id is not None:
+        params["worker_id"] = worker_id
+    if status:
+        params["status"] = status
+    if search:
+        params["search"] = f"%{search}%"
+    key = ("worker_id" in params, "status" in params, "search" in params)
+    return key, params
@@ -0,0 +1,215 @@
+import asyncio
+import logging
+import uuid
+from datetime import date, datetime, time
+
+from sqlalchemy import select, delete, insert, event, func, cast, inspect, literal, null, union_all, Date
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.database import async_session_maker
+from app.core.tenancy import ALL_TENANTS, TENANT_KEY
+from app.models.report import TicketDailyStats, TicketDailyStatsDirty
+from app.models.ticket import Ticket
+from app.models.user import User
+
+logger = logging.getLogger(__name__)
+
+# Arbitrary constant identifying the rollup refresh advisory lock.
+REFRESH_LOCK_ID = 320_001
+
+
+def _events(start: date, end: date | None = None, tenant_id=None):
+    def event(column, worker, created, assigned, completed):
+        query = select(
+            Ticket.tenant_id.label("tenant_id"),
+            cast(column, Date).label("day"),
+            worker.label("worker_id"),
+            literal(created).label("created"),
+            literal(assigned).label("assigned"),
+            literal(completed).label("completed")
+        ).where(column >= datetime.combine(start, time.min))
+        if end is not None:
+            query = query.where(column < datetime.combine(end, time.min))
+        if tenant_id is not None:
+            query = query.where(Ticket.tenant_id == tenant_id)
+        return query
+
+    return union_all(
+        event(Ticket.created_at, cast(null(), UUID(as_uuid=True)), 1, 0, 0),
+        event(Ticket.assigned_at, Ticket.assigned_to, 0, 1, 0),
+        event(Ticket.completed_at, Ticket.assigned_to, 0, 0, 1)
+    ).subquery()
+
+
+async def _rebuild(db: AsyncSession, start: date, end: date | None = None, tenant_id=None) -> None:
+    """Recompute the buckets from ``start`` up to ``end`` (exclusive)."""
+    unscoped = {ALL_TENANTS: True}
+
+    stale = delete(TicketDailyStats).where(TicketDailyStats.day >= start)
+    if end is not None:
+        stale = stale.where(TicketDailyStats.day < end)
+    if tenant_id is not None:
+        stale = stale.where(TicketDailyStats.tenant_id == tenant_id)
+    await db.execute(stale, execution_options=unscoped)
+
+    events = _events(start, end, tenant_id)
+    await db.execute(
+        insert(TicketDailyStats).from_select(
+            ["tenant_id", "day", "worker_id", "created", "assigned", "completed"],
+            select(
+                events.c.tenant_id,
+                events.c.day,
+                events.c.worker_id,
+                func.sum(events.c.created),
+                func.sum(events.c.assigned),
+                func.sum(events.c.completed)
+            ).group_by(events.c.tenant_id, events.c.day, events.c.worker_id)
+        ),
+        execution_options=unscoped
+    )
+
+
+async def refresh_rollup(
+    db: AsyncSession,
+    full: bool = False,
+    tenant_id: uuid.UUID | None = None
+) -> date | None:
+    """Bring the daily rollup up to date.
+
+    Buckets on or after the newest stored day are always rebuilt, so a
+    refresh scans the recent part of the ticket timestamp indexes. Tenants
+    whose tickets changed on earlier days (reassignments, backdated
+    timestamps, deletions) are also rebuilt from the earliest such day.
+    Covers all tenants, even on a tenant-scoped session, unless
+    ``tenant_id`` is given. Returns the first day rebuilt, or None if
+    another process holds the refresh lock.
+    """
+    locked = await db.scalar(select(func.pg_try_advisory_xact_lock(REFRESH_LOCK_ID)))
+    if not locked:
+        return None
+
+    unscoped = {ALL_TENANTS: True}
+
+    # Consume exactly the markers this refresh covers; ones committed later
+    # stay for the next refresh.
+    consumed = delete(TicketDailyStatsDirty).returning(
+        TicketDailyStatsDirty.tenant_id,
+        TicketDailyStatsDirty.day
+    )
+    latest = select(func.max(TicketDailyStats.day))
+    if tenant_id is not None:
+        consumed = consumed.where(TicketDailyStatsDirty.tenant_id == tenant_id)
+        latest = latest.where(TicketDailyStats.tenant_id == tenant_id)
+
+    dirty: dict = {}
+    for dirty_tenant, day in await db.execute(consumed, execution_options=unscoped):
+        dirty[dirty_tenant] = min(day, dirty.get(dirty_tenant, day))
+
+    start_day = None if full else await db.scalar(latest, execution_options=unscoped)
+    if start_day is None:
+        start_day = date.min
+
+    await _rebuild(db, start_day, tenant_id=tenant_id)
+    first_day = start_day
+    for dirty_tenant, day in dirty.items():
+        if day < start_day:
+            await _rebuild(db, day, start_day, dirty_tenant)
+            first_day = min(first_day, day)
+    await db.commit()
+
+    return first_day
+
+
+@event.listens_for(Session, "before_flush")
+def _record_dirty_days(session: Session, flush_context, instances) -> None:
+    # Counters of today are always rebuilt; only earlier days need a marker.
+    today = datetime.utcnow().date()
+    earliest: dict = {}
+
+    def touch(tenant_id, *values) -> None:
+        tenant_id = tenant_id or session.info.get(TENANT_KEY)
+        for value in values:
+            if value is not None and value.date() < today:
+                day = value.date()
+                earliest[tenant_id] = min(day, earliest.get(tenant_id, day))
+
+    for ticket in (*session.new, *session.deleted):
+        if isinstance(ticket, Ticket):
+            touch(ticket.tenant_id, ticket.created_at, ticket.assigned_at, ticket.completed_at)
+
+    for ticket in session.dirty:
+        if not isinstance(ticket, Ticket):
+            continue
+        attrs = inspect(ticket).attrs
+        reassigned = attrs.assigned_to.history.has_changes()
+        for name in ("created_at", "assigned_at", "completed_at"):
+            history = attrs[name].history
+            if history.has_changes():
+                touch(ticket.tenant_id, *history.deleted, *history.added)
+            elif reassigned and name != "created_at":
+                # Assigned and completed counts move to the new assignee.
+                touch(ticket.tenant_id, attrs[name].value)
+
+    for tenant_id, day in earliest.items():
+        if tenant_id is not None:
+            session.add(TicketDailyStatsDirty(tenant_id=tenant_id, day=day))
+
+
+async def refresh_periodically(interval: int) -> None:
+    while True:
+        try:
+            async with async_session_maker() as session:
+                await refresh_rollup(session)
+        except Exception:
+            logger.exception("Report rollup refresh failed")
+        await asyncio.sleep(interval)
+
+
+async def ticket_series(db: AsyncSession, start: date, end: date, interval: str) -> list[dict]:
+    if interval == "week":
+        period = cast(func.date_trunc("week", TicketDailyStats.day), Date)
+    else:
+        period = TicketDailyStats.day
+
+    result = await db.execute(
+        select(
+            period.label("period"),
+            func.sum(TicketDailyStats.created).label("created"),
+            func.sum(TicketDailyStats.assigned).label("assigned"),
+            func.sum(TicketDailyStats.completed).label("completed")
+        )
+        .where(TicketDailyStats.day.between(start, end))
+        .group_by(period)
+        .order_by(period)
+    )
+    return [dict(row._mapping) for row in result]
+
+
+async def worker_summary(db: AsyncSession, start: date, end: date) -> list[dict]:
+    assigned = func.sum(TicketDailyStats.assigned)
+    completed = func.sum(TicketDailyStats.completed)
+
+    result = await db.execute(
+        select(
+            User.id.label("worker_id"),
+            User.full_name,
+            User.email,
+            assigned.label("assigned"),
+            completed.label("completed")
+        )
+        .join(User, User.id == TicketDailyStats.worker_id)
+        .where(TicketDailyStats.day.between(start, end))
+        .group_by(User.id, User.full_name, User.email)
+        .order_by(completed.desc(), User.full_name)
+    )
+
+    rows = []
+    for row in result:
+        item = dict(row._mapping)
+        item["completion_rate"] = (
+            round(item["completed"] / item["assigned"], 4) if item["assigned"] else None
+        )
+        rows.append(item)
+    return rows
@@ -0,0 +1,410 @@
+import abc
+import asyncio
+import hashlib
+import logging
+import os
+import xml.etree.ElementTree as ET
+from pathlib import Path
+from typing import AsyncIterator
+from urllib.parse import quote
+
+import httpx
+from fastapi import status
+from fastapi.responses import FileResponse, RedirectResponse, Response
+from starlette.types import Receive, Scope, Send
+
+from app.config import settings
+from app.utils.http_range import RangeNotSatisfiable, parse_range
+from app.utils.sigv4 import EMPTY_PAYLOAD, UNSIGNED_PAYLOAD, presign_url, sign_request
+
+logger = logging.getLogger(__name__)
+
+CHUNK_SIZE = 1024 * 1024
+
+
+def content_disposition(filename: str) -> str:
+    return f"inline; filename*=utf-8''{quote(filename)}"
+
+
+class Storage(abc.ABC):
+    """Where attachment files are kept.
+
+    Keys are URL-safe relative paths such as ``<tenant>/<ticket>/<attachment>``.
+    Files are written from an async iterator of chunks, so no backend ever
+    holds a whole upload in memory.
+    """
+
+    @abc.abstractmethod
+    async def save(self, key: str, chunks: AsyncIterator[bytes], content_type: str) -> int:
+        """Store the chunks under ``key`` and return the number of bytes."""
+
+    @abc.abstractmethod
+    async def read(self, key: str) -> bytes:
+        """The whole file; only for files known to be small."""
+
+    @abc.abstractmethod
+    def stream(self, key: str) -> AsyncIterator[bytes]:
+        """The file's content in chunks, for files too large to read at once."""
+
+    @abc.abstractmethod
+    async def delete(self, key: str) -> None:
+        """Remove the file; missing files are ignored."""
+
+    @abc.abstractmethod
+    async def download(
+        self,
+        key: str,
+        filename: str,
+        content_type: str,
+        range_header: str | None = None
+    ) -> Response:
+        """Response serving the file, honouring a single-range ``Range``."""
+
+
+async def _read_file(path: Path, start: int, length: int) -> AsyncIterator[bytes]:
+    with open(path, "rb") as file:
+        await asyncio.to_thread(file.seek, start)
+        while length > 0:
+            chunk = await asyncio.to_thread(file.read, min(CHUNK_SIZE, length))
+            if not chunk:
+                break
+            length -= len(chunk)
+            yield chunk
+
+
+class FileRangeResponse(FileResponse):
+    """FileResponse for one byte range of the file.
+
+    The FileResponse of the Starlette version FastAPI pins ignores ``Range``,
+    and uvicorn offers no sendfile extension, so the range is read here: the
+    headers (ETag, Last-Modified) come from FileResponse, and each thread
+    hop reads CHUNK_SIZE bytes, 16 times what FileResponse reads per hop.
+    """
+
+    def __init__(self, path: Path, start: int, end: int, stat_result: os.stat_result, **kwargs):
+        super().__init__(
+            path,
+            status_code=status.HTTP_206_PARTIAL_CONTENT,
+            stat_result=stat_result,
+            **kwargs
+        )
+        self.start = start
+        self.end = end
+        self.headers["content-range"] = f"bytes {start}-{end}/{stat_result.st_size}"
+        self.headers["content-length"] = str(end - start + 1)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await send({
+            "type": "http.response.start",
+            "status": self.status_code,
+            "headers": self.raw_headers,
+        })
+        if scope["method"].upper() == "HEAD":
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+        else:
+            remaining = self.end - self.start + 1
+            async for chunk in _read_file(self.path, self.start, remaining):
+                remaining -= len(chunk)
+                await send({"type": "http.response.body", "body": chunk, "more_body": remaining > 0})
+            if remaining > 0:
+                # The file shrank while it was being sent.
+                await send({"type": "http.response.body", "body": b"", "more_body": False})
+        if self.background is not None:
+            await self.background()
+
+
+class LocalStorage(Storage):
+    def __init__(self, root: str):
+        self.root = Path(root)
+
+    def _path(self, key: str) -> Path:
+        return self.root / key
+
+    async def save(self, key: str, chunks: AsyncIterator[bytes], content_type: str) -> int:
+        path = self._path(key)
+        partial = path.with_name(path.name + ".part")
+        await asyncio.to_thread(path.parent.mkdir, parents=True, exist_ok=True)
+
+        size = 0
+        try:
+            with open(partial, "wb") as file:
+                async for chunk in chunks:
+                    if chunk:
+                        await asyncio.to_thread(file.write, chunk)
+                        size += len(chunk)
+            await asyncio.to_thread(os.replace, partial, path)
+        except BaseException:
+            partial.unlink(missing_ok=True)
+            raise
+
+        return size
+
+    async def read(self, key: str) -> bytes:
+        return await asyncio.to_thread(self._path(key).read_bytes)
+
+    async def stream(self, key: str) -> AsyncIterator[bytes]:
+        path = self._path(key)
+        stat = await asyncio.to_thread(os.stat, path)
+        async for chunk in _read_file(path, 0, stat.st_size):
+            yield chunk
+
+    async def delete(self, key: str) -> None:
+        await asyncio.to_thread(self._path(key).unlink, missing_ok=True)
+
+    async def download(
+        self,
+        key: str,
+        filename: str,
+        content_type: str,
+        range_header: str | None = None
+    ) -> Response:
+        path = self._path(key)
+        stat = await asyncio.to_thread(os.stat, path)
+        headers = {
+            "Accept-Ranges": "bytes",
+            "Content-Disposition": content_disposition(filename),
+        }
+
+        try:
+            byte_range = parse_range(range_header, stat.st_size)
+        except RangeNotSatisfiable:
+            return Response(
+                status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+                headers={"Content-Range": f"bytes */{stat.st_size}"}
+            )
+
+        if byte_range is None:
+            return FileResponse(path, media_type=content_type, headers=headers, stat_result=stat)
+
+        start, end = byte_range
+        return FileRangeResponse(
+            path,
+            start,
+            end,
+            stat,
+            media_type=content_type,
+            headers=headers
+        )
+
+
+class S3Storage(Storage):
+    """Any S3-compatible object store (AWS S3, MinIO).
+
+    Uploads larger than ``part_size`` use a multipart upload, so at most one
+    part is buffered. Downloads redirect to a presigned URL: file bytes and
+    Range requests are served by the store, not by the API.
+    """
+
+    def __init__(
+        self,
+        endpoint_url: str,
+        bucket: str,
+        region: str,
+        access_key: str,
+        secret_key: str,
+        public_url: str | None = None,
+        part_size: int = 8 * 1024 * 1024,
+        url_expires: int = 300
+    ):
+        self.endpoint_url = endpoint_url.rstrip("/")
+        self.public_url = (public_url or endpoint_url).rstrip("/")
+        self.bucket = bucket
+        self.region = region
+        self.access_key = access_key
+        self.secret_key = secret_key
+        self.part_size = part_size
+        self.url_expires = url_expires
+
+    async def _request(
+        self,
+        client: httpx.AsyncClient,
+        method: str,
+        key: str,
+        query: dict[str, str] | None = None,
+        headers: dict[str, str] | None = None,
+        content: bytes | None = None,
+        payload_hash: str = UNSIGNED_PAYLOAD
+    ) -> httpx.Response:
+        url = f"{self.endpoint_url}/{self.bucket}/{key}"
+        signed = sign_request(
+            method,
+            url,
+            query or {},
+            headers or {},
+            self.access_key,
+            self.secret_key,
+            self.region,
+            payload_hash=payload_hash
+        )
+        response = await client.request(method, url, params=query, headers=signed, content=content)
+        response.raise_for_status()
+        return response
+
+    async def _upload_part(
+        self,
+        client: httpx.AsyncClient,
+        key: str,
+        upload_id: str,
+        number: int,
+        data: bytes
+    ) -> tuple[int, str]:
+        response = await self._request(
+            client,
+            "PUT",
+            key,
+            {"partNumber": str(number), "uploadId": upload_id},
+            content=data
+        )
+        return number, response.headers["ETag"]
+
+    async def _complete(
+        self,
+        client: httpx.AsyncClient,
+        key: str,
+        upload_id: str,
+        parts: list[tuple[int, str]]
+    ) -> None:
+        root = ET.Element("CompleteMultipartUpload")
+        for number, etag in parts:
+            part = ET.SubElement(root, "Part")
+            ET.SubElement(part, "PartNumber").text = str(number)
+            ET.SubElement(part, "ETag").text = etag
+        body = ET.tostring(root)
+
+        response = await self._request(
+            client,
+            "POST",
+            key,
+            {"uploadId": upload_id},
+            content=body,
+            payload_hash=hashlib.sha256(body).hexdigest()
+        )
+        # S3 may report a failed completion in the body of a 200 response.
+        if response.content and ET.fromstring(response.content).tag.endswith("Error"):
+            raise RuntimeError(f"Could not complete upload of {key}: {response.text}")
+
+    async def save(self, key: str, chunks: AsyncIterator[bytes], content_type: str) -> int:
+        async with httpx.AsyncClient(timeout=60) as client:
+            buffer = bytearray()
+            size = 0
+            upload_id = None
+            parts: list[tuple[int, str]] = []
+
+            try:
+                async for chunk in chunks:
+                    buffer += chunk
+                    size += len(chunk)
+                    if len(buffer) < self.part_size:
+                        continue
+
+                    if upload_id is None:
+                        response = await self._request(
+                            client,
+                            "POST",
+                            key,
+                            {"uploads": ""},
+                            headers={"Content-Type": content_type},
+                            payload_hash=EMPTY_PAYLOAD
+                        )
+                        upload_id = _find(response.content, "UploadId")
+                    parts.append(
+                        await self._upload_part(client, key, upload_id, len(parts) + 1, bytes(buffer))
+                    )
+                    buffer.clear()
+
+                if upload_id is None:
+                    await self._request(
+                        client,
+                        "PUT",
+                        key,
+                        headers={"Content-Type": content_type},
+                        content=bytes(buffer)
+                    )
+                else:
+                    if buffer:
+                        parts.append(
+                            await self._upload_part(client, key, upload_id, len(parts) + 1, bytes(buffer))
+                        )
+                    await self._complete(client, key, upload_id, parts)
+            except BaseException:
+                if upload_id is not None:
+                    try:
+                        await self._request(client, "DELETE", key, {"uploadId": upload_id})
+                    except Exception:
+                        logger.exception("Could not abort upload of %s", key)
+                raise
+
+        return size
+
+    async def read(self, key: str) -> bytes:
+        async with httpx.AsyncClient(timeout=60) as client:
+            response = await self._request(client, "GET", key, payload_hash=EMPTY_PAYLOAD)
+            return response.content
+
+    async def stream(self, key: str) -> AsyncIterator[bytes]:
+        url = f"{self.endpoint_url}/{self.bucket}/{key}"
+        headers = sign_request(
+            "GET",
+            url,
+            {},
+            {},
+            self.access_key,
+            self.secret_key,
+            self.region,
+            payload_hash=EMPTY_PAYLOAD
+        )
+        async with httpx.AsyncClient(timeout=60) as client:
+            async with client.stream("GET", url, headers=headers) as response:
+                response.raise_for_status()
+                async for chunk in response.aiter_bytes(CHUNK_SIZE):
+                    yield chunk
+
+    async def delete(self, key: str) -> None:
+        async with httpx.AsyncClient(timeout=60) as client:
+            await self._request(client, "DELETE", key, payload_hash=EMPTY_PAYLOAD)
+
+    async def download(
+        self,
+        key: str,
+        filename: str,
+        content_type: str,
+        range_header: str | None = None
+    ) -> Response:
+        url = presign_url(
+            "GET",
+            f"{self.public_url}/{self.bucket}/{key}",
+            self.access_key,
+            self.secret_key,
+            self.region,
+            self.url_expires,
+            query={
+                "response-content-disposition": content_disposition(filename),
+                "response-content-type": content_type,
+            }
+        )
+        return RedirectResponse(url, status_code=status.HTTP_307_TEMPORARY_REDIRECT)
+
+
+def _find(document: bytes, tag: str) -> str:
+    for element in ET.fromstring(document).iter():
+        if element.tag.rsplit("}", 1)[-1] == tag:
+            return element.text or ""
+    raise RuntimeError(f"No {tag} in S3 response")
+
+
+def _create_storage() -> Storage:
+    if settings.ATTACHMENT_STORAGE == "local":
+        return LocalStorage(settings.ATTACHMENT_DIR)
+    if settings.ATTACHMENT_STORAGE == "s3":
+        return S3Storage(
+            settings.S3_ENDPOINT_URL,
+            settings.S3_BUCKET,
+            settings.S3_REGION,
+            settings.S3_ACCESS_KEY,
+            settings.S3_SECRET_KEY,
+            public_url=settings.S3_PUBLIC_URL
+        )
+    raise ValueError(f"Unknown ATTACHMENT_STORAGE '{settings.ATTACHMENT_STORAGE}'")
+
+
+storage = _create_storage()
@@ -0,0 +1,131 @@
+import asyncio
+import logging
+import time
+import uuid
+from datetime import datetime, timedelta
+from typing import NamedTuple
+
+from sqlalchemy import delete, event, inspect
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database import async_session_maker
+from app.models.ticket import Ticket, TicketRemoval
+
+logger = logging.getLogger(__name__)
+
+# Sync tokens are the xmin of the snapshot the changes were read with: every
+# transaction below it had finished, so its changes were either sent or are
+# older than the previous token. Transactions at or above it may commit
+# later and are picked up by the next sync. Devices may see a change twice,
+# never miss one.
+#
+# A token is "<xmin>.<issued>", or "<xmin>.<issued>:<removed_since>:
+# <sync_version>:<ticket_id>" while a large delta is being paged through.
+# Removals are only sent from removed_since on: the token the device
+# started from, or for a first sync, the xmin of its first page. Removals
+# older than that concern tickets the device never had.
+#
+# Removals are kept for SYNC_TOKEN_TTL_DAYS plus a day, so tokens expire
+# after SYNC_TOKEN_TTL_DAYS and the device starts over without one.
+
+START = (0, uuid.UUID(int=0))
+
+# Sent as removed_since on a first sync's first page: no removals at all.
+NO_REMOVALS = 2**63 - 1
+
+
+class InvalidSyncToken(ValueError):
+    pass
+
+
+class ExpiredSyncToken(InvalidSyncToken):
+    pass
+
+
+class SyncToken(NamedTuple):
+    # The token to finish with while paging, None once complete.
+    resume_from: int | None
+    # The (sync_version, ticket_id) position to continue after.
+    cursor: tuple[int, uuid.UUID]
+    removed_since: int
+    # When the xmin the token finishes with was read, in Unix seconds.
+    issued_at: int
+
+
+def encode_token(
+    resume_from: int,
+    issued_at: int,
+    cursor: tuple[int, uuid.UUID] | None = None,
+    removed_since: int | None = None
+) -> str:
+    if cursor is None:
+        return f"{resume_from}.{issued_at}"
+    version, ticket_id = cursor
+    return f"{resume_from}.{issued_at}:{removed_since}:{version}:{ticket_id.hex}"
+
+
+def decode_token(token: str) -> SyncToken:
+    try:
+        parts = token.split(":")
+        xmin, issued_at = (int(part) for part in parts[0].split("."))
+        if len(parts) == 1:
+            sync_token = SyncToken(None, (xmin, START[1]), xmin, issued_at)
+        elif len(parts) == 4:
+            cursor = (int(parts[2]), uuid.UUID(hex=parts[3]))
+            sync_token = SyncToken(xmin, cursor, int(parts[1]), issued_at)
+        else:
+            raise InvalidSyncToken(token)
+    except ValueError:
+        raise InvalidSyncToken(token)
+
+    ttl = timedelta(days=settings.SYNC_TOKEN_TTL_DAYS).total_seconds()
+    if sync_token.issued_at < time.time() - ttl:
+        raise ExpiredSyncToken(token)
+    return sync_token
+
+
+async def purge_removals(db: AsyncSession) -> int:
+    """Deletes removals that no unexpired token can still ask for."""
+    # The extra day covers transactions that were running when the oldest
+    # token's xmin was read.
+    expired_before = datetime.utcnow() - timedelta(days=settings.SYNC_TOKEN_TTL_DAYS + 1)
+    result = await db.execute(
+        delete(TicketRemoval).where(TicketRemoval.created_at < expired_before)
+    )
+    await db.commit()
+    return result.rowcount
+
+
+async def purge_periodically(interval: int) -> None:
+    while True:
+        try:
+            async with async_session_maker() as session:
+                await purge_removals(session)
+        except Exception:
+            logger.exception("Ticket removal cleanup failed")
+        await asyncio.sleep(interval)
+
+
+@event.listens_for(Session, "before_flush")
+def _record_removals(session: Session, flush_context, instances) -> None:
+    for ticket in session.dirty:
+        if not isinstance(ticket, Ticket):
+            continue
+        history = inspect(ticket).attrs.assigned_to.history
+        for worker_id in history.deleted or ():
+            if worker_id is not None and worker_id != ticket.assigned_to:
+                session.add(TicketRemoval(
+                    tenant_id=ticket.tenant_id,
+                    ticket_id=ticket.id,
+                    worker_id=worker_id
+                ))
+
+    for ticket in session.deleted:
+        if isinstance(ticket, Ticket) and ticket.assigned_to is not None:
+            session.add(TicketRemoval(
+                tenant_id=ticket.tenant_id,
+                ticket_id=ticket.id,
+                worker_id=ticket.assigned_to
+            ))
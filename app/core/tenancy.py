@@ -0,0 +1,79 @@
+import uuid
+import weakref
+from contextvars import ContextVar
+
+from sqlalchemy import bindparam, event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, ORMExecuteState, with_loader_criteria
+
+from app.models.tenant import TenantScoped
+
+TENANT_KEY = "tenant_id"
+
+# Execution option for maintenance statements that must see every tenant.
+ALL_TENANTS = "all_tenants"
+
+# Tenant of the statement being executed. Set by the execute hook right
+# before SQLAlchemy builds the statement's parameters, in the same greenlet.
+_executing_tenant: ContextVar[uuid.UUID | None] = ContextVar("executing_tenant", default=None)
+
+# The criterion's parameter reads its value at execution time, so scoping
+# does not change a statement's cache key and each prepared statement in
+# app.core.queries is scoped once and keeps hitting the compiled cache.
+_TENANT_PARAM = bindparam("scope_tenant_id", callable_=_executing_tenant.get)
+
+_scoped: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def set_tenant(db: AsyncSession, tenant_id: uuid.UUID) -> None:
+    """Scope every following ORM statement of ``db`` to one tenant."""
+    db.info[TENANT_KEY] = tenant_id
+
+
+def current_tenant(db: AsyncSession) -> uuid.UUID | None:
+    return db.info.get(TENANT_KEY)
+
+
+def executing_tenant() -> uuid.UUID | None:
+    """Tenant of the last tenant-scoped statement run in this context."""
+    return _executing_tenant.get()
+
+
+def _scope(statement):
+    scoped = _scoped.get(statement)
+    if scoped is None:
+        scoped = statement.options(
+            with_loader_criteria(
+                TenantScoped,
+                lambda cls: cls.tenant_id == _TENANT_PARAM,
+                include_aliases=True,
+                track_closure_variables=False
+            )
+        )
+        _scoped[statement] = scoped
+    return scoped
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _scope_to_tenant(state: ORMExecuteState) -> None:
+    tenant_id = state.session.info.get(TENANT_KEY)
+    if tenant_id is None or state.execution_options.get(ALL_TENANTS):
+        return
+
+    _executing_tenant.set(tenant_id)
+
+    # Relationship loads carry the criterion over from their parent statement.
+    if not state.is_relationship_load and (
+        state.is_select or state.is_update or state.is_delete
+    ):
+        state.statement = _scope(state.statement)
+
+
+@event.listens_for(Session, "before_flush")
+def _assign_tenant(session: Session, flush_context, instances) -> None:
+    tenant_id = session.info.get(TENANT_KEY)
+    if tenant_id is None:
+        return
+    for obj in session.new:
+        if isinstance(obj, TenantScoped) and obj.tenant_id is None:
+            obj.tenant_id = tenant_id
@@ -1,10 +1,62 @@
+import asyncio
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from sqlalchemy.exc import DBAPIError, TimeoutError as PoolTimeoutError
 
 from app.config import settings
-from app.api.v1 import auth, users, tickets, public
+from app.api.v1 import auth, users, tickets, clients, reports, profiler, imports, public, attachments
+from app.database import engine
+from app.core.deadlines import DeadlineMiddleware, database_error_handler, pool_timeout_handler
+from app.core.cache import CHANNEL as CACHE_CHANNEL, apply_invalidation, response_cache
+from app.core.profiler import CHANNEL as PROFILER_CHANNEL, RouteContextMiddleware, sql_profiler
+from app.core.pubsub import NotificationListener
+from app.core.reports import refresh_periodically
+from app.core.idempotency import purge_periodically
+from app.core.sync import purge_periodically as purge_removals_periodically
+from app.core.jobs import JobRunner
 
-app = FastAPI(title=settings.PROJECT_NAME)
+IDEMPOTENCY_PURGE_INTERVAL = 3600
+SYNC_REMOVAL_PURGE_INTERVAL = 3600
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    listener = NotificationListener()
+    if response_cache.enabled:
+        listener.subscribe(CACHE_CHANNEL, apply_invalidation, on_reconnect=response_cache.clear)
+    listener.subscribe(PROFILER_CHANNEL, sql_profiler.apply_config)
+    listener.start()
+    
+    background = [
+        asyncio.create_task(purge_periodically(IDEMPOTENCY_PURGE_INTERVAL)),
+        asyncio.create_task(purge_removals_periodically(SYNC_REMOVAL_PURGE_INTERVAL))
+    ]
+    if settings.REPORT_REFRESH_INTERVAL > 0:
+        background.append(
+            asyncio.create_task(refresh_periodically(settings.REPORT_REFRESH_INTERVAL))
+        )
+    
+    # Jobs normally run in scripts/run_jobs.py; JOB_CONCURRENCY > 0 also
+    # runs them inside each API worker.
+    job_runner = JobRunner(settings.JOB_CONCURRENCY)
+    job_runner.start()
+    
+    yield
+    
+    await job_runner.stop()
+    for task in background:
+        task.cancel()
+    await asyncio.gather(*background, return_exceptions=True)
+    await listener.stop()
+
+
+sql_profiler.attach(engine.sync_engine)
+
+app = FastAPI(title=settings.PROJECT_NAME, lifespan=lifespan)
+
+app.add_middleware(DeadlineMiddleware)
+app.add_middleware(RouteContextMiddleware)
 
 app.add_middleware(
     CORSMiddleware,
@@ -14,9 +66,17 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+app.add_exception_handler(DBAPIError, database_error_handler)
+app.add_exception_handler(PoolTimeoutError, pool_timeout_handler)
+
 app.include_router(auth.router, prefix="/api/v1/auth", tags=["auth"])
 app.include_router(users.router, prefix="/api/v1/users", tags=["users"])
 app.include_router(tickets.router, prefix="/api/v1/tickets", tags=["tickets"])
+app.include_router(attachments.router, prefix="/api/v1/tickets", tags=["attachments"])
+app.include_router(clients.router, prefix="/api/v1/clients", tags=["clients"])
+app.include_router(reports.router, prefix="/api/v1/reports", tags=["reports"])
+app.include_router(profiler.router, prefix="/api/v1/admin/profiler", tags=["admin"])
+app.include_router(imports.router, prefix="/api/v1/admin/imports", tags=["admin"])
 app.include_router(public.router, prefix="/api/v1/public", tags=["public"])
 
 
@@ -1,5 +1,27 @@
+from app.models.tenant import Tenant
 from app.models.user import User, UserRole
 from app.models.client import Client
-from app.models.ticket import Ticket, TicketStatus
+from app.models.ticket import Ticket, TicketStatus, TicketRemoval
+from app.models.report import TicketDailyStats, TicketDailyStatsDirty
+from app.models.idempotency import IdempotencyKey
+from app.models.job import Job, JobStatus
+from app.models.import_run import ImportRun, ImportStatus
+from app.models.attachment import Attachment
 
-__all__ = ["User", "UserRole", "Client", "Ticket", "TicketStatus"]
+__all__ = [
+    "Tenant",
+    "User",
+    "UserRole",
+    "Client",
+    "Ticket",
+    "TicketStatus",
+    "TicketRemoval",
+    "TicketDailyStats",
+    "TicketDailyStatsDirty",
+    "IdempotencyKey",
+    "Job",
+    "JobStatus",
+    "ImportRun",
+    "ImportStatus",
+    "Attachment",
+]
@@ -0,0 +1,42 @@
+import uuid
+from datetime import datetime
+from sqlalchemy import BigInteger, String, ForeignKey, Index
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.dialects.postgresql import UUID
+
+from app.database import Base
+from app.models.tenant import TenantScoped
+
+
+class Attachment(TenantScoped, Base):
+    __tablename__ = "attachments"
+    __table_args__ = (
+        Index("ix_attachments_tenant_ticket_created", "tenant_id", "ticket_id", "created_at"),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        primary_key=True,
+        default=uuid.uuid4
+    )
+    ticket_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("tickets.id")
+    )
+    filename: Mapped[str] = mapped_column(String(255))
+    content_type: Mapped[str] = mapped_column(String(100))
+    size: Mapped[int] = mapped_column(BigInteger)
+    storage_key: Mapped[str] = mapped_column(String(255))
+    thumbnail_key: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    # None for files sent by the customer with a public repair request, or
+    # by a user who has since been deleted.
+    uploaded_by: Mapped[uuid.UUID | None] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("users.id", ondelete="SET NULL"),
+        nullable=True
+    )
+    created_at: Mapped[datetime] = mapped_column(default=datetime.utcnow)
+
+    @property
+    def has_thumbnail(self) -> bool:
+        return self.thumbnail_key is not None
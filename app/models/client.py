@@ -1,14 +1,37 @@
 import uuid
 from datetime import datetime
-from sqlalchemy import String, Text
+from sqlalchemy import String, Text, Index, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.dialects.postgresql import UUID
 
 from app.database import Base
+from app.models.tenant import TenantScoped
 
 
-class Client(Base):
+class Client(TenantScoped, Base):
     __tablename__ = "clients"
+    __table_args__ = (
+        # Every index leads with tenant_id so lookups never cross tenants.
+        # text_pattern_ops lets LIKE 'prefix%' use the index for autocomplete
+        Index(
+            "ix_clients_full_name_prefix",
+            "tenant_id",
+            text("lower(full_name) text_pattern_ops")
+        ),
+        Index(
+            "ix_clients_email_prefix",
+            "tenant_id",
+            text("lower(email) text_pattern_ops")
+        ),
+        Index(
+            "ix_clients_phone_prefix",
+            "tenant_id",
+            "phone",
+            postgresql_ops={"phone": "text_pattern_ops"}
+        ),
+        Index("ix_clients_tenant_email", "tenant_id", "email"),
+        Index("ix_clients_tenant_created", "tenant_id", "created_at"),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
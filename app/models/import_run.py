@@ -0,0 +1,46 @@
+import uuid
+from datetime import datetime
+from sqlalchemy import String, Text, Integer, ForeignKey, Enum as SQLEnum
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.dialects.postgresql import UUID
+import enum
+
+from app.database import Base
+from app.models.tenant import TenantScoped
+
+
+class ImportStatus(str, enum.Enum):
+    PENDING = "pending"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+
+
+class ImportRun(TenantScoped, Base):
+    __tablename__ = "import_runs"
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        primary_key=True,
+        default=uuid.uuid4
+    )
+    format: Mapped[str] = mapped_column(String(10))
+    status: Mapped[ImportStatus] = mapped_column(
+        SQLEnum(ImportStatus),
+        default=ImportStatus.PENDING
+    )
+    stage: Mapped[str | None] = mapped_column(String(50), nullable=True)
+    rows_read: Mapped[int] = mapped_column(Integer, default=0)
+    rows_failed: Mapped[int] = mapped_column(Integer, default=0)
+    tickets_created: Mapped[int] = mapped_column(Integer, default=0)
+    tickets_skipped: Mapped[int] = mapped_column(Integer, default=0)
+    clients_created: Mapped[int] = mapped_column(Integer, default=0)
+    error: Mapped[str | None] = mapped_column(Text, nullable=True)
+    created_by: Mapped[uuid.UUID | None] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("users.id", ondelete="SET NULL"),
+        nullable=True
+    )
+    created_at: Mapped[datetime] = mapped_column(default=datetime.utcnow)
+    started_at: Mapped[datetime | None] = mapped_column(nullable=True)
+    finished_at: Mapped[datetime | None] = mapped_column(nullable=True)
@@ -0,0 +1,36 @@
+import uuid
+from datetime import date
+from sqlalchemy import BigInteger, Date, Integer, Index
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.dialects.postgresql import UUID
+
+from app.database import Base
+from app.models.tenant import TenantScoped
+
+
+# Per-day ticket counters. Created counts are stored with worker_id NULL,
+# assigned and completed counts are attributed to the ticket's assignee.
+class TicketDailyStats(TenantScoped, Base):
+    __tablename__ = "ticket_daily_stats"
+    __table_args__ = (
+        Index("ix_ticket_daily_stats_tenant_day", "tenant_id", "day"),
+    )
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    day: Mapped[date] = mapped_column(Date, index=True)
+    worker_id: Mapped[uuid.UUID | None] = mapped_column(
+        UUID(as_uuid=True),
+        nullable=True
+    )
+    created: Mapped[int] = mapped_column(Integer, default=0)
+    assigned: Mapped[int] = mapped_column(Integer, default=0)
+    completed: Mapped[int] = mapped_column(Integer, default=0)
+
+
+# Earliest day whose counters a ticket write changed, when that day may
+# already be in the rollup. The next refresh rebuilds the tenant from there.
+class TicketDailyStatsDirty(TenantScoped, Base):
+    __tablename__ = "ticket_daily_stats_dirty"
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    day: Mapped[date] = mapped_column(Date)
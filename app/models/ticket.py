@@ -1,11 +1,12 @@
 import uuid
 from datetime import datetime
-from sqlalchemy import String, Text, ForeignKey, Enum as SQLEnum
+from sqlalchemy import BigInteger, String, Text, Integer, ForeignKey, Index, Enum as SQLEnum, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.dialects.postgresql import UUID
 import enum
 
 from app.database import Base
+from app.models.tenant import TenantScoped
 
 
 class TicketStatus(str, enum.Enum):
@@ -16,8 +17,42 @@ class TicketStatus(str, enum.Enum):
     CANCELLED = "cancelled"
 
 
-class Ticket(Base):
+OPEN_STATUSES = (TicketStatus.NEW, TicketStatus.ASSIGNED, TicketStatus.IN_PROGRESS)
+
+
+# Declared from least to most urgent: Postgres sorts enum values in
+# declaration order, so "priority DESC" puts urgent tickets first.
+class TicketPriority(str, enum.Enum):
+    LOW = "low"
+    NORMAL = "normal"
+    HIGH = "high"
+    URGENT = "urgent"
+
+# Id of the transaction writing the row. Rows changed after a sync are
+# found by comparing against a snapshot's xmin (see app.core.sync).
+CURRENT_XID = text("pg_current_xact_id()::text::bigint")
+
+
+class Ticket(TenantScoped, Base):
     __tablename__ = "tickets"
+    __table_args__ = (
+        Index("ix_tickets_client_fingerprint", "client_id", "fingerprint"),
+        # Ticket lists are always filtered by tenant and ordered by creation.
+        Index("ix_tickets_tenant_created", "tenant_id", "created_at"),
+        Index("ix_tickets_tenant_status_created", "tenant_id", "status", "created_at"),
+        Index("ix_tickets_tenant_worker_created", "tenant_id", "assigned_to", "created_at"),
+        Index("ix_tickets_tenant_worker_sync", "tenant_id", "assigned_to", "sync_version", "id"),
+        # The claim queue: unassigned new tickets in the order workers take
+        # them, so claiming reads the first unlocked index entry.
+        Index(
+            "ix_tickets_claim_queue",
+            "tenant_id",
+            text("priority DESC"),
+            text("due_at NULLS LAST"),
+            "created_at",
+            postgresql_where=text("status = 'NEW' AND assigned_to IS NULL")
+        ),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -30,6 +65,12 @@ class Ticket(Base):
         SQLEnum(TicketStatus),
         default=TicketStatus.NEW
     )
+    priority: Mapped[TicketPriority] = mapped_column(
+        SQLEnum(TicketPriority),
+        default=TicketPriority.NORMAL,
+        server_default=TicketPriority.NORMAL.name
+    )
+    due_at: Mapped[datetime | None] = mapped_column(nullable=True)
     client_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("clients.id")
@@ -39,12 +80,21 @@ class Ticket(Base):
         ForeignKey("users.id"),
         nullable=True
     )
-    created_at: Mapped[datetime] = mapped_column(default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(default=datetime.utcnow, index=True)
     updated_at: Mapped[datetime] = mapped_column(
         default=datetime.utcnow,
         onupdate=datetime.utcnow
     )
-    completed_at: Mapped[datetime | None] = mapped_column(nullable=True)
+    assigned_at: Mapped[datetime | None] = mapped_column(nullable=True, index=True)
+    completed_at: Mapped[datetime | None] = mapped_column(nullable=True, index=True)
+    fingerprint: Mapped[str | None] = mapped_column(String(40), nullable=True)
+    duplicate_count: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    last_duplicate_at: Mapped[datetime | None] = mapped_column(nullable=True)
+    sync_version: Mapped[int] = mapped_column(
+        BigInteger,
+        server_default=CURRENT_XID,
+        onupdate=CURRENT_XID
+    )
 
     # Relationships
     client: Mapped["Client"] = relationship("Client", back_populates="tickets")
@@ -53,3 +103,27 @@ class Ticket(Base):
         back_populates="assigned_tickets",
         foreign_keys=[assigned_to]
     )
+
+
+class TicketRemoval(TenantScoped, Base):
+    """A ticket leaving a worker's list: reassigned, unassigned or deleted.
+
+    Lets the worker's devices drop it on their next sync. No foreign keys,
+    the ticket or worker may no longer exist.
+    """
+    __tablename__ = "ticket_removals"
+    __table_args__ = (
+        Index(
+            "ix_ticket_removals_tenant_worker_sync",
+            "tenant_id",
+            "worker_id",
+            "sync_version",
+            "ticket_id"
+        ),
+    )
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    ticket_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True))
+    worker_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True))
+    sync_version: Mapped[int] = mapped_column(BigInteger, server_default=CURRENT_XID)
+    created_at: Mapped[datetime] = mapped_column(default=datetime.utcnow, index=True)
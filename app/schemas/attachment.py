@@ -0,0 +1,16 @@
+import uuid
+from pydantic import BaseModel
+from datetime import datetime
+
+
+class AttachmentResponse(BaseModel):
+    id: uuid.UUID
+    ticket_id: uuid.UUID
+    filename: str
+    content_type: str
+    size: int
+    has_thumbnail: bool
+    uploaded_by: uuid.UUID | None
+    created_at: datetime
+
+    model_config = {"from_attributes": True}
@@ -0,0 +1,27 @@
+import uuid
+from typing import Generic, TypeVar
+from pydantic import BaseModel, Field
+
+T = TypeVar("T")
+
+MAX_BATCH_SIZE = 200
+
+
+class BatchGetRequest(BaseModel):
+    ids: list[uuid.UUID] = Field(min_length=1, max_length=MAX_BATCH_SIZE)
+
+
+class BatchItem(BaseModel, Generic[T]):
+    """Result for one requested id.
+
+    ``status`` is the HTTP status the single-item endpoint would have
+    returned; ``data`` is set for 200, ``detail`` otherwise.
+    """
+    id: uuid.UUID
+    status: int
+    data: T | None = None
+    detail: str | None = None
+
+
+class BatchGetResponse(BaseModel, Generic[T]):
+    items: list[BatchItem[T]]
@@ -16,7 +16,17 @@ class ClientCreate(ClientBase):
 
 class ClientResponse(ClientBase):
     id: uuid.UUID
+    email: str
     created_at: datetime
     updated_at: datetime
 
     model_config = {"from_attributes": True}
+
+
+class ClientSummary(BaseModel):
+    id: uuid.UUID
+    full_name: str
+    email: str
+    phone: str
+
+    model_config = {"from_attributes": True}
@@ -0,0 +1,22 @@
+import uuid
+from datetime import datetime
+from pydantic import BaseModel
+from app.models.import_run import ImportStatus
+
+
+class ImportRunResponse(BaseModel):
+    id: uuid.UUID
+    format: str
+    status: ImportStatus
+    stage: str | None
+    rows_read: int
+    rows_failed: int
+    tickets_created: int
+    tickets_skipped: int
+    clients_created: int
+    error: str | None
+    created_at: datetime
+    started_at: datetime | None
+    finished_at: datetime | None
+
+    model_config = {"from_attributes": True}
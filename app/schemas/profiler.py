@@ -0,0 +1,26 @@
+from pydantic import BaseModel, Field
+
+
+class ProfilerConfig(BaseModel):
+    enabled: bool
+    threshold_ms: float
+    explain_sample_rate: float
+
+
+class ProfilerConfigUpdate(BaseModel):
+    enabled: bool | None = None
+    threshold_ms: float | None = Field(None, ge=0)
+    explain_sample_rate: float | None = Field(None, ge=0, le=1)
+
+
+class SlowQuery(BaseModel):
+    at: str
+    duration_ms: float
+    route: str | None
+    statement: str
+    parameters: list | dict | str | int | float | None
+    plan: str | None
+
+
+class ProfilerStatus(ProfilerConfig):
+    slow_queries: list[SlowQuery]
@@ -0,0 +1,19 @@
+import uuid
+from datetime import date
+from pydantic import BaseModel
+
+
+class TicketSeriesPoint(BaseModel):
+    period: date
+    created: int
+    assigned: int
+    completed: int
+
+
+class WorkerSummary(BaseModel):
+    worker_id: uuid.UUID
+    full_name: str
+    email: str
+    assigned: int
+    completed: int
+    completion_rate: float | None
@@ -1,7 +1,7 @@
 import uuid
 from pydantic import BaseModel
 from datetime import datetime
-from app.models.ticket import TicketStatus
+from app.models.ticket import TicketPriority, TicketStatus
 
 
 class TicketBase(BaseModel):
@@ -24,14 +24,22 @@ class TicketUpdateStatus(BaseModel):
     status: TicketStatus
 
 
+class TicketUpdatePriority(BaseModel):
+    priority: TicketPriority
+    due_at: datetime | None = None
+
+
 class TicketResponse(TicketBase):
     id: uuid.UUID
     status: TicketStatus
+    priority: TicketPriority
+    due_at: datetime | None
     client_id: uuid.UUID
     assigned_to: uuid.UUID | None
     created_at: datetime
     updated_at: datetime
     completed_at: datetime | None
+    duplicate_count: int = 0
 
     model_config = {"from_attributes": True}
 
@@ -41,3 +49,10 @@ class TicketDetailResponse(TicketResponse):
     assigned_user: dict | None
 
     model_config = {"from_attributes": True}
+
+
+class TicketSyncResponse(BaseModel):
+    changed: list[TicketDetailResponse]
+    removed: list[uuid.UUID]
+    sync_token: str
+    has_more: bool
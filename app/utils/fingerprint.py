@@ -0,0 +1,50 @@
+import hashlib
+import re
+
+_WORD_RE = re.compile(r"[^\W_]+", re.UNICODE)
+_DIGITS_RE = re.compile(r"\D")
+
+_STOPWORDS = frozenset({
+    "a", "an", "and", "the", "is", "it", "my", "of", "on", "in", "to",
+    "for", "with", "not", "no", "at", "be", "was", "are", "this", "that",
+    "please", "help", "hi", "hello", "thanks", "thank", "you",
+})
+
+
+def _tokens(title: str, description: str) -> list[str]:
+    words = _WORD_RE.findall(f"{title} {description}".lower())
+    return sorted({w for w in words if len(w) > 1 and w not in _STOPWORDS})
+
+
+def ticket_fingerprint(title: str, description: str) -> str:
+    """Order- and case-insensitive hash of the meaningful words in a request.
+
+    Resubmissions that only differ in casing, punctuation, word order or
+    filler words produce the same fingerprint.
+    """
+    return hashlib.sha1(" ".join(_tokens(title, description)).encode("utf-8")).hexdigest()
+
+
+def ticket_trigrams(title: str, description: str) -> set[str]:
+    """Character trigrams of the meaningful words, padded like pg_trgm's.
+
+    A typo or a changed word only replaces a few trigrams, so rewordings of
+    the same request stay similar.
+    """
+    trigrams = set()
+    for word in _tokens(title, description):
+        padded = f"  {word} "
+        trigrams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return trigrams
+
+
+def similarity(a: set[str], b: set[str]) -> float:
+    """Jaccard similarity of two trigram sets, from 0.0 to 1.0."""
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+def same_phone(a: str, b: str) -> bool:
+    """Phone numbers are equal ignoring spaces, dashes and brackets."""
+    return _DIGITS_RE.sub("", a) == _DIGITS_RE.sub("", b)
@@ -32,3 +32,26 @@ async def paginate(
     total_pages = (total + page_size - 1) // page_size
 
     return items, total, total_pages
+
+
+async def paginate_prepared(
+    db: AsyncSession,
+    count_query,
+    page_query,
+    params: dict,
+    page: int = 1,
+    page_size: int = 10
+) -> tuple:
+    total_result = await db.execute(count_query, params)
+    total = total_result.scalar()
+
+    offset = (page - 1) * page_size
+    result = await db.execute(
+        page_query,
+        {**params, "limit": page_size, "offset": offset}
+    )
+    items = result.scalars().all()
+
+    total_pages = (total + page_size - 1) // page_size
+
+    return items, total, total_pages
@@ -0,0 +1,52 @@
+import time
+from collections import OrderedDict
+from typing import Callable, Generic, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class PrefixCache(Generic[T]):
+    """Per-process cache of recent autocomplete results keyed by prefix.
+
+    A result list shorter than the limit it was fetched with holds every
+    match for that prefix, so any longer prefix can be answered by filtering
+    it in memory instead of querying the database again. Entries in
+    different namespaces (e.g. tenants) never answer each other's lookups.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[tuple[Hashable, str], tuple[float, int, list[T]]] = OrderedDict()
+
+    def get(
+        self,
+        prefix: str,
+        limit: int,
+        matches: Callable[[T, str], bool],
+        namespace: Hashable = None
+    ) -> list[T] | None:
+        now = time.monotonic()
+
+        entry = self._entries.get((namespace, prefix))
+        if entry and entry[0] > now and (entry[1] >= limit or len(entry[2]) < entry[1]):
+            self._entries.move_to_end((namespace, prefix))
+            return entry[2][:limit]
+
+        for length in range(len(prefix) - 1, 0, -1):
+            entry = self._entries.get((namespace, prefix[:length]))
+            if entry and entry[0] > now and len(entry[2]) < entry[1]:
+                return [item for item in entry[2] if matches(item, prefix)][:limit]
+
+        return None
+
+    def put(self, prefix: str, limit: int, items: list[T], namespace: Hashable = None) -> None:
+        if self.max_entries <= 0:
+            return
+        self._entries[(namespace, prefix)] = (time.monotonic() + self.ttl_seconds, limit, items)
+        self._entries.move_to_end((namespace, prefix))
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
@@ -0,0 +1,127 @@
+import hashlib
+import hmac
+from datetime import datetime, timezone
+from urllib.parse import quote, urlsplit
+
+ALGORITHM = "AWS4-HMAC-SHA256"
+UNSIGNED_PAYLOAD = "UNSIGNED-PAYLOAD"
+EMPTY_PAYLOAD = hashlib.sha256(b"").hexdigest()
+
+
+def _encode(value: str) -> str:
+    return quote(value, safe="-_.~")
+
+
+def _hmac(key: bytes, message: str) -> bytes:
+    return hmac.new(key, message.encode("utf-8"), hashlib.sha256).digest()
+
+
+def _signature(secret_key: str, scope: str, amz_date: str, canonical_request: str) -> str:
+    date, region, service, _ = scope.split("/")
+    key = _hmac(f"AWS4{secret_key}".encode("utf-8"), date)
+    for part in (region, service, "aws4_request"):
+        key = _hmac(key, part)
+    string_to_sign = "\n".join([
+        ALGORITHM,
+        amz_date,
+        scope,
+        hashlib.sha256(canonical_request.encode("utf-8")).hexdigest(),
+    ])
+    return hmac.new(key, string_to_sign.encode("utf-8"), hashlib.sha256).hexdigest()
+
+
+def _canonical_request(
+    method: str,
+    url: str,
+    query: dict[str, str],
+    headers: dict[str, str],
+    payload_hash: str
+) -> tuple[str, str]:
+    parts = urlsplit(url)
+    path = quote(parts.path or "/", safe="/-_.~")
+    canonical_query = "&".join(
+        f"{_encode(key)}={_encode(value)}" for key, value in sorted(query.items())
+    )
+    names = sorted(name.lower() for name in headers)
+    values = {name.lower(): " ".join(str(value).split()) for name, value in headers.items()}
+    canonical_headers = "".join(f"{name}:{values[name]}\n" for name in names)
+    signed_headers = ";".join(names)
+    request = "\n".join([
+        method,
+        path,
+        canonical_query,
+        canonical_headers,
+        signed_headers,
+        payload_hash,
+    ])
+    return request, signed_headers
+
+
+def _scope(now: datetime, region: str, service: str) -> tuple[str, str]:
+    now = now.astimezone(timezone.utc)
+    return now.strftime("%Y%m%dT%H%M%SZ"), f"{now:%Y%m%d}/{region}/{service}/aws4_request"
+
+
+def sign_request(
+    method: str,
+    url: str,
+    query: dict[str, str],
+    headers: dict[str, str],
+    access_key: str,
+    secret_key: str,
+    region: str,
+    payload_hash: str = UNSIGNED_PAYLOAD,
+    service: str = "s3",
+    now: datetime | None = None
+) -> dict[str, str]:
+    """Headers authenticating a request with AWS Signature Version 4.
+
+    ``url`` is the request URL without its query string; ``headers`` must
+    not include ``Host``, it is taken from the URL.
+    """
+    amz_date, scope = _scope(now or datetime.now(timezone.utc), region, service)
+    signed = {
+        **headers,
+        "host": urlsplit(url).netloc,
+        "x-amz-content-sha256": payload_hash,
+        "x-amz-date": amz_date,
+    }
+    request, signed_headers = _canonical_request(method, url, query, signed, payload_hash)
+    signature = _signature(secret_key, scope, amz_date, request)
+
+    del signed["host"]
+    signed["Authorization"] = (
+        f"{ALGORITHM} Credential={access_key}/{scope}, "
+        f"SignedHeaders={signed_headers}, Signature={signature}"
+    )
+    return signed
+
+
+def presign_url(
+    method: str,
+    url: str,
+    access_key: str,
+    secret_key: str,
+    region: str,
+    expires: int,
+    query: dict[str, str] | None = None,
+    service: str = "s3",
+    now: datetime | None = None
+) -> str:
+    """A URL that grants ``method`` on ``url`` for ``expires`` seconds."""
+    amz_date, scope = _scope(now or datetime.now(timezone.utc), region, service)
+    query = {
+        **(query or {}),
+        "X-Amz-Algorithm": ALGORITHM,
+        "X-Amz-Credential": f"{access_key}/{scope}",
+        "X-Amz-Date": amz_date,
+        "X-Amz-Expires": str(expires),
+        "X-Amz-SignedHeaders": "host",
+    }
+    request, _ = _canonical_request(
+        method, url, query, {"host": urlsplit(url).netloc}, UNSIGNED_PAYLOAD
+    )
+    query["X-Amz-Signature"] = _signature(secret_key, scope, amz_date, request)
+    return url + "?" + "&".join(
+        f"{_encode(key)}={_encode(value)}" for key, value in query.items()
+    )
@@ -0,0 +1,56 @@
+"""Create a tenant (franchise) with its first admin account.
+
+    python scripts/create_tenant.py SLUG "Name" ADMIN_EMAIL ADMIN_PASSWORD
+
+Clients of the tenant select it with the `X-Tenant: SLUG` header on the
+login and public endpoints.
+"""
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.database import async_session_maker
+from app.models.tenant import Tenant
+from app.models.user import User, UserRole
+from app.core.queries import TENANT_BY_SLUG
+from app.core.security import get_password_hash
+
+
+async def create_tenant(slug: str, name: str, admin_email: str, admin_password: str):
+    async with async_session_maker() as session:
+        if await session.scalar(TENANT_BY_SLUG, {"slug": slug}) is not None:
+            raise SystemExit(f"Tenant '{slug}' already exists")
+
+        tenant = Tenant(slug=slug, name=name)
+        session.add(tenant)
+        await session.flush()
+
+        session.add(User(
+            tenant_id=tenant.id,
+            email=admin_email,
+            full_name=f"{name} Admin",
+            role=UserRole.ADMIN,
+            hashed_password=get_password_hash(admin_password),
+            is_active=True
+        ))
+        await session.commit()
+
+        print(f"Created tenant '{slug}' with admin {admin_email}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Create a tenant")
+    parser.add_argument("slug")
+    parser.add_argument("name")
+    parser.add_argument("admin_email")
+    parser.add_argument("admin_password")
+    args = parser.parse_args()
+
+    asyncio.run(create_tenant(args.slug, args.name, args.admin_email, args.admin_password))
+
+
+if __name__ == "__main__":
+    main()
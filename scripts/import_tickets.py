@@ -0,0 +1,73 @@
+"""Bulk-import historical tickets and their clients.
+
+    python scripts/import_tickets.py tickets.csv [--format csv|jsonl] [--errors FILE]
+                                     [--tenant SLUG]
+
+Each row holds one ticket: title, description, status, created_at,
+assigned_at, completed_at, client_full_name, client_email, client_phone,
+client_address and worker_email. Clients are matched by email, assignees by
+the email of an existing worker. Rows that cannot be imported are listed in
+the error file (default: <input>.errors.csv) and the rest is imported.
+"""
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.config import settings
+from app.database import async_session_maker
+from app.core.importer import FORMATS, run_import
+from app.core.queries import TENANT_BY_SLUG
+
+
+async def run(path: Path, fmt: str, errors: Path, tenant_slug: str):
+    started = time.perf_counter()
+
+    async def progress(stats: dict):
+        elapsed = time.perf_counter() - started
+        print(
+            f"\r[{stats['stage']}] {stats['rows_read']} rows read, "
+            f"{stats['rows_failed']} failed, "
+            f"{stats['rows_read'] / max(elapsed, 1e-9):.0f} rows/s",
+            end="",
+            flush=True
+        )
+
+    async with async_session_maker() as session:
+        tenant = await session.scalar(TENANT_BY_SLUG, {"slug": tenant_slug})
+        if tenant is None:
+            raise SystemExit(f"Unknown tenant '{tenant_slug}'")
+        stats = await run_import(session, path, fmt, errors, tenant.id, progress)
+
+    print()
+    print(
+        f"Imported {stats['tickets_created']} tickets "
+        f"({stats['tickets_skipped']} already present) and "
+        f"{stats['clients_created']} new clients "
+        f"in {time.perf_counter() - started:.1f}s"
+    )
+    if stats["rows_failed"]:
+        print(f"{stats['rows_failed']} rows failed, see {errors}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import historical tickets")
+    parser.add_argument("file", type=Path)
+    parser.add_argument("--format", choices=FORMATS, help="default: from file extension")
+    parser.add_argument("--errors", type=Path, help="where to write rejected rows")
+    parser.add_argument("--tenant", default=settings.DEFAULT_TENANT, help="tenant slug")
+    args = parser.parse_args()
+
+    fmt = args.format or args.file.suffix.lstrip(".").lower()
+    if fmt not in FORMATS:
+        parser.error("cannot infer format from the file name, pass --format")
+
+    errors = args.errors or args.file.with_name(args.file.name + ".errors.csv")
+    asyncio.run(run(args.file, fmt, errors, args.tenant))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""Move a single-tenant database to the multi-tenant schema.
+
+    python scripts/migrate_tenancy.py
+
+Creates the tenants table and the DEFAULT_TENANT, assigns every existing
+user, client, ticket, rollup row and import run to it, and only then makes
+tenant_id NOT NULL and replaces the indexes that now lead with tenant_id
+(user emails become unique per tenant). Run it once before starting the
+upgraded application. All steps run in one transaction, and running it
+again on a migrated database changes nothing.
+"""
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import inspect, select, text
+
+from app.config import settings
+from app.database import Base, engine
+from app.models import tenant, user, client, ticket, report, idempotency, job, import_run, attachment  # noqa: F401
+from app.models.tenant import Tenant, TenantScoped
+
+# Single-tenant indexes that were dropped, or redefined under the same name
+# to lead with tenant_id.
+OBSOLETE_INDEXES = {
+    "users": ["ix_users_email"],
+    "clients": [
+        "ix_clients_email",
+        "ix_clients_full_name_prefix",
+        "ix_clients_email_prefix",
+        "ix_clients_phone_prefix",
+    ],
+}
+
+
+def _scoped_tables():
+    tables = [
+        mapper.local_table
+        for mapper in Base.registry.mappers
+        if issubclass(mapper.class_, TenantScoped)
+    ]
+    return sorted(tables, key=lambda table: table.name)
+
+
+def _existing(sync_conn) -> dict[str, set[str]]:
+    inspector = inspect(sync_conn)
+    return {
+        table: {column["name"] for column in inspector.get_columns(table)}
+        for table in inspector.get_table_names()
+    }
+
+
+async def migrate() -> None:
+    async with engine.begin() as conn:
+        # Backfilling large tables must not hit the request timeouts.
+        await conn.execute(text("SET LOCAL statement_timeout = 0"))
+        await conn.run_sync(Tenant.__table__.create, checkfirst=True)
+
+        tenant_id = await conn.scalar(
+            select(Tenant.id).where(Tenant.slug == settings.DEFAULT_TENANT)
+        )
+        if tenant_id is None:
+            tenant_id = await conn.scalar(
+                Tenant.__table__.insert()
+                .values(slug=settings.DEFAULT_TENANT, name="Default")
+                .returning(Tenant.id)
+            )
+            print(f"Created tenant '{settings.DEFAULT_TENANT}'")
+
+        existing = await conn.run_sync(_existing)
+
+        for table in _scoped_tables():
+            if table.name not in existing:
+                continue
+            if "tenant_id" not in existing[table.name]:
+                await conn.execute(text(
+                    f"ALTER TABLE {table.name} "
+                    "ADD COLUMN tenant_id UUID REFERENCES tenants (id)"
+                ))
+                for name in OBSOLETE_INDEXES.get(table.name, []):
+                    await conn.execute(text(f"DROP INDEX IF EXISTS {name}"))
+            result = await conn.execute(
+                text(f"UPDATE {table.name} SET tenant_id = :tenant_id WHERE tenant_id IS NULL"),
+                {"tenant_id": tenant_id}
+            )
+            await conn.execute(text(f"ALTER TABLE {table.name} ALTER COLUMN tenant_id SET NOT NULL"))
+            print(f"{table.name}: {result.rowcount} rows assigned to '{settings.DEFAULT_TENANT}'")
+
+        for table in _scoped_tables():
+            if table.name in existing:
+                for index in table.indexes:
+                    await conn.run_sync(index.create, checkfirst=True)
+
+    await engine.dispose()
+
+
+def main():
+    asyncio.run(migrate())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""Run background jobs in a dedicated process.
+
+    python scripts/run_jobs.py [--concurrency N]
+
+This is the supported way to run jobs: API workers only run them in-process
+when JOB_CONCURRENCY is above 0.
+"""
+import argparse
+import asyncio
+import logging
+import signal
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.jobs import JobRunner
+
+logger = logging.getLogger("run_jobs")
+
+
+async def run(concurrency: int):
+    runner = JobRunner(concurrency)
+    runner.start()
+    logger.info("Job runner started with %d tasks", concurrency)
+
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+
+    await stop.wait()
+    await runner.stop()
+    logger.info("Job runner stopped")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Background job runner")
+    parser.add_argument("--concurrency", type=int, default=4)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(run(max(1, args.concurrency)))
+
+
+if __name__ == "__main__":
+    main()
@@ -5,21 +5,35 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from sqlalchemy import select
+from app.config import settings
 from app.database import async_session_maker
+from app.models.tenant import Tenant
 from app.models.user import User, UserRole
 from app.core.security import get_password_hash
 
 
 async def seed_data():
     async with async_session_maker() as session:
-        result = await session.execute(select(User))
+        result = await session.execute(
+            select(Tenant).where(Tenant.slug == settings.DEFAULT_TENANT)
+        )
+        tenant = result.scalar_one_or_none()
+        
+        if tenant is None:
+            tenant = Tenant(slug=settings.DEFAULT_TENANT, name="Default")
+            session.add(tenant)
+            await session.flush()
+        
+        result = await session.execute(select(User).where(User.tenant_id == tenant.id))
         existing_users = result.scalars().all()
         
         if len(existing_users) >= 2:
+            await session.commit()
             print(f"Database already seeded with {len(existing_users)} users")
             return
         
         admin_user = User(
+            tenant_id=tenant.id,
             email="admin@example.com",
             full_name="Admin User",
             role=UserRole.ADMIN,
@@ -28,6 +42,7 @@ async def seed_data():
         )
         
         worker_user = User(
+            tenant_id=tenant.id,
             email="worker@example.com",
             full_name="Worker User",
             role=UserRole.WORKER,
@@ -39,6 +54,7 @@ async def seed_data():
         await session.commit()
         
         print("Database seeded successfully:")
+        print(f"  - Tenant: {tenant.slug}")
         print("  - Admin: admin@example.com / admin123")
         print("  - Worker: worker@example.com / worker123")
 
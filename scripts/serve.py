@@ -0,0 +1,124 @@
+"""Production server entrypoint.
+
+Runs the API in several uvicorn worker processes and splits the database
+connection budget between them so the whole container never opens more than
+DB_MAX_CONNECTIONS - DB_RESERVED_CONNECTIONS connections.
+
+    python scripts/serve.py [--workers N]
+
+Migrations are not run here; apply them once with `alembic upgrade head`
+before starting the server. Send SIGHUP to the parent process for a rolling
+restart: workers are replaced one at a time while the others keep serving.
+"""
+import argparse
+import logging
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import uvicorn
+
+from app.config import settings
+
+logger = logging.getLogger("uvicorn.error")
+
+
+def cpu_count() -> int:
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def background_connections() -> int:
+    """Connections each worker's background tasks can hold at the same time.
+
+    They share the worker's pool with requests: the idempotency key and
+    ticket removal purges, the report refresh and every in-process job
+    runner, which may hold a second connection to refresh the lock of a
+    long-running job.
+    """
+    connections = 2
+    if settings.REPORT_REFRESH_INTERVAL > 0:
+        connections += 1
+    return connections + 2 * settings.JOB_CONCURRENCY
+
+
+def pool_budget(workers: int) -> tuple[int, int, int]:
+    budget = settings.DB_MAX_CONNECTIONS - settings.DB_RESERVED_CONNECTIONS
+    if budget < 1:
+        raise SystemExit(
+            "DB_MAX_CONNECTIONS must be greater than DB_RESERVED_CONNECTIONS"
+        )
+
+    # Each worker also holds one connection for LISTEN/NOTIFY, and needs at
+    # least one pooled connection for requests besides its background tasks.
+    listener = 1
+    background = background_connections()
+    minimum = listener + background + 1
+
+    if workers * minimum > budget:
+        if budget < minimum:
+            raise SystemExit(
+                f"A worker needs {minimum} connections but only {budget} are available; "
+                "lower JOB_CONCURRENCY or raise DB_MAX_CONNECTIONS"
+            )
+        logger.warning(
+            "Only %d connections available, reducing workers from %d",
+            budget,
+            workers
+        )
+        workers = budget // minimum
+
+    per_worker = budget // workers - listener
+    pool_size = min(settings.DB_POOL_SIZE + background, per_worker)
+    max_overflow = per_worker - pool_size
+
+    return workers, pool_size, max_overflow
+
+
+def main():
+    parser = argparse.ArgumentParser(description=settings.PROJECT_NAME)
+    parser.add_argument("--host", default=settings.HOST)
+    parser.add_argument("--port", type=int, default=settings.PORT)
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=settings.WEB_CONCURRENCY or cpu_count(),
+        help="number of worker processes (default: WEB_CONCURRENCY or CPU count)"
+    )
+    args = parser.parse_args()
+
+    # uvicorn configures logging only once it starts.
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s:     %(message)s")
+
+    workers, pool_size, max_overflow = pool_budget(max(1, args.workers))
+
+    # Worker processes re-read settings from the environment on import.
+    os.environ["DB_POOL_SIZE"] = str(pool_size)
+    os.environ["DB_MAX_OVERFLOW"] = str(max_overflow)
+
+    logger.info(
+        "Starting %d workers, %d+%d DB connections each, %d of them for background tasks "
+        "(of %d total)",
+        workers,
+        pool_size,
+        max_overflow,
+        background_connections(),
+        settings.DB_MAX_CONNECTIONS
+    )
+
+    uvicorn.run(
+        "app.main:app",
+        host=args.host,
+        port=args.port,
+        workers=workers,
+        proxy_headers=True,
+        timeout_graceful_shutdown=settings.GRACEFUL_TIMEOUT,
+        log_level="debug" if settings.DEBUG else "info"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,47 +1,242 @@
+import os
 import pytest
-import asyncio
+import pytest_asyncio
 from typing import AsyncGenerator
+from httpx import AsyncClient, ASGITransport
+from sqlalchemy import text
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, AsyncEngine
-from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import NullPool
 
-from app.database import Base
+from app.database import Base, get_db
 from app.config import settings
+from app.main import app
+from app.models.tenant import Tenant
+from app.models.user import User, UserRole
+from app.core.security import get_password_hash, create_access_token
+from app.core.cache import response_cache
+from app.core import attachments as attachments_core, importer, storage as storage_module
+from app.core.storage import LocalStorage
+from app.api.v1 import attachments as attachments_api, imports as imports_api
+from app.api.v1.clients import autocomplete_cache
 
 
-pytest_plugins = ('pytest_asyncio',)
+TEST_PASSWORD = "password123"
+TEST_PASSWORD_HASH = get_password_hash(TEST_PASSWORD)
 
 
-@pytest.fixture(scope="session")
-def event_loop():
-    """Create an instance of the default event loop for each test case."""
-    policy = asyncio.get_event_loop_policy()
-    loop = policy.new_event_loop()
-    yield loop
-    loop.close()
+def pytest_collection_modifyitems(items):
+    """Run every async test on the session event loop shared with the engine."""
+    session_scope = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if pytest_asyncio.is_async_test(item):
+            item.add_marker(session_scope, append=False)
 
 
-@pytest.fixture(scope="function")
+def _test_database_url():
+    """Each xdist worker gets its own database, e.g. mini_crm_test_gw0."""
+    url = make_url(settings.DATABASE_URL)
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "main")
+    return url.set(database=f"{url.database}_test_{worker}")
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
 async def engine() -> AsyncGenerator[AsyncEngine, None]:
-    """Create a new engine for each test with NullPool to avoid connection reuse issues."""
-    test_engine = create_async_engine(
-        settings.DATABASE_URL,
-        echo=False,
-        poolclass=NullPool,
+    """Create the worker's test database and build the schema once per session."""
+    test_url = _test_database_url()
+    admin_engine = create_async_engine(
+        make_url(settings.DATABASE_URL).set(database="postgres"),
+        isolation_level="AUTOCOMMIT",
     )
-    
+
+    async with admin_engine.connect() as conn:
+        await conn.execute(text(f'DROP DATABASE IF EXISTS "{test_url.database}"'))
+        await conn.execute(text(f'CREATE DATABASE "{test_url.database}"'))
+
+    test_engine = create_async_engine(test_url, echo=False)
+    async with test_engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
     yield test_engine
-    
+
     await test_engine.dispose()
+    async with admin_engine.connect() as conn:
+        await conn.execute(text(f'DROP DATABASE IF EXISTS "{test_url.database}"'))
+    await admin_engine.dispose()
 
 
-@pytest.fixture(scope="function")
+@pytest_asyncio.fixture(loop_scope="session")
 async def session(engine: AsyncEngine) -> AsyncGenerator[AsyncSession, None]:
-    """Create a new session for each test."""
-    async_session_maker = sessionmaker(
-        engine, class_=AsyncSession, expire_on_commit=False
-    )
-    
-    async with async_session_maker() as session:
+    """Session bound to an outer transaction that is rolled back after the test.
+
+    Commits made by the code under test only release a SAVEPOINT, so every
+    test starts from the same empty schema without recreating it.
+    """
+    async with engine.connect() as conn:
+        transaction = await conn.begin()
+        session = AsyncSession(
+            bind=conn,
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint",
+        )
+
         yield session
-        await session.rollback()
+
+        await session.close()
+        await transaction.rollback()
+
+
+@pytest.fixture(autouse=True)
+def storage(tmp_path, monkeypatch) -> LocalStorage:
+    """Attachments and import files go to the test's temporary directory."""
+    local = LocalStorage(tmp_path / "storage")
+    for module in (storage_module, attachments_core, importer, attachments_api, imports_api):
+        monkeypatch.setattr(module, "storage", local)
+    return local
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def client(session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
+    """HTTP client for the app with get_db bound to the test session."""
+    async def override_get_db():
+        yield session
+
+    app.dependency_overrides[get_db] = override_get_db
+    # Test transactions are rolled back without publishing invalidations.
+    response_cache.clear()
+    autocomplete_cache.clear()
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        yield ac
+    app.dependency_overrides.pop(get_db, None)
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def tenant(session: AsyncSession) -> Tenant:
+    """The default tenant, used by requests without an X-Tenant header."""
+    tenant = Tenant(slug=settings.DEFAULT_TENANT, name="Default")
+    session.add(tenant)
+    await session.flush()
+    return tenant
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def other_tenant(session: AsyncSession) -> Tenant:
+    """A second tenant, selected with ``X-Tenant: other``."""
+    tenant = Tenant(slug="other", name="Other")
+    session.add(tenant)
+    await session.flush()
+    return tenant
+
+
+async def _create_user(session: AsyncSession, tenant: Tenant, email: str, role: UserRole) -> User:
+    user = User(
+        tenant_id=tenant.id,
+        email=email,
+        full_name=f"{role.value.title()} User",
+        role=role,
+        hashed_password=TEST_PASSWORD_HASH,
+        is_active=True,
+    )
+    session.add(user)
+    await session.flush()
+    return user
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def admin_user(session: AsyncSession, tenant: Tenant) -> User:
+    return await _create_user(session, tenant, "admin@example.com", UserRole.ADMIN)
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def worker_user(session: AsyncSession, tenant: Tenant) -> User:
+    return await _create_user(session, tenant, "worker@example.com", UserRole.WORKER)
+
+
+def _auth_headers(user: User) -> dict:
+    token = create_access_token(
+        {"sub": user.email, "role": user.role.value, "tenant": str(user.tenant_id)}
+    )
+    return {"Authorization": f"Bearer {token}"}
+
+
+@pytest.fixture
+def make_user(session: AsyncSession):
+    """Creates a user in a tenant; the default tenant's users are fixtures."""
+    async def make(tenant: Tenant, email: str, role: UserRole = UserRole.WORKER) -> User:
+        return await _create_user(session, tenant, email, role)
+
+    return make
+
+
+@pytest.fixture
+def auth_headers():
+    """Returns the bearer token headers of a user."""
+    return _auth_headers
+
+
+@pytest.fixture
+def admin_headers(admin_user: User) -> dict:
+    return _auth_headers(admin_user)
+
+
+@pytest.fixture
+def worker_headers(worker_user: User) -> dict:
+    return _auth_headers(worker_user)
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def other_worker(session: AsyncSession, tenant: Tenant) -> User:
+    """A second worker of the default tenant, e.g. for reassignments."""
+    return await _create_user(session, tenant, "other@example.com", UserRole.WORKER)
+
+
+@pytest.fixture
+def other_worker_headers(other_worker: User) -> dict:
+    return _auth_headers(other_worker)
+
+
+def _repair_request(title: str = "Laptop", **overrides) -> dict:
+    return {
+        "title": title,
+        "description": f"{title} does not turn on",
+        "client_full_name": "Jane Client",
+        "client_email": f"{title.lower().replace(' ', '.')}@example.com",
+        "client_phone": "+100",
+        **overrides,
+    }
+
+
+@pytest.fixture
+def repair_request():
+    """Builds public repair request bodies; each title has its own client."""
+    return _repair_request
+
+
+@pytest.fixture
+def new_ticket(client: AsyncClient, tenant: Tenant):
+    """Submits a public repair request and returns the new ticket's id."""
+    async def submit(title: str = "Laptop", **overrides) -> str:
+        response = await client.post(
+            "/api/v1/public/repair-requests",
+            json=_repair_request(title, **overrides)
+        )
+        assert response.status_code == 201
+        return response.json()["id"]
+
+    return submit
+
+
+@pytest.fixture
+def assigned_ticket(client: AsyncClient, admin_headers: dict, new_ticket):
+    """Submits a repair request and has the admin assign it to ``worker``."""
+    async def submit(worker: User, title: str = "Laptop") -> str:
+        ticket_id = await new_ticket(title)
+        response = await client.post(
+            f"/api/v1/tickets/{ticket_id}/assign",
+            json={"assigned_to": str(worker.id)},
+            headers=admin_headers
+        )
+        assert response.status_code == 200
+        return ticket_id
+
+    return submit
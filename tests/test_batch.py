@@ -0,0 +1,57 @@
+import uuid
+
+from app.schemas.batch import MAX_BATCH_SIZE
+
+
+async def test_ticket_batch_reports_each_item(
+    client, assigned_ticket, admin_headers, worker_user, worker_headers, other_worker
+):
+    mine = await assigned_ticket(worker_user, "Laptop")
+    theirs = await assigned_ticket(other_worker, "Phone")
+    missing = str(uuid.uuid4())
+
+    response = await client.post(
+        "/api/v1/tickets/batch",
+        json={"ids": [mine, theirs, missing, mine]},
+        headers=worker_headers
+    )
+    assert response.status_code == 200
+    items = response.json()["items"]
+    assert [(item["id"], item["status"]) for item in items] == [
+        (mine, 200), (theirs, 403), (missing, 404)
+    ]
+    assert items[0]["data"]["title"] == "Laptop"
+    assert items[1]["data"] is None and items[1]["detail"] == "Access denied"
+    assert items[2]["data"] is None and items[2]["detail"] == "Ticket not found"
+
+    response = await client.post(
+        "/api/v1/tickets/batch",
+        json={"ids": [mine, theirs]},
+        headers=admin_headers
+    )
+    assert [item["status"] for item in response.json()["items"]] == [200, 200]
+
+
+async def test_ticket_batch_size_is_bounded(client, admin_headers):
+    response = await client.post("/api/v1/tickets/batch", json={"ids": []}, headers=admin_headers)
+    assert response.status_code == 422
+
+    ids = [str(uuid.uuid4()) for _ in range(MAX_BATCH_SIZE + 1)]
+    response = await client.post("/api/v1/tickets/batch", json={"ids": ids}, headers=admin_headers)
+    assert response.status_code == 422
+
+
+async def test_user_batch_is_admin_only(client, admin_user, admin_headers, worker_user, worker_headers):
+    missing = str(uuid.uuid4())
+    ids = [str(admin_user.id), str(worker_user.id), missing]
+
+    response = await client.post("/api/v1/users/batch", json={"ids": ids}, headers=admin_headers)
+    assert response.status_code == 200
+    items = response.json()["items"]
+    assert [(item["id"], item["status"]) for item in items] == [
+        (str(admin_user.id), 200), (str(worker_user.id), 200), (missing, 404)
+    ]
+    assert items[1]["data"]["email"] == worker_user.email
+
+    response = await client.post("/api/v1/users/batch", json={"ids": ids}, headers=worker_headers)
+    assert response.status_code == 403
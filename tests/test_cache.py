@@ -0,0 +1,99 @@
+import uuid
+
+from app.core.cache import (
+    ResponseCache,
+    response_cache,
+    tenant_scope,
+    ticket_scope,
+    tickets_scope,
+    worker_scope,
+)
+
+
+def test_stale_read_is_not_stored_after_invalidation():
+    cache = ResponseCache(max_entries=10, ttl_seconds=60)
+    tenant_id = uuid.uuid4()
+    scope = tickets_scope(tenant_id)
+
+    generation = cache.generation()
+    cache.invalidate(scope)
+    cache.set(scope, "page-1", "read before the write", generation)
+    assert cache.get(scope, "page-1") is None
+
+    cache.set(scope, "page-1", "fresh", cache.generation())
+    assert cache.get(scope, "page-1") == "fresh"
+
+
+def test_tenant_invalidation_leaves_other_tenants_alone():
+    cache = ResponseCache(max_entries=10, ttl_seconds=60)
+    tenant_a, tenant_b = uuid.uuid4(), uuid.uuid4()
+    generation = cache.generation()
+    cache.set(tickets_scope(tenant_a), "list", "a", generation)
+    cache.set(worker_scope(tenant_a, uuid.uuid4()), "list", "a", generation)
+    cache.set(tickets_scope(tenant_b), "list", "b", generation)
+
+    cache.invalidate(tenant_scope(tenant_a))
+
+    assert cache.get(tickets_scope(tenant_a), "list") is None
+    assert cache.get(tickets_scope(tenant_b), "list") == "b"
+
+    # Reads of tenant A that started before the invalidation are dropped too.
+    cache.set(ticket_scope(tenant_a, uuid.uuid4()), "detail", "stale", generation)
+    assert len(cache._entries) == 1
+
+
+def test_forgotten_invalidations_still_block_old_reads():
+    cache = ResponseCache(max_entries=1, ttl_seconds=60)
+    scope = tickets_scope(uuid.uuid4())
+    generation = cache.generation()
+    cache.invalidate(scope)
+    for _ in range(2000):
+        cache.invalidate(ticket_scope(uuid.uuid4(), uuid.uuid4()))
+    cache.set(scope, "list", "stale", generation)
+    assert cache.get(scope, "list") is None
+
+
+async def test_writes_invalidate_cached_ticket_responses(client, new_ticket, admin_headers, worker_user, worker_headers):
+    response = await client.get("/api/v1/tickets/", headers=admin_headers)
+    assert response.json()["total"] == 0
+    response = await client.get("/api/v1/tickets/", headers=worker_headers)
+    assert response.json()["total"] == 0
+
+    ticket_id = await new_ticket()
+
+    response = await client.get("/api/v1/tickets/", headers=admin_headers)
+    assert response.json()["total"] == 1
+    response = await client.get(f"/api/v1/tickets/{ticket_id}", headers=admin_headers)
+    assert response.json()["assigned_to"] is None
+
+    await client.post(
+        f"/api/v1/tickets/{ticket_id}/assign",
+        json={"assigned_to": str(worker_user.id)},
+        headers=admin_headers
+    )
+
+    response = await client.get(f"/api/v1/tickets/{ticket_id}", headers=admin_headers)
+    assert response.json()["assigned_to"] == str(worker_user.id)
+    response = await client.get("/api/v1/tickets/", headers=worker_headers)
+    assert response.json()["total"] == 1
+
+    await client.put(
+        f"/api/v1/users/{worker_user.id}",
+        json={"full_name": "Renamed Worker"},
+        headers=admin_headers
+    )
+    response = await client.get(f"/api/v1/tickets/{ticket_id}", headers=admin_headers)
+    assert response.json()["assigned_user"]["full_name"] == "Renamed Worker"
+
+
+async def test_user_change_keeps_other_tenants_cached(client, tenant, admin_user, admin_headers):
+    other_scope = tickets_scope(uuid.uuid4())
+    response_cache.set(other_scope, "list", "other tenant", response_cache.generation())
+
+    await client.put(
+        f"/api/v1/users/{admin_user.id}",
+        json={"full_name": "Renamed Admin"},
+        headers=admin_headers
+    )
+
+    assert response_cache.get(other_scope, "list") == "other tenant"
@@ -0,0 +1,47 @@
+from app.core.queries import NEXT_CLAIMABLE_TICKET
+
+
+def test_claim_status_is_rendered_into_the_sql():
+    sql = str(NEXT_CLAIMABLE_TICKET.compile())
+    assert "tickets.status = 'NEW'" in sql
+
+
+async def test_worker_claims_most_urgent_ticket_first(client, new_ticket, admin_headers, worker_user, worker_headers):
+    await new_ticket("Laptop")
+    due_later = await new_ticket("Phone")
+    due_sooner = await new_ticket("Tablet")
+    for ticket_id, due_at in ((due_later, "2030-01-02T00:00:00"), (due_sooner, "2030-01-01T00:00:00")):
+        await client.patch(
+            f"/api/v1/tickets/{ticket_id}/priority",
+            json={"priority": "urgent", "due_at": due_at},
+            headers=admin_headers
+        )
+
+    claimed = await client.post("/api/v1/tickets/claim", headers=worker_headers)
+    assert claimed.status_code == 200
+    assert claimed.json()["id"] == due_sooner
+    assert claimed.json()["status"] == "assigned"
+    assert claimed.json()["assigned_to"] == str(worker_user.id)
+
+    claimed = await client.post("/api/v1/tickets/claim", headers=worker_headers)
+    assert claimed.json()["id"] == due_later
+
+
+async def test_claim_skips_assigned_tickets_and_empties(
+    client, new_ticket, assigned_ticket, worker_user, worker_headers
+):
+    await assigned_ticket(worker_user, "Laptop")
+    free = await new_ticket("Phone")
+
+    claimed = await client.post("/api/v1/tickets/claim", headers=worker_headers)
+    assert claimed.json()["id"] == free
+
+    empty = await client.post("/api/v1/tickets/claim", headers=worker_headers)
+    assert empty.status_code == 204
+
+
+async def test_admin_cannot_claim(client, new_ticket, admin_headers):
+    await new_ticket()
+
+    response = await client.post("/api/v1/tickets/claim", headers=admin_headers)
+    assert response.status_code == 403
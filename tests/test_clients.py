@@ -0,0 +1,121 @@
+import pytest
+
+from app.api.v1.clients import autocomplete_cache
+from app.utils import prefix_cache
+from app.utils.prefix_cache import PrefixCache
+
+
+def _starts_with(item: str, prefix: str) -> bool:
+    return item.startswith(prefix)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(prefix_cache.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_complete_result_answers_longer_prefixes(clock):
+    cache = PrefixCache(10, 30)
+    cache.put("la", 5, ["laptop", "lamp"])
+
+    assert cache.get("la", 5, _starts_with) == ["laptop", "lamp"]
+    assert cache.get("lap", 5, _starts_with) == ["laptop"]
+    assert cache.get("la", 1, _starts_with) == ["laptop"]
+    assert cache.get("la", 10, _starts_with) == ["laptop", "lamp"]
+
+
+def test_truncated_result_only_answers_its_own_prefix(clock):
+    cache = PrefixCache(10, 30)
+    cache.put("la", 2, ["laptop", "lamp"])
+
+    assert cache.get("la", 2, _starts_with) == ["laptop", "lamp"]
+    assert cache.get("la", 5, _starts_with) is None
+    assert cache.get("lap", 2, _starts_with) is None
+
+
+def test_entries_expire_and_are_evicted(clock):
+    cache = PrefixCache(2, 30)
+    cache.put("la", 5, ["laptop"])
+    clock[0] += 31
+    assert cache.get("la", 5, _starts_with) is None
+    assert cache.get("lap", 5, _starts_with) is None
+
+    cache.put("ph", 5, ["phone"])
+    cache.put("ta", 5, ["tablet"])
+    cache.get("ph", 5, _starts_with)
+    cache.put("tv", 5, ["tv"])
+    assert cache.get("ta", 5, _starts_with) is None
+    assert cache.get("ph", 5, _starts_with) == ["phone"]
+
+    disabled = PrefixCache(0, 30)
+    disabled.put("la", 5, ["laptop"])
+    assert disabled.get("la", 5, _starts_with) is None
+
+
+def test_namespaces_do_not_share_entries(clock):
+    cache = PrefixCache(10, 30)
+    cache.put("la", 5, ["laptop"], namespace="a")
+
+    assert cache.get("la", 5, _starts_with, namespace="b") is None
+    assert cache.get("lap", 5, _starts_with, namespace="b") is None
+
+
+async def test_list_clients_is_paginated(client, new_ticket, admin_headers, worker_headers):
+    for title in ("Laptop", "Phone", "Tablet"):
+        await new_ticket(title)
+
+    response = await client.get("/api/v1/clients/?page=1&page_size=2", headers=admin_headers)
+    assert response.status_code == 200
+    assert response.json()["total"] == 3
+    assert response.json()["total_pages"] == 2
+    assert [c["email"] for c in response.json()["items"]] == ["tablet@example.com", "phone@example.com"]
+
+    response = await client.get("/api/v1/clients/", headers=worker_headers)
+    assert response.status_code == 403
+
+
+async def test_lookup_by_email_or_phone(client, new_ticket, admin_headers):
+    await new_ticket("Laptop", client_phone="+1 555 0100")
+
+    response = await client.get("/api/v1/clients/lookup?email=laptop@example.com", headers=admin_headers)
+    assert response.status_code == 200
+    assert response.json()["phone"] == "+1 555 0100"
+
+    response = await client.get("/api/v1/clients/lookup", params={"phone": "+1 555 0100"}, headers=admin_headers)
+    assert response.json()["email"] == "laptop@example.com"
+
+    response = await client.get("/api/v1/clients/lookup?email=nobody@example.com", headers=admin_headers)
+    assert response.status_code == 404
+
+    response = await client.get("/api/v1/clients/lookup", headers=admin_headers)
+    assert response.status_code == 400
+
+
+async def test_autocomplete_matches_name_email_and_phone(client, tenant, new_ticket, admin_headers):
+    await new_ticket("Laptop", client_full_name="Laura Palmer", client_phone="+44 20 7946")
+    await new_ticket("Phone", client_full_name="Dale Cooper", client_phone="+1 555 0100")
+
+    async def names(q: str) -> list[str]:
+        response = await client.get("/api/v1/clients/autocomplete", params={"q": q}, headers=admin_headers)
+        assert response.status_code == 200
+        return [c["full_name"] for c in response.json()]
+
+    assert await names("LA") == ["Laura Palmer"]
+    assert await names("phone@") == ["Dale Cooper"]
+    assert await names("+1 5") == ["Dale Cooper"]
+    assert await names("%a") == []
+
+    # The complete result for "la" answers "lau" without a new entry.
+    assert await names("lau") == ["Laura Palmer"]
+    assert (tenant.id, "lau") not in autocomplete_cache._entries
+
+
+async def test_autocomplete_rejects_blank_prefixes(client, tenant, admin_headers):
+    for q in ("  ", " a ", "a"):
+        response = await client.get("/api/v1/clients/autocomplete", params={"q": q}, headers=admin_headers)
+        assert response.status_code == 422
+
+    response = await client.get("/api/v1/clients/autocomplete", params={"q": " la "}, headers=admin_headers)
+    assert response.status_code == 200
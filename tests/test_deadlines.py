@@ -0,0 +1,195 @@
+import asyncio
+
+import pytest
+from fastapi import APIRouter, Depends, FastAPI
+from fastapi.responses import JSONResponse
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError, TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.deadlines import (
+    Deadline,
+    DeadlineMiddleware,
+    DeadlineRoute,
+    database_error_handler,
+    pool_timeout_handler,
+    track_session,
+)
+
+
+def _app(router: APIRouter, timeout: float = 15) -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(DeadlineMiddleware, timeout=timeout)
+    app.add_exception_handler(DBAPIError, database_error_handler)
+    app.add_exception_handler(PoolTimeoutError, pool_timeout_handler)
+    app.include_router(router)
+    return app
+
+
+async def _get(app: FastAPI, path: str):
+    transport = ASGITransport(app=app, raise_app_exceptions=False)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        return await client.get(path)
+
+
+async def test_request_past_its_deadline_gets_504_and_is_cancelled():
+    router = APIRouter(route_class=DeadlineRoute)
+    cancelled = asyncio.Event()
+
+    @router.get("/slow")
+    async def slow():
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    response = await _get(_app(router, timeout=0.05), "/slow")
+
+    assert response.status_code == 504
+    assert response.json() == {"detail": "Request deadline exceeded"}
+    assert cancelled.is_set()
+
+
+async def test_route_deadline_replaces_the_default():
+    router = APIRouter(route_class=DeadlineRoute)
+
+    @router.get("/long", dependencies=[Depends(Deadline(5))])
+    async def long():
+        await asyncio.sleep(0.1)
+        return {"ok": True}
+
+    response = await _get(_app(router, timeout=0.05), "/long")
+
+    assert response.status_code == 200
+
+
+async def test_client_disconnect_cancels_the_handler():
+    started, cancelled = asyncio.Event(), asyncio.Event()
+
+    async def handler(scope, receive, send):
+        started.set()
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    messages = [{"type": "http.request", "body": b"", "more_body": False}]
+
+    async def receive():
+        if messages:
+            return messages.pop()
+        await started.wait()
+        return {"type": "http.disconnect"}
+
+    sent = []
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {"type": "http", "method": "GET", "path": "/"}
+    await asyncio.wait_for(DeadlineMiddleware(handler, timeout=15)(scope, receive, send), 1)
+
+    assert cancelled.is_set()
+    assert sent == []
+
+
+class _Session:
+    closed = False
+
+    async def close(self):
+        self.closed = True
+
+
+async def test_route_releases_sessions_before_the_response_is_rendered():
+    router = APIRouter(route_class=DeadlineRoute)
+    session = _Session()
+    closed_at_render = []
+
+    class RecordingResponse(JSONResponse):
+        def render(self, content):
+            closed_at_render.append(session.closed)
+            return super().render(content)
+
+    @router.get("/tracked", response_class=RecordingResponse)
+    async def tracked():
+        track_session(session)
+        assert not session.closed
+        return {"ok": True}
+
+    response = await _get(_app(router), "/tracked")
+
+    assert response.status_code == 200
+    assert closed_at_render == [True]
+
+
+def _db_router(engine, statement: str, deadline: Deadline) -> APIRouter:
+    router = APIRouter(route_class=DeadlineRoute)
+
+    @router.get("/db", dependencies=[Depends(deadline)])
+    async def run():
+        async with AsyncSession(engine) as session:
+            result = await session.execute(text(statement))
+            return {"rows": [list(row) for row in result]}
+
+    return router
+
+
+async def test_transactions_start_with_the_route_timeouts(engine):
+    statement = "SELECT current_setting('statement_timeout'), current_setting('lock_timeout')"
+
+    router = _db_router(engine, statement, Deadline(None, statement_timeout_ms=1234, lock_timeout_ms=567))
+    response = await _get(_app(router), "/db")
+    assert response.json()["rows"] == [["1234ms", "567ms"]]
+
+    # The remaining request time caps both timeouts.
+    router = _db_router(engine, statement, Deadline(0.5, statement_timeout_ms=0, lock_timeout_ms=0))
+    response = await _get(_app(router), "/db")
+    statement_timeout, lock_timeout = response.json()["rows"][0]
+    assert statement_timeout == lock_timeout
+    assert 0 < int(statement_timeout.removesuffix("ms")) <= 500
+
+
+async def test_statement_timeout_is_answered_with_504(engine):
+    router = _db_router(engine, "SELECT pg_sleep(1)", Deadline(None, statement_timeout_ms=50))
+
+    response = await _get(_app(router), "/db")
+
+    assert response.status_code == 504
+    assert response.json() == {"detail": "Database query timed out"}
+
+
+async def test_lock_timeout_is_answered_with_503(engine):
+    router = _db_router(engine, "SELECT pg_advisory_xact_lock(4242)", Deadline(None, lock_timeout_ms=50))
+
+    async with engine.connect() as holder:
+        await holder.execute(text("SELECT pg_advisory_lock(4242)"))
+        try:
+            response = await _get(_app(router), "/db")
+        finally:
+            await holder.execute(text("SELECT pg_advisory_unlock(4242)"))
+
+    assert response.status_code == 503
+    assert response.headers["retry-after"] == "1"
+
+
+async def test_pool_timeout_is_answered_with_503():
+    router = APIRouter(route_class=DeadlineRoute)
+
+    @router.get("/busy")
+    async def busy():
+        raise PoolTimeoutError("QueuePool limit reached")
+
+    response = await _get(_app(router), "/busy")
+
+    assert response.status_code == 503
+    assert response.json() == {"detail": "Database is busy, try again"}
+
+
+async def test_other_database_errors_are_not_translated():
+    error = DBAPIError("SELECT 1", {}, Exception("connection reset"))
+
+    with pytest.raises(DBAPIError):
+        await database_error_handler(None, error)
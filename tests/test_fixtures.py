@@ -0,0 +1,29 @@
+import os
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.engine import make_url
+
+from app.config import settings
+from app.models.ticket import Ticket
+from app.models.tenant import Tenant
+
+
+# Several runs land on the same xdist worker, so any data leaking out of
+# a test's rolled-back transaction would show up in the next one.
+@pytest.mark.parametrize("run", range(4))
+async def test_committed_data_is_rolled_back_between_tests(run, client, session, tenant, admin_headers, repair_request):
+    assert await session.scalar(select(func.count()).select_from(Ticket)) == 0
+    assert await session.scalar(select(func.count()).select_from(Tenant)) == 1
+
+    response = await client.post("/api/v1/public/repair-requests", json=repair_request(f"Broken device {run}"))
+    assert response.status_code == 201
+
+    response = await client.get("/api/v1/tickets/", headers=admin_headers)
+    assert response.json()["total"] == 1
+
+
+async def test_worker_has_its_own_database(engine):
+    configured = make_url(settings.DATABASE_URL).database
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "main")
+    assert engine.url.database == f"{configured}_test_{worker}"
@@ -0,0 +1,147 @@
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi import HTTPException, Response
+from sqlalchemy import func, select, update
+
+from app.core.idempotency import _claim, request_hash, run_idempotent
+from app.models.client import Client
+from app.models.idempotency import IdempotencyKey
+from app.models.ticket import Ticket
+
+async def _count(session, model) -> int:
+    return await session.scalar(select(func.count()).select_from(model))
+
+
+async def test_retry_replays_stored_response(client, session, tenant, repair_request):
+    headers = {"Idempotency-Key": "retry-1"}
+    first = await client.post("/api/v1/public/repair-requests", json=repair_request(), headers=headers)
+    second = await client.post("/api/v1/public/repair-requests", json=repair_request(), headers=headers)
+
+    assert first.status_code == second.status_code == 201
+    assert second.json() == first.json()
+    assert second.headers["Idempotent-Replayed"] == "true"
+    assert await _count(session, Ticket) == 1
+
+
+async def test_key_reused_with_other_body_is_rejected(client, tenant, repair_request):
+    headers = {"Idempotency-Key": "retry-2"}
+    await client.post("/api/v1/public/repair-requests", json=repair_request(), headers=headers)
+    response = await client.post(
+        "/api/v1/public/repair-requests",
+        json=repair_request("Phone"),
+        headers=headers
+    )
+
+    assert response.status_code == 422
+
+
+async def test_client_errors_are_replayed(client, worker_user, admin_headers):
+    headers = {**admin_headers, "Idempotency-Key": "assign-1"}
+    url = "/api/v1/tickets/00000000-0000-0000-0000-000000000001/assign"
+    body = {"assigned_to": str(worker_user.id)}
+
+    first = await client.post(url, json=body, headers=headers)
+    second = await client.post(url, json=body, headers=headers)
+
+    assert first.status_code == second.status_code == 404
+    assert second.headers["Idempotent-Replayed"] == "true"
+
+
+async def test_response_is_committed_with_the_writes(session, tenant):
+    async def handler():
+        session.add(Client(tenant_id=tenant.id, full_name="Jane", email="jane@example.com", phone="+100"))
+        await session.flush()
+        # Nothing is stored before the handler's writes are committed.
+        record = await session.get(IdempotencyKey, ("scope", "atomic"))
+        assert record.status_code is None
+        return {"ok": True}
+
+    await run_idempotent(session, "atomic", "scope", {}, Response(), handler, lambda r: r)
+
+    record = await session.get(IdempotencyKey, ("scope", "atomic"))
+    assert (record.status_code, record.response_body) == (200, {"ok": True})
+    assert record.locked_until is None
+    assert await _count(session, Client) == 1
+
+
+async def test_failed_handler_frees_the_key_and_its_writes(session, tenant):
+    async def handler():
+        session.add(Client(tenant_id=tenant.id, full_name="Jane", email="jane@example.com", phone="+100"))
+        await session.flush()
+        raise HTTPException(status_code=503, detail="Try again")
+
+    with pytest.raises(HTTPException):
+        await run_idempotent(session, "failed", "scope", {}, Response(), handler, lambda r: r)
+
+    assert await session.get(IdempotencyKey, ("scope", "failed")) is None
+    assert await _count(session, Client) == 0
+
+
+async def test_cancelled_handler_frees_the_key(session, tenant):
+    async def handler():
+        raise asyncio.CancelledError
+
+    with pytest.raises(asyncio.CancelledError):
+        await run_idempotent(session, "cancelled", "scope", {}, Response(), handler, lambda r: r)
+
+    assert await session.get(IdempotencyKey, ("scope", "cancelled")) is None
+
+
+async def _abandoned_key(session, key: str, locked_until: datetime) -> None:
+    session.add(IdempotencyKey(
+        scope="scope",
+        key=key,
+        request_hash="dead",
+        created_at=datetime.utcnow(),
+        locked_until=locked_until
+    ))
+    await session.commit()
+
+
+async def test_expired_lease_is_taken_over(session, tenant):
+    await _abandoned_key(session, "abandoned", datetime.utcnow() - timedelta(seconds=1))
+
+    async def handler():
+        return {"ran": True}
+
+    body = await run_idempotent(session, "abandoned", "scope", {}, Response(), handler, lambda r: r)
+
+    assert body == {"ran": True}
+
+
+async def test_live_lease_is_not_taken_over(session, tenant, monkeypatch):
+    monkeypatch.setattr("app.core.idempotency.settings.IDEMPOTENCY_WAIT_SECONDS", 0)
+    await _abandoned_key(session, "owned", datetime.utcnow() + timedelta(minutes=1))
+
+    async def handler():
+        raise AssertionError("ran twice")
+
+    with pytest.raises(HTTPException) as exc:
+        await run_idempotent(session, "owned", "scope", {}, Response(), handler, lambda r: r)
+
+    assert exc.value.status_code == 409
+
+
+async def test_request_that_lost_its_lease_discards_its_writes(session, tenant):
+    async def handler():
+        # The lease runs out mid-request and a retry takes the key over.
+        await session.execute(
+            update(IdempotencyKey)
+            .where(IdempotencyKey.key == "slow")
+            .values(locked_until=datetime.utcnow() - timedelta(seconds=1))
+        )
+        assert await _claim(session, "scope", "slow", request_hash({})) is not None
+        session.add(Client(tenant_id=tenant.id, full_name="Jane", email="jane@example.com", phone="+100"))
+        await session.flush()
+        return {"ok": True}
+
+    with pytest.raises(HTTPException) as exc:
+        await run_idempotent(session, "slow", "scope", {}, Response(), handler, lambda r: r)
+
+    assert exc.value.status_code == 409
+    assert await _count(session, Client) == 0
+    record = await session.get(IdempotencyKey, ("scope", "slow"), populate_existing=True)
+    assert record.status_code is None
+    assert record.locked_until > datetime.utcnow()
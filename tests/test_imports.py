@@ -0,0 +1,87 @@
+import pytest
+from sqlalchemy import select, update
+
+from app.core import importer
+from app.models.import_run import ImportRun
+from app.models.ticket import Ticket
+from app.models.user import UserRole
+
+HEADER = "title,description,created_at,client_full_name,client_email,client_phone,worker_email\n"
+ROW = "Laptop,Screen is black,2024-01-02T10:00:00,Jane Client,jane@example.com,+100,\n"
+
+
+@pytest.fixture
+def run_in_session(session, monkeypatch):
+    """Write import progress through the test session instead of a new one."""
+    async def update_run(import_id, **values):
+        await session.execute(update(ImportRun).where(ImportRun.id == import_id).values(**values))
+
+    monkeypatch.setattr(importer, "_update_run", update_run)
+
+
+async def _import(client, session, admin_headers, body: str) -> dict:
+    created = await client.post(
+        "/api/v1/admin/imports/?format=csv",
+        content=body.encode(),
+        headers=admin_headers
+    )
+    assert created.status_code == 202
+    import_id = created.json()["id"]
+
+    await importer.handle_import({"import_id": import_id}, session)
+
+    response = await client.get(f"/api/v1/admin/imports/{import_id}", headers=admin_headers)
+    return response.json()
+
+
+async def test_repeated_rows_are_imported_once(client, session, admin_headers, run_in_session):
+    run = await _import(client, session, admin_headers, HEADER + ROW + ROW)
+
+    assert run["status"] == "done"
+    assert (run["tickets_created"], run["tickets_skipped"], run["clients_created"]) == (1, 1, 1)
+    assert len((await session.execute(select(Ticket))).scalars().all()) == 1
+
+    # Importing the same file again changes nothing.
+    again = await _import(client, session, admin_headers, HEADER + ROW)
+    assert (again["tickets_created"], again["tickets_skipped"]) == (0, 1)
+
+
+async def test_rejected_rows_are_listed_in_the_error_file(client, session, admin_headers, run_in_session):
+    body = (
+        HEADER
+        + ROW
+        + ",No title,2024-01-02T10:00:00,Jane Client,jane@example.com,+100,\n"
+        + "Phone,Cracked,2024-01-03T10:00:00,Jane Client,jane@example.com,+100,nobody@example.com\n"
+    )
+    run = await _import(client, session, admin_headers, body)
+
+    assert run["status"] == "done"
+    assert (run["tickets_created"], run["rows_failed"]) == (1, 2)
+
+    errors = await client.get(f"/api/v1/admin/imports/{run['id']}/errors", headers=admin_headers)
+    assert errors.status_code == 200
+    assert errors.text.splitlines() == [
+        "line,error",
+        "3,title is required",
+        "4,Unknown worker email: nobody@example.com",
+    ]
+
+
+async def test_no_error_file_without_rejected_rows(client, session, admin_headers, run_in_session):
+    run = await _import(client, session, admin_headers, HEADER + ROW)
+
+    errors = await client.get(f"/api/v1/admin/imports/{run['id']}/errors", headers=admin_headers)
+    assert errors.status_code == 404
+
+
+async def test_admin_who_ran_an_import_can_be_deleted(
+    client, session, tenant, admin_headers, make_user, auth_headers, run_in_session
+):
+    importer_admin = await make_user(tenant, "importer@example.com", UserRole.ADMIN)
+    run = await _import(client, session, auth_headers(importer_admin), HEADER + ROW)
+
+    response = await client.delete(f"/api/v1/users/{importer_admin.id}", headers=admin_headers)
+
+    assert response.status_code == 204
+    record = await session.get(ImportRun, run["id"], populate_existing=True)
+    assert record.created_by is None
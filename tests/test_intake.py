@@ -0,0 +1,67 @@
+from app.utils.fingerprint import similarity, ticket_fingerprint, ticket_trigrams
+
+
+# The same client reporting a washing machine, retitled per test.
+WASHER = {
+    "title": "Washing machine broken",
+    "description": "It does not spin!",
+    "client_email": "jane@example.com",
+    "client_phone": "+1 555 0100",
+}
+
+
+def test_fingerprint_ignores_case_punctuation_order_and_filler_words():
+    assert ticket_fingerprint("Washing machine broken", "It does not spin!") == ticket_fingerprint(
+        "broken washing MACHINE.", "please help, spin does"
+    )
+
+
+def test_similarity_tolerates_typos_and_extra_detail():
+    original = ticket_trigrams("Washing machine broken", "It does not spin")
+    assert similarity(original, ticket_trigrams("Washing machnie broken", "It does not spin")) >= 0.6
+    assert similarity(original, ticket_trigrams("Washing machine broken", "Does not spin, leaks water")) >= 0.6
+    assert similarity(original, ticket_trigrams("Washing machine broken", "It makes a loud noise")) < 0.6
+    assert similarity(original, set()) == 0.0
+
+
+async def test_resubmission_is_merged_into_open_ticket(client, tenant, repair_request):
+    first = await client.post("/api/v1/public/repair-requests", json=repair_request(**WASHER))
+    assert first.status_code == 201
+
+    again = await client.post(
+        "/api/v1/public/repair-requests",
+        json=repair_request(**{**WASHER, "title": "Washing machnie broken", "description": "does not spin, please help"})
+    )
+    assert again.status_code == 200
+    assert again.json()["id"] == first.json()["id"]
+    assert again.json()["duplicate_count"] == 1
+
+
+async def test_different_problem_creates_new_ticket(client, tenant, admin_headers, repair_request):
+    await client.post("/api/v1/public/repair-requests", json=repair_request(**WASHER))
+    other = await client.post(
+        "/api/v1/public/repair-requests",
+        json=repair_request(**{**WASHER, "title": "Fridge", "description": "Not cooling"})
+    )
+    assert other.status_code == 201
+
+    response = await client.get("/api/v1/tickets/", headers=admin_headers)
+    assert response.json()["total"] == 2
+
+
+async def test_existing_ticket_is_not_disclosed_without_matching_phone(client, tenant, admin_headers, repair_request):
+    first = await client.post("/api/v1/public/repair-requests", json=repair_request(**WASHER))
+
+    other = await client.post(
+        "/api/v1/public/repair-requests",
+        json=repair_request(**{**WASHER, "client_phone": "+1 555 0199"})
+    )
+    assert other.status_code == 201
+    assert other.json()["id"] != first.json()["id"]
+    assert other.json()["duplicate_count"] == 0
+
+    same_number = await client.post(
+        "/api/v1/public/repair-requests",
+        json=repair_request(**{**WASHER, "client_phone": "(1) 555-0100"})
+    )
+    assert same_number.status_code == 200
@@ -0,0 +1,105 @@
+from datetime import datetime, timedelta
+
+from sqlalchemy import select
+
+from app.config import settings
+from app.core import notifications
+from app.core.jobs import JOB_HANDLERS, backoff_delay, claim_job, enqueue, run_job
+from app.models.job import Job, JobStatus
+
+
+async def _failing(payload, db):
+    raise RuntimeError("boom")
+
+
+async def _run_pending(session) -> int:
+    ran = 0
+    while (job := await claim_job(session)) is not None:
+        await run_job(session, job)
+        ran += 1
+    return ran
+
+
+async def _jobs(session, kind: str) -> list[Job]:
+    result = await session.execute(
+        select(Job).where(Job.kind == kind).execution_options(populate_existing=True)
+    )
+    return result.scalars().all()
+
+
+def test_backoff_grows_and_is_capped():
+    assert 2.5 <= backoff_delay(1) <= 5
+    assert 20 <= backoff_delay(4) <= 40
+    assert backoff_delay(30) <= 3600
+
+
+async def test_failed_job_is_retried_later(session, monkeypatch):
+    monkeypatch.setitem(JOB_HANDLERS, "failing", (_failing, 5))
+    await enqueue(session, "failing", {})
+    await session.commit()
+
+    assert await _run_pending(session) == 1
+
+    [job] = await _jobs(session, "failing")
+    assert (job.status, job.attempts) == (JobStatus.PENDING, 1)
+    assert job.run_at > datetime.utcnow()
+    assert job.last_error == "RuntimeError: boom"
+    assert job.locked_at is None
+    # Not runnable again until the backoff has passed.
+    assert await claim_job(session) is None
+
+
+async def test_job_fails_after_max_attempts(session, monkeypatch):
+    monkeypatch.setitem(JOB_HANDLERS, "failing", (_failing, 5))
+    job = await enqueue(session, "failing", {})
+    job.max_attempts = 1
+    await session.commit()
+
+    await _run_pending(session)
+
+    [job] = await _jobs(session, "failing")
+    assert (job.status, job.attempts) == (JobStatus.FAILED, 1)
+
+
+async def test_job_of_dead_runner_is_reclaimed(session):
+    job = await enqueue(session, "unknown", {})
+    job.status = JobStatus.RUNNING
+    job.attempts = 1
+    job.locked_at = datetime.utcnow() - timedelta(seconds=settings.JOB_TIMEOUT * 3)
+    await session.commit()
+
+    claimed = await claim_job(session)
+
+    assert claimed.id == job.id
+    assert claimed.attempts == 2
+
+
+async def test_failing_sms_does_not_resend_email(session, assigned_ticket, worker_user, monkeypatch):
+    emails, texts = [], []
+
+    async def send_email(to, subject, body):
+        emails.append(to)
+
+    async def send_sms(to, body):
+        texts.append(to)
+        raise RuntimeError("gateway down")
+
+    monkeypatch.setattr(settings, "SMS_WEBHOOK_URL", "http://sms.invalid")
+    monkeypatch.setattr(notifications, "send_email", send_email)
+    monkeypatch.setattr(notifications, "send_sms", send_sms)
+
+    await assigned_ticket(worker_user)
+
+    assert await _run_pending(session) == 2
+    [email_job] = await _jobs(session, notifications.NOTIFY_CLIENT_EMAIL)
+    [sms_job] = await _jobs(session, notifications.NOTIFY_CLIENT_SMS)
+    assert email_job.status == JobStatus.DONE
+    assert (sms_job.status, sms_job.attempts) == (JobStatus.PENDING, 1)
+
+    # The SMS retry runs on its own.
+    sms_job.run_at = datetime.utcnow()
+    await session.commit()
+    await _run_pending(session)
+
+    assert emails == ["laptop@example.com"]
+    assert texts == ["+100", "+100"]
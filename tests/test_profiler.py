@@ -0,0 +1,101 @@
+import uuid
+from collections import deque
+
+from sqlalchemy import event, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.profiler import SQLProfiler, sanitize_parameters, sql_profiler
+from app.core.tenancy import set_tenant
+from app.models.user import User, UserRole
+
+
+def test_parameters_keep_only_ids_and_numbers():
+    ticket_id = uuid.uuid4()
+    positional = ("jane@example.com", "+100", ticket_id, 20, None, b"\x00\x01")
+
+    assert sanitize_parameters(positional) == [
+        "<str len=16>", "<str len=4>", ticket_id, 20, None, "<bytes len=2>"
+    ]
+    assert sanitize_parameters({"full_name": "Jane Client", "limit": 5}) == {
+        "full_name": "<str len=11>", "limit": 5
+    }
+
+
+async def test_slow_select_is_explained_without_running_it_again(engine):
+    profiler = SQLProfiler(enabled=True, threshold_ms=0, explain_sample_rate=1.0)
+    profiler.attach(engine.sync_engine)
+    try:
+        async with engine.connect() as conn:
+            await conn.execute(text("CREATE TEMPORARY SEQUENCE profiled"))
+            await conn.execute(
+                text("SELECT nextval('profiled'), :email"),
+                {"email": "jane@example.com"}
+            )
+            # EXPLAIN ANALYZE would have advanced the sequence twice.
+            assert await conn.scalar(text("SELECT currval('profiled')")) == 1
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", profiler._before)
+        event.remove(engine.sync_engine, "after_cursor_execute", profiler._after)
+
+    [entry] = [e for e in profiler.recent if "nextval" in e["statement"]]
+    assert entry["plan"].startswith("Result")
+    assert "jane@example.com" not in str(entry["parameters"])
+
+
+async def test_slow_queries_are_attributed_to_the_tenant(engine):
+    profiler = SQLProfiler(enabled=True, threshold_ms=0, explain_sample_rate=0)
+    profiler.attach(engine.sync_engine)
+    tenant_id = uuid.uuid4()
+    try:
+        async with AsyncSession(engine) as session:
+            set_tenant(session, tenant_id)
+            await session.execute(select(User).where(User.email == "jane@example.com"))
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", profiler._before)
+        event.remove(engine.sync_engine, "after_cursor_execute", profiler._after)
+
+    assert any("FROM users" in e["statement"] for e in profiler.entries(tenant_id))
+    assert profiler.entries(uuid.uuid4()) == []
+
+
+async def test_admins_only_see_their_tenants_slow_queries(client, admin_user, admin_headers, monkeypatch):
+    def entry(tenant_id, statement):
+        return {
+            "at": "2024-01-01T00:00:00",
+            "duration_ms": 500.0,
+            "route": None,
+            "tenant_id": tenant_id,
+            "statement": statement,
+            "parameters": [],
+            "plan": None,
+        }
+
+    other = uuid.uuid4()
+    monkeypatch.setattr(sql_profiler, "recent", deque([
+        entry(admin_user.tenant_id, "SELECT mine"),
+        entry(other, "SELECT theirs"),
+    ]))
+
+    response = await client.get("/api/v1/admin/profiler/", headers=admin_headers)
+    assert [q["statement"] for q in response.json()["slow_queries"]] == ["SELECT mine"]
+
+    await client.delete("/api/v1/admin/profiler/slow-queries", headers=admin_headers)
+    assert [e["statement"] for e in sql_profiler.recent] == ["SELECT theirs"]
+
+
+async def test_only_operator_admins_change_the_profiler(
+    client, admin_headers, worker_headers, other_tenant, make_user, auth_headers
+):
+    other_admin = await make_user(other_tenant, "admin@other.example.com", UserRole.ADMIN)
+    unchanged = {"threshold_ms": sql_profiler.threshold_ms}
+
+    response = await client.put("/api/v1/admin/profiler/", json=unchanged, headers=auth_headers(other_admin))
+    assert response.status_code == 403
+    response = await client.put("/api/v1/admin/profiler/", json=unchanged, headers=worker_headers)
+    assert response.status_code == 403
+
+    response = await client.put("/api/v1/admin/profiler/", json=unchanged, headers=admin_headers)
+    assert response.status_code == 200
+
+    response = await client.get("/api/v1/admin/profiler/", headers=auth_headers(other_admin))
+    assert response.status_code == 200
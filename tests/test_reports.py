@@ -0,0 +1,88 @@
+from datetime import datetime, timedelta
+
+from sqlalchemy import select
+
+from app.core.reports import refresh_rollup
+from app.models.client import Client
+from app.models.report import TicketDailyStats, TicketDailyStatsDirty
+from app.models.ticket import Ticket, TicketStatus
+
+
+async def _rollup(session) -> dict:
+    result = await session.execute(select(TicketDailyStats))
+    return {
+        (row.day, row.worker_id): (row.created, row.assigned, row.completed)
+        for row in result.scalars()
+    }
+
+
+async def _backdated_ticket(session, tenant, worker, days_ago: int, completed: bool = False) -> Ticket:
+    client = Client(tenant_id=tenant.id, full_name="Jane", email=f"jane{days_ago}@example.com", phone="+100")
+    session.add(client)
+    await session.flush()
+    when = datetime.utcnow() - timedelta(days=days_ago)
+    ticket = Ticket(
+        tenant_id=tenant.id,
+        title="Old repair",
+        description="Imported",
+        client_id=client.id,
+        assigned_to=worker.id,
+        status=TicketStatus.DONE if completed else TicketStatus.ASSIGNED,
+        created_at=when,
+        assigned_at=when,
+        completed_at=when if completed else None
+    )
+    session.add(ticket)
+    await session.commit()
+    return ticket
+
+
+async def test_refresh_counts_created_assigned_and_completed(session, tenant, worker_user):
+    ticket = await _backdated_ticket(session, tenant, worker_user, days_ago=3, completed=True)
+    await refresh_rollup(session, full=True)
+
+    day = ticket.created_at.date()
+    assert await _rollup(session) == {
+        (day, None): (1, 0, 0),
+        (day, worker_user.id): (0, 1, 1),
+    }
+
+
+async def test_incremental_refresh_recounts_reassigned_past_days(session, tenant, worker_user, other_worker):
+    ticket = await _backdated_ticket(session, tenant, worker_user, days_ago=5, completed=True)
+    await refresh_rollup(session, full=True)
+    # A newer bucket, so the incremental pass alone would start after day 5.
+    await _backdated_ticket(session, tenant, worker_user, days_ago=1)
+    await refresh_rollup(session)
+
+    ticket.assigned_to = other_worker.id
+    await session.commit()
+    assert (await session.execute(select(TicketDailyStatsDirty))).scalars().all()
+
+    assert await refresh_rollup(session) == ticket.created_at.date()
+
+    day = ticket.created_at.date()
+    rollup = await _rollup(session)
+    assert (day, worker_user.id) not in rollup
+    assert rollup[(day, other_worker.id)] == (0, 1, 1)
+    assert not (await session.execute(select(TicketDailyStatsDirty))).scalars().all()
+
+
+async def test_todays_writes_leave_no_marker(session, assigned_ticket, worker_user):
+    await assigned_ticket(worker_user)
+
+    assert not (await session.execute(select(TicketDailyStatsDirty))).scalars().all()
+
+
+async def test_refresh_endpoint_rebuilds_only_the_callers_tenant(
+    client, session, tenant, worker_user, admin_headers, other_tenant, make_user
+):
+    other_worker = await make_user(other_tenant, "worker@other.example.com")
+    await _backdated_ticket(session, tenant, worker_user, days_ago=2)
+    await _backdated_ticket(session, other_tenant, other_worker, days_ago=2)
+
+    response = await client.post("/api/v1/reports/refresh?full=true", headers=admin_headers)
+
+    assert response.status_code == 200
+    result = await session.execute(select(TicketDailyStats.tenant_id).distinct())
+    assert result.scalars().all() == [tenant.id]
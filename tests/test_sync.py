@@ -0,0 +1,164 @@
+import time
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import select, text
+
+from app.config import settings
+from app.core.sync import START, ExpiredSyncToken, decode_token, encode_token, purge_removals
+from app.models.ticket import TicketRemoval
+
+
+def test_token_round_trip():
+    now = int(time.time())
+    ticket_id = uuid.uuid4()
+
+    assert decode_token(encode_token(42, now)) == (None, (42, START[1]), 42, now)
+    assert decode_token(encode_token(42, now, (7, ticket_id), 40)) == (42, (7, ticket_id), 40, now)
+
+    expired = now - settings.SYNC_TOKEN_TTL_DAYS * 86400 - 1
+    with pytest.raises(ExpiredSyncToken):
+        decode_token(encode_token(42, expired))
+
+
+async def test_sync_pages_through_assigned_tickets(client, assigned_ticket, worker_user, worker_headers):
+    first = await assigned_ticket(worker_user, "Laptop")
+    second = await assigned_ticket(worker_user, "Phone")
+
+    page = await client.get("/api/v1/tickets/sync?limit=1", headers=worker_headers)
+    assert page.status_code == 200
+    assert page.json()["has_more"] is True
+    seen = [t["id"] for t in page.json()["changed"]]
+
+    page = await client.get(
+        f"/api/v1/tickets/sync?limit=1&sync_token={page.json()['sync_token']}",
+        headers=worker_headers
+    )
+    assert page.json()["has_more"] is False
+    seen += [t["id"] for t in page.json()["changed"]]
+
+    assert sorted(seen) == sorted([first, second])
+    assert ":" not in page.json()["sync_token"]
+
+
+async def _sync(client, headers, token=None) -> dict:
+    params = {"sync_token": token} if token else {}
+    response = await client.get("/api/v1/tickets/sync", params=params, headers=headers)
+    assert response.status_code == 200
+    return response.json()
+
+
+async def _token_after_commit(session) -> str:
+    """The token a device gets once the test's writes have committed.
+
+    Each test runs in one transaction, so every snapshot it reads has an
+    xmin at or below its own writes and the tokens it gets resend them.
+    """
+    xid = await session.scalar(text("SELECT pg_current_xact_id()::text::bigint"))
+    return encode_token(xid + 1, int(time.time()))
+
+
+async def _reassign(client, ticket_id, worker, headers) -> None:
+    response = await client.post(
+        f"/api/v1/tickets/{ticket_id}/assign",
+        json={"assigned_to": str(worker.id)},
+        headers=headers
+    )
+    assert response.status_code == 200
+
+
+async def test_up_to_date_device_gets_no_changes(
+    client, session, assigned_ticket, admin_headers, worker_user, worker_headers, other_worker
+):
+    moved = await assigned_ticket(worker_user, "Laptop")
+    kept = await assigned_ticket(worker_user, "Phone")
+    await _reassign(client, moved, other_worker, admin_headers)
+
+    # A token from before the writes gets both the change and the removal...
+    stale = (await _sync(client, worker_headers))["sync_token"]
+    page = await _sync(client, worker_headers, stale)
+    assert [t["id"] for t in page["changed"]] == [kept]
+    assert page["removed"] == [moved]
+
+    # ...a token from after them gets nothing.
+    page = await _sync(client, worker_headers, await _token_after_commit(session))
+    assert (page["changed"], page["removed"], page["has_more"]) == ([], [], False)
+
+
+async def test_reassigned_ticket_is_removed_from_previous_worker(
+    client, session, assigned_ticket, admin_headers, worker_user, worker_headers, other_worker, other_worker_headers
+):
+    ticket_id = await assigned_ticket(worker_user)
+    token = (await _sync(client, worker_headers))["sync_token"]
+
+    await _reassign(client, ticket_id, other_worker, admin_headers)
+
+    removals = (await session.execute(select(TicketRemoval))).scalars().all()
+    assert [(str(r.ticket_id), r.worker_id) for r in removals] == [(ticket_id, worker_user.id)]
+
+    previous = await _sync(client, worker_headers, token)
+    assert previous["changed"] == []
+    assert previous["removed"] == [ticket_id]
+
+    current = await _sync(client, other_worker_headers)
+    assert [t["id"] for t in current["changed"]] == [ticket_id]
+    assert current["removed"] == []
+
+
+async def test_first_sync_skips_earlier_removals(
+    client, assigned_ticket, admin_headers, worker_user, worker_headers, other_worker
+):
+    moved = await assigned_ticket(worker_user, "Laptop")
+    kept = await assigned_ticket(worker_user, "Phone")
+    await _reassign(client, moved, other_worker, admin_headers)
+
+    first = await _sync(client, worker_headers)
+    assert [t["id"] for t in first["changed"]] == [kept]
+    assert first["removed"] == []
+
+    # Later pages only send removals from the first page's snapshot on.
+    await assigned_ticket(worker_user, "Tablet")
+    page = (await client.get("/api/v1/tickets/sync?limit=1", headers=worker_headers)).json()
+    assert page["has_more"] is True
+    token = decode_token(page["sync_token"])
+    assert token.removed_since == token.resume_from
+
+
+async def test_expired_token_is_answered_with_410(client, tenant, worker_headers):
+    expired = int(time.time()) - settings.SYNC_TOKEN_TTL_DAYS * 86400 - 1
+
+    response = await client.get(
+        "/api/v1/tickets/sync",
+        params={"sync_token": encode_token(42, expired)},
+        headers=worker_headers
+    )
+
+    assert response.status_code == 410
+
+
+async def test_purge_keeps_removals_unexpired_tokens_need(session, tenant, worker_user):
+    for days in (0, settings.SYNC_TOKEN_TTL_DAYS + 2):
+        session.add(TicketRemoval(
+            tenant_id=tenant.id,
+            ticket_id=uuid.uuid4(),
+            worker_id=worker_user.id,
+            created_at=datetime.utcnow() - timedelta(days=days)
+        ))
+    await session.flush()
+
+    assert await purge_removals(session) == 1
+    remaining = (await session.execute(select(TicketRemoval))).scalars().all()
+    assert len(remaining) == 1
+
+
+async def test_invalid_token_is_rejected(client, tenant, worker_headers):
+    response = await client.get("/api/v1/tickets/sync?sync_token=abc", headers=worker_headers)
+
+    assert response.status_code == 400
+
+
+async def test_only_workers_sync(client, tenant, admin_headers):
+    response = await client.get("/api/v1/tickets/sync", headers=admin_headers)
+
+    assert response.status_code == 403
@@ -0,0 +1,169 @@
+import pytest_asyncio
+
+from app.models.user import UserRole
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def other_admin_headers(other_tenant, make_user, auth_headers) -> dict:
+    admin = await make_user(other_tenant, "admin@other.example.com", UserRole.ADMIN)
+    return auth_headers(admin)
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def ticket(client, session, assigned_ticket, admin_headers, worker_user) -> dict:
+    """A default-tenant ticket with an attachment."""
+    ticket_id = await assigned_ticket(worker_user)
+    ticket = (await client.get(f"/api/v1/tickets/{ticket_id}", headers=admin_headers)).json()
+    uploaded = await client.post(
+        f"/api/v1/tickets/{ticket_id}/attachments?filename=photo.png",
+        content=b"png",
+        headers={**admin_headers, "Content-Type": "image/png"}
+    )
+    assert uploaded.status_code == 201
+    ticket["attachment_id"] = uploaded.json()["id"]
+    # Every request gets its own session in production; don't let the next
+    # ones find these rows in the test session's identity map.
+    session.expunge_all()
+    return ticket
+
+
+async def test_other_tenant_cannot_read_tickets(client, ticket, other_admin_headers):
+    ticket_id = ticket["id"]
+
+    response = await client.get(f"/api/v1/tickets/{ticket_id}", headers=other_admin_headers)
+    assert response.status_code == 404
+
+    response = await client.get("/api/v1/tickets/", headers=other_admin_headers)
+    assert response.json()["total"] == 0
+
+    response = await client.post("/api/v1/tickets/batch", json={"ids": [ticket_id]}, headers=other_admin_headers)
+    assert response.json()["items"][0]["status"] == 404
+
+
+async def test_other_tenant_cannot_change_tickets(client, ticket, admin_headers, other_admin_headers, worker_user):
+    ticket_id = ticket["id"]
+
+    response = await client.patch(
+        f"/api/v1/tickets/{ticket_id}/priority",
+        json={"priority": "urgent"},
+        headers=other_admin_headers
+    )
+    assert response.status_code == 404
+
+    response = await client.patch(
+        f"/api/v1/tickets/{ticket_id}/status",
+        json={"status": "done"},
+        headers=other_admin_headers
+    )
+    assert response.status_code == 404
+
+    # The worker is not found in the other tenant either.
+    response = await client.post(
+        f"/api/v1/tickets/{ticket_id}/assign",
+        json={"assigned_to": str(worker_user.id)},
+        headers=other_admin_headers
+    )
+    assert response.status_code == 400
+
+    unchanged = (await client.get(f"/api/v1/tickets/{ticket_id}", headers=admin_headers)).json()
+    assert (unchanged["priority"], unchanged["status"]) == (ticket["priority"], ticket["status"])
+
+
+async def test_other_tenant_cannot_see_clients(client, ticket, other_admin_headers):
+    client_id = ticket["client_id"]
+    email = ticket["client"]["email"]
+
+    response = await client.get("/api/v1/clients/", headers=other_admin_headers)
+    assert response.json()["total"] == 0
+
+    response = await client.get(f"/api/v1/clients/{client_id}", headers=other_admin_headers)
+    assert response.status_code == 404
+
+    response = await client.get("/api/v1/clients/lookup", params={"email": email}, headers=other_admin_headers)
+    assert response.status_code == 404
+
+    response = await client.get("/api/v1/clients/autocomplete", params={"q": email[:3]}, headers=other_admin_headers)
+    assert response.json() == []
+
+
+async def test_other_tenant_cannot_read_or_change_users(client, admin_user, worker_user, other_admin_headers):
+    response = await client.get("/api/v1/users/", headers=other_admin_headers)
+    assert [u["email"] for u in response.json()["items"]] == ["admin@other.example.com"]
+
+    response = await client.get(f"/api/v1/users/{worker_user.id}", headers=other_admin_headers)
+    assert response.status_code == 404
+
+    response = await client.post(
+        "/api/v1/users/batch",
+        json={"ids": [str(admin_user.id), str(worker_user.id)]},
+        headers=other_admin_headers
+    )
+    assert [item["status"] for item in response.json()["items"]] == [404, 404]
+
+    response = await client.put(
+        f"/api/v1/users/{worker_user.id}",
+        json={"full_name": "Taken Over"},
+        headers=other_admin_headers
+    )
+    assert response.status_code == 404
+
+    response = await client.delete(f"/api/v1/users/{worker_user.id}", headers=other_admin_headers)
+    assert response.status_code == 404
+
+
+async def test_other_tenant_cannot_reach_attachments(client, ticket, other_admin_headers):
+    ticket_id, attachment_id = ticket["id"], ticket["attachment_id"]
+
+    response = await client.get(f"/api/v1/tickets/{ticket_id}/attachments", headers=other_admin_headers)
+    assert response.status_code == 404
+
+    response = await client.get(
+        f"/api/v1/tickets/{ticket_id}/attachments/{attachment_id}",
+        headers=other_admin_headers
+    )
+    assert response.status_code == 404
+
+    response = await client.post(
+        f"/api/v1/tickets/{ticket_id}/attachments?filename=more.png",
+        content=b"png",
+        headers={**other_admin_headers, "Content-Type": "image/png"}
+    )
+    assert response.status_code == 404
+
+
+async def test_public_requests_stay_in_their_tenant(
+    client, new_ticket, repair_request, other_tenant, other_admin_headers, admin_headers
+):
+    ticket_id = await new_ticket()
+
+    response = await client.post(
+        f"/api/v1/public/repair-requests/{ticket_id}/attachments?filename=photo.png",
+        content=b"png",
+        headers={"X-Tenant": "other", "Content-Type": "image/png"}
+    )
+    assert response.status_code == 404
+
+    # The same client and problem reported to the other tenant is not merged.
+    response = await client.post(
+        "/api/v1/public/repair-requests",
+        json=repair_request(),
+        headers={"X-Tenant": "other"}
+    )
+    assert response.status_code == 201
+    other_id = response.json()["id"]
+    assert other_id != ticket_id
+
+    response = await client.get("/api/v1/tickets/", headers=other_admin_headers)
+    assert [t["id"] for t in response.json()["items"]] == [other_id]
+    response = await client.get("/api/v1/tickets/", headers=admin_headers)
+    assert [t["id"] for t in response.json()["items"]] == [ticket_id]
+
+
+async def test_login_only_authenticates_within_the_tenant(client, admin_user, other_tenant):
+    form = {"username": admin_user.email, "password": "password123"}
+
+    response = await client.post("/api/v1/auth/login", data=form, headers={"X-Tenant": "other"})
+    assert response.status_code == 401
+
+    response = await client.post("/api/v1/auth/login", data=form)
+    assert response.status_code == 200